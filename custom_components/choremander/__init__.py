@@ -2,11 +2,19 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
 import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
 
@@ -14,21 +22,42 @@ from .const import (
     ATTR_CHILD_ID,
     ATTR_CHORE_ID,
     ATTR_CHORE_ORDER,
+    ATTR_END_DATE,
+    ATTR_ENTRY_ID,
+    ATTR_FILE_PATH,
+    ATTR_FILENAME,
+    ATTR_FORMAT,
+    ATTR_IDEMPOTENCY_KEY,
+    ATTR_INCLUDE_CLAIMS,
+    ATTR_INCLUDE_HISTORY,
+    ATTR_LIMIT,
     ATTR_POINTS,
     ATTR_REASON,
     ATTR_REWARD_ID,
+    ATTR_RULES,
+    ATTR_START_DATE,
     DOMAIN,
+    EXPORT_FORMATS,
     SERVICE_ADD_POINTS,
     SERVICE_APPROVE_CHORE,
     SERVICE_APPROVE_REWARD,
     SERVICE_CLAIM_REWARD,
     SERVICE_COMPLETE_CHORE,
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_GET_CHILD,
+    SERVICE_GET_HISTORY,
+    SERVICE_GET_PENDING,
+    SERVICE_IMPORT,
     SERVICE_REJECT_CHORE,
     SERVICE_REMOVE_POINTS,
+    SERVICE_SET_APPROVAL_RULES,
     SERVICE_SET_CHORE_ORDER,
+    SERVICE_UNDO_LAST_COMPLETION,
 )
 from .coordinator import ChoremanderCoordinator
 from .frontend import async_register_cards, async_register_frontend
+from .models import ApprovalRule
+from .rules import RULE_SCHEMA
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +66,18 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON, Platform.BINARY_S
 # Track if services are registered
 SERVICES_REGISTERED = "services_registered"
 
+# Global index of child/chore/reward/pending record ID -> config entry ID
+ID_INDEX = "id_index"
+
+# Service call fields that identify the entry a call targets, in lookup order
+ROUTING_FIELDS = (
+    ATTR_CHILD_ID,
+    ATTR_CHORE_ID,
+    ATTR_REWARD_ID,
+    "completion_id",
+    "claim_id",
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Choremander from a config entry."""
@@ -54,6 +95,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # Keep the service routing index in sync with this entry's records
+    id_index: dict[str, str] = hass.data[DOMAIN].setdefault(ID_INDEX, {})
+    indexed_ids: set[str] = set()
+
+    @callback
+    def _async_update_id_index() -> None:
+        """Index the IDs owned by this entry for service routing."""
+        current_ids = coordinator.get_routing_ids()
+        for stale_id in indexed_ids - current_ids:
+            if id_index.get(stale_id) == entry.entry_id:
+                del id_index[stale_id]
+        for record_id in current_ids:
+            id_index[record_id] = entry.entry_id
+        indexed_ids.clear()
+        indexed_ids.update(current_ids)
+
+    _async_update_id_index()
+    entry.async_on_unload(coordinator.async_add_listener(_async_update_id_index))
+    entry.async_on_unload(coordinator.async_schedule_approvals())
+
+    @callback
+    def _async_clear_id_index() -> None:
+        """Drop this entry's IDs from the routing index."""
+        for record_id in indexed_ids:
+            if id_index.get(record_id) == entry.entry_id:
+                del id_index[record_id]
+
+    entry.async_on_unload(_async_clear_id_index)
+
     # Register frontend static paths and Lovelace resources (only once)
     await async_register_frontend(hass)
     await async_register_cards(hass)
@@ -75,7 +145,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # If no more entries, unregister services
         remaining_entries = [
-            key for key in hass.data[DOMAIN].keys() if key != SERVICES_REGISTERED
+            value
+            for value in hass.data[DOMAIN].values()
+            if isinstance(value, ChoremanderCoordinator)
         ]
         if not remaining_entries:
             _async_unregister_services(hass)
@@ -84,89 +156,160 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
-def _get_coordinator(hass: HomeAssistant) -> ChoremanderCoordinator | None:
-    """Get the first available coordinator."""
-    for key, value in hass.data.get(DOMAIN, {}).items():
-        if key != SERVICES_REGISTERED and isinstance(value, ChoremanderCoordinator):
-            return value
+def _get_coordinator(
+    hass: HomeAssistant, call: ServiceCall
+) -> ChoremanderCoordinator | None:
+    """Get the coordinator a service call targets.
+
+    Uses the explicit entry_id when given, otherwise the entry that owns the
+    first child/chore/reward/completion/claim ID in the call (an O(1) index
+    lookup), otherwise the only loaded entry.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    if entry_id is None:
+        id_index = domain_data.get(ID_INDEX, {})
+        for key in ROUTING_FIELDS:
+            if (record_id := call.data.get(key)) and record_id in id_index:
+                entry_id = id_index[record_id]
+                break
+
+    if entry_id is not None:
+        coordinator = domain_data.get(entry_id)
+        return coordinator if isinstance(coordinator, ChoremanderCoordinator) else None
+
+    coordinators = [
+        value for value in domain_data.values() if isinstance(value, ChoremanderCoordinator)
+    ]
+    if len(coordinators) == 1:
+        return coordinators[0]
+    if coordinators:
+        _LOGGER.error(
+            "Multiple Choremander entries are loaded; specify entry_id for %s.%s",
+            call.domain,
+            call.service,
+        )
     return None
 
 
 async def _async_register_services(hass: HomeAssistant) -> None:
     """Register Choremander services."""
 
-    async def handle_complete_chore(call: ServiceCall) -> None:
+    async def handle_complete_chore(call: ServiceCall) -> ServiceResponse:
         """Handle the complete_chore service call."""
-        coordinator = _get_coordinator(hass)
+        coordinator = _get_coordinator(hass, call)
         if not coordinator:
             _LOGGER.error("No Choremander coordinator available")
-            return
+            return None
         chore_id = call.data[ATTR_CHORE_ID]
         child_id = call.data[ATTR_CHILD_ID]
-        await coordinator.async_complete_chore(chore_id, child_id)
-
-    async def handle_approve_chore(call: ServiceCall) -> None:
+        completion = await coordinator.async_complete_chore(
+            chore_id, child_id, call.data.get(ATTR_IDEMPOTENCY_KEY)
+        )
+        return {
+            "completion": completion.to_dict(),
+            "child": coordinator.get_child_summary(child_id),
+        }
+
+    async def handle_approve_chore(call: ServiceCall) -> ServiceResponse:
         """Handle the approve_chore service call."""
-        coordinator = _get_coordinator(hass)
+        coordinator = _get_coordinator(hass, call)
         if not coordinator:
             _LOGGER.error("No Choremander coordinator available")
-            return
+            return None
         completion_id = call.data["completion_id"]
-        await coordinator.async_approve_chore(completion_id)
-
-    async def handle_reject_chore(call: ServiceCall) -> None:
+        completion = await coordinator.async_approve_chore(completion_id)
+        if not completion:
+            return {"completion": None, "child": None}
+        return {
+            "completion": completion.to_dict(),
+            "child": coordinator.get_child_summary(completion.child_id),
+        }
+
+    async def handle_reject_chore(call: ServiceCall) -> ServiceResponse:
         """Handle the reject_chore service call."""
-        coordinator = _get_coordinator(hass)
+        coordinator = _get_coordinator(hass, call)
         if not coordinator:
             _LOGGER.error("No Choremander coordinator available")
-            return
+            return None
         completion_id = call.data["completion_id"]
-        await coordinator.async_reject_chore(completion_id)
-
-    async def handle_claim_reward(call: ServiceCall) -> None:
+        completion = await coordinator.async_reject_chore(completion_id)
+        if not completion:
+            return {"completion": None, "child": None}
+        return {
+            "completion": completion.to_dict(),
+            "child": coordinator.get_child_summary(completion.child_id),
+        }
+
+    async def handle_undo_last_completion(call: ServiceCall) -> ServiceResponse:
+        """Handle the undo_last_completion service call."""
+        coordinator = _get_coordinator(hass, call)
+        if not coordinator:
+            _LOGGER.error("No Choremander coordinator available")
+            return None
+        child_id = call.data[ATTR_CHILD_ID]
+        completion = await coordinator.async_undo_last_completion(
+            child_id, call.data.get(ATTR_CHORE_ID)
+        )
+        return {
+            "completion": completion.to_dict() if completion else None,
+            "child": coordinator.get_child_summary(child_id),
+        }
+
+    async def handle_claim_reward(call: ServiceCall) -> ServiceResponse:
         """Handle the claim_reward service call."""
-        coordinator = _get_coordinator(hass)
+        coordinator = _get_coordinator(hass, call)
         if not coordinator:
             _LOGGER.error("No Choremander coordinator available")
-            return
+            return None
         reward_id = call.data[ATTR_REWARD_ID]
         child_id = call.data[ATTR_CHILD_ID]
-        await coordinator.async_claim_reward(reward_id, child_id)
-
-    async def handle_approve_reward(call: ServiceCall) -> None:
+        claim = await coordinator.async_claim_reward(
+            reward_id, child_id, call.data.get(ATTR_IDEMPOTENCY_KEY)
+        )
+        return {
+            "claim": claim.to_dict(),
+            "child": coordinator.get_child_summary(child_id),
+        }
+
+    async def handle_approve_reward(call: ServiceCall) -> ServiceResponse:
         """Handle the approve_reward service call."""
-        coordinator = _get_coordinator(hass)
+        coordinator = _get_coordinator(hass, call)
         if not coordinator:
             _LOGGER.error("No Choremander coordinator available")
-            return
+            return None
         claim_id = call.data["claim_id"]
-        await coordinator.async_approve_reward(claim_id)
+        claim = await coordinator.async_approve_reward(claim_id)
+        return {"claim": claim.to_dict() if claim else None}
 
-    async def handle_add_points(call: ServiceCall) -> None:
+    async def handle_add_points(call: ServiceCall) -> ServiceResponse:
         """Handle the add_points service call."""
-        coordinator = _get_coordinator(hass)
+        coordinator = _get_coordinator(hass, call)
         if not coordinator:
             _LOGGER.error("No Choremander coordinator available")
-            return
+            return None
         child_id = call.data[ATTR_CHILD_ID]
         points = call.data[ATTR_POINTS]
         reason = call.data.get(ATTR_REASON, "")
-        await coordinator.async_add_points(child_id, points, reason)
+        applied = await coordinator.async_add_points(child_id, points, reason)
+        return {"points": applied, "child": coordinator.get_child_summary(child_id)}
 
-    async def handle_remove_points(call: ServiceCall) -> None:
+    async def handle_remove_points(call: ServiceCall) -> ServiceResponse:
         """Handle the remove_points service call."""
-        coordinator = _get_coordinator(hass)
+        coordinator = _get_coordinator(hass, call)
         if not coordinator:
             _LOGGER.error("No Choremander coordinator available")
-            return
+            return None
         child_id = call.data[ATTR_CHILD_ID]
         points = call.data[ATTR_POINTS]
         reason = call.data.get(ATTR_REASON, "")
-        await coordinator.async_remove_points(child_id, points, reason)
+        removed = await coordinator.async_remove_points(child_id, points, reason)
+        return {"points": removed, "child": coordinator.get_child_summary(child_id)}
 
     async def handle_set_chore_order(call: ServiceCall) -> None:
         """Handle the set_chore_order service call."""
-        coordinator = _get_coordinator(hass)
+        coordinator = _get_coordinator(hass, call)
         if not coordinator:
             _LOGGER.error("No Choremander coordinator available")
             return
@@ -174,6 +317,81 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         chore_order = call.data[ATTR_CHORE_ORDER]
         await coordinator.async_set_chore_order(child_id, chore_order)
 
+    async def handle_export_history(call: ServiceCall) -> ServiceResponse:
+        """Handle the export_history service call."""
+        coordinator = _get_coordinator(hass, call)
+        if not coordinator:
+            _LOGGER.error("No Choremander coordinator available")
+            return None
+        return await coordinator.async_export_history(
+            export_format=call.data[ATTR_FORMAT],
+            filename=call.data.get(ATTR_FILENAME),
+            child_id=call.data.get(ATTR_CHILD_ID),
+            chore_id=call.data.get(ATTR_CHORE_ID),
+            start_date=call.data.get(ATTR_START_DATE),
+            end_date=call.data.get(ATTR_END_DATE),
+            include_claims=call.data[ATTR_INCLUDE_CLAIMS],
+        )
+
+    async def handle_import(call: ServiceCall) -> ServiceResponse:
+        """Handle the import service call."""
+        coordinator = _get_coordinator(hass, call)
+        if not coordinator:
+            _LOGGER.error("No Choremander coordinator available")
+            return None
+        path = Path(hass.config.path(call.data[ATTR_FILE_PATH])).resolve()
+        config_dir = Path(hass.config.config_dir).resolve()
+        if not path.is_relative_to(config_dir) and not hass.config.is_allowed_path(str(path)):
+            raise HomeAssistantError(f"Import file {path} is outside the config directory")
+        try:
+            return await coordinator.async_import(path, call.data[ATTR_INCLUDE_HISTORY])
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+    async def handle_set_approval_rules(call: ServiceCall) -> ServiceResponse:
+        """Handle the set_approval_rules service call."""
+        coordinator = _get_coordinator(hass, call)
+        if not coordinator:
+            _LOGGER.error("No Choremander coordinator available")
+            return None
+        rules = [ApprovalRule.from_dict(rule) for rule in call.data[ATTR_RULES]]
+        try:
+            await coordinator.async_set_approval_rules(rules)
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        return {"rules": [rule.to_dict() for rule in rules]}
+
+    def _get_query_coordinator(call: ServiceCall) -> ChoremanderCoordinator:
+        """Get the coordinator for a read-only query, raising if unavailable."""
+        coordinator = _get_coordinator(hass, call)
+        if not coordinator:
+            raise HomeAssistantError("No Choremander coordinator available")
+        return coordinator
+
+    async def handle_get_child(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_child service call."""
+        coordinator = _get_query_coordinator(call)
+        child = coordinator.get_child_summary(call.data[ATTR_CHILD_ID])
+        if child is None:
+            raise HomeAssistantError(f"Child {call.data[ATTR_CHILD_ID]} not found")
+        return {"child": child}
+
+    async def handle_get_pending(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_pending service call."""
+        coordinator = _get_query_coordinator(call)
+        return coordinator.get_pending(call.data.get(ATTR_CHILD_ID))
+
+    async def handle_get_history(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_history service call."""
+        coordinator = _get_query_coordinator(call)
+        return await coordinator.async_get_history(
+            child_id=call.data.get(ATTR_CHILD_ID),
+            chore_id=call.data.get(ATTR_CHORE_ID),
+            start_date=call.data.get(ATTR_START_DATE),
+            end_date=call.data.get(ATTR_END_DATE),
+            limit=call.data[ATTR_LIMIT],
+        )
+
     # Register all services
     hass.services.async_register(
         DOMAIN,
@@ -181,10 +399,13 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         handle_complete_chore,
         schema=vol.Schema(
             {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
                 vol.Required(ATTR_CHORE_ID): cv.string,
                 vol.Required(ATTR_CHILD_ID): cv.string,
+                vol.Optional(ATTR_IDEMPOTENCY_KEY): cv.string,
             }
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
@@ -193,9 +414,11 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         handle_approve_chore,
         schema=vol.Schema(
             {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
                 vol.Required("completion_id"): cv.string,
             }
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
@@ -204,9 +427,25 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         handle_reject_chore,
         schema=vol.Schema(
             {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
                 vol.Required("completion_id"): cv.string,
             }
         ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_UNDO_LAST_COMPLETION,
+        handle_undo_last_completion,
+        schema=vol.Schema(
+            {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
+                vol.Required(ATTR_CHILD_ID): cv.string,
+                vol.Optional(ATTR_CHORE_ID): cv.string,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
@@ -215,10 +454,13 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         handle_claim_reward,
         schema=vol.Schema(
             {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
                 vol.Required(ATTR_REWARD_ID): cv.string,
                 vol.Required(ATTR_CHILD_ID): cv.string,
+                vol.Optional(ATTR_IDEMPOTENCY_KEY): cv.string,
             }
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
@@ -227,9 +469,11 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         handle_approve_reward,
         schema=vol.Schema(
             {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
                 vol.Required("claim_id"): cv.string,
             }
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
@@ -238,11 +482,13 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         handle_add_points,
         schema=vol.Schema(
             {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
                 vol.Required(ATTR_CHILD_ID): cv.string,
                 vol.Required(ATTR_POINTS): cv.positive_int,
                 vol.Optional(ATTR_REASON, default=""): cv.string,
             }
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
@@ -251,11 +497,13 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         handle_remove_points,
         schema=vol.Schema(
             {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
                 vol.Required(ATTR_CHILD_ID): cv.string,
                 vol.Required(ATTR_POINTS): cv.positive_int,
                 vol.Optional(ATTR_REASON, default=""): cv.string,
             }
         ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
@@ -264,12 +512,104 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         handle_set_chore_order,
         schema=vol.Schema(
             {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
                 vol.Required(ATTR_CHILD_ID): cv.string,
                 vol.Required(ATTR_CHORE_ORDER): vol.All(cv.ensure_list, [cv.string]),
             }
         ),
     )
 
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        handle_export_history,
+        schema=vol.Schema(
+            {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
+                vol.Optional(ATTR_FORMAT, default="csv"): vol.In(EXPORT_FORMATS),
+                vol.Optional(ATTR_FILENAME): cv.string,
+                vol.Optional(ATTR_CHILD_ID): cv.string,
+                vol.Optional(ATTR_CHORE_ID): cv.string,
+                vol.Optional(ATTR_START_DATE): cv.date,
+                vol.Optional(ATTR_END_DATE): cv.date,
+                vol.Optional(ATTR_INCLUDE_CLAIMS, default=True): cv.boolean,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT,
+        handle_import,
+        schema=vol.Schema(
+            {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
+                vol.Required(ATTR_FILE_PATH): cv.string,
+                vol.Optional(ATTR_INCLUDE_HISTORY, default=True): cv.boolean,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_APPROVAL_RULES,
+        handle_set_approval_rules,
+        schema=vol.Schema(
+            {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
+                vol.Required(ATTR_RULES): vol.All(cv.ensure_list, [RULE_SCHEMA]),
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CHILD,
+        handle_get_child,
+        schema=vol.Schema(
+            {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
+                vol.Required(ATTR_CHILD_ID): cv.string,
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_PENDING,
+        handle_get_pending,
+        schema=vol.Schema(
+            {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
+                vol.Optional(ATTR_CHILD_ID): cv.string,
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        handle_get_history,
+        schema=vol.Schema(
+            {
+                vol.Optional(ATTR_ENTRY_ID): cv.string,
+                vol.Optional(ATTR_CHILD_ID): cv.string,
+                vol.Optional(ATTR_CHORE_ID): cv.string,
+                vol.Optional(ATTR_START_DATE): cv.date,
+                vol.Optional(ATTR_END_DATE): cv.date,
+                vol.Optional(ATTR_LIMIT, default=100): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=1000)
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
 
 def _async_unregister_services(hass: HomeAssistant) -> None:
     """Unregister Choremander services."""
@@ -277,11 +617,18 @@ def _async_unregister_services(hass: HomeAssistant) -> None:
         SERVICE_COMPLETE_CHORE,
         SERVICE_APPROVE_CHORE,
         SERVICE_REJECT_CHORE,
+        SERVICE_UNDO_LAST_COMPLETION,
         SERVICE_CLAIM_REWARD,
         SERVICE_APPROVE_REWARD,
         SERVICE_ADD_POINTS,
         SERVICE_REMOVE_POINTS,
         SERVICE_SET_CHORE_ORDER,
+        SERVICE_EXPORT_HISTORY,
+        SERVICE_IMPORT,
+        SERVICE_SET_APPROVAL_RULES,
+        SERVICE_GET_CHILD,
+        SERVICE_GET_PENDING,
+        SERVICE_GET_HISTORY,
     ]
     for service in services:
         hass.services.async_remove(DOMAIN, service)
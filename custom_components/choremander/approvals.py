@@ -0,0 +1,122 @@
+"""Approval queue for Choremander integration."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from .models import ChoreCompletion, RewardClaim
+
+APPROVAL_KIND_CHORE = "chore"
+APPROVAL_KIND_REWARD = "reward"
+
+
+@dataclass(frozen=True)
+class PendingApproval:
+    """A chore completion or reward claim waiting for a parent."""
+
+    kind: str
+    id: str
+    child_id: str
+    created_at: datetime
+
+
+class ApprovalQueue:
+    """Pending chore completions and reward claims, oldest first.
+
+    Items are kept sorted by creation time and indexed by ID and by child,
+    so listing a child's items or finding items older than a cutoff never
+    filters the full completion history or claim list.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._items: dict[str, PendingApproval] = {}
+        self._order: list[tuple[datetime, str]] = []
+        self._by_child: dict[str, set[str]] = {}
+
+    @classmethod
+    def from_records(
+        cls, completions: Iterable[ChoreCompletion], claims: Iterable[RewardClaim]
+    ) -> ApprovalQueue:
+        """Build a queue from pending completions and reward claims."""
+        queue = cls()
+        for completion in completions:
+            queue.add_completion(completion)
+        for claim in claims:
+            queue.add_claim(claim)
+        return queue
+
+    def __len__(self) -> int:
+        """Return the number of pending items."""
+        return len(self._items)
+
+    def __contains__(self, item_id: object) -> bool:
+        """Return True if an item is pending."""
+        return item_id in self._items
+
+    def add_completion(self, completion: ChoreCompletion) -> None:
+        """Queue a chore completion for approval."""
+        self._add(
+            PendingApproval(
+                APPROVAL_KIND_CHORE,
+                completion.id,
+                completion.child_id,
+                completion.completed_at,
+            )
+        )
+
+    def add_claim(self, claim: RewardClaim) -> None:
+        """Queue a reward claim for approval."""
+        self._add(
+            PendingApproval(
+                APPROVAL_KIND_REWARD, claim.id, claim.child_id, claim.claimed_at
+            )
+        )
+
+    def _add(self, item: PendingApproval) -> None:
+        """Insert an item in time order."""
+        if item.id in self._items:
+            self.remove(item.id)
+        self._items[item.id] = item
+        insort(self._order, (item.created_at, item.id))
+        self._by_child.setdefault(item.child_id, set()).add(item.id)
+
+    def remove(self, item_id: str) -> PendingApproval | None:
+        """Remove an item, returning it if it was pending."""
+        item = self._items.pop(item_id, None)
+        if item is None:
+            return None
+        position = bisect_left(self._order, (item.created_at, item.id))
+        del self._order[position]
+        child_items = self._by_child[item.child_id]
+        child_items.discard(item.id)
+        if not child_items:
+            del self._by_child[item.child_id]
+        return item
+
+    def items(
+        self, kind: str | None = None, child_id: str | None = None
+    ) -> list[PendingApproval]:
+        """Return pending items oldest first, optionally of one kind or child."""
+        if child_id is not None:
+            ids = self._by_child.get(child_id, ())
+            items = sorted(
+                (self._items[item_id] for item_id in ids),
+                key=lambda item: (item.created_at, item.id),
+            )
+        else:
+            items = [self._items[item_id] for _, item_id in self._order]
+        if kind is not None:
+            items = [item for item in items if item.kind == kind]
+        return items
+
+    def ids(self, kind: str | None = None, child_id: str | None = None) -> list[str]:
+        """Return the IDs of pending items oldest first."""
+        return [item.id for item in self.items(kind, child_id)]
+
+    def older_than(self, cutoff: datetime) -> list[PendingApproval]:
+        """Return items created before ``cutoff``, oldest first."""
+        end = bisect_right(self._order, (cutoff, ""))
+        return [self._items[item_id] for _, item_id in self._order[:end]]
@@ -0,0 +1,300 @@
+"""Compressed completion archive for Choremander integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+import gzip
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from .models import format_datetime, parse_datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+ARCHIVE_INDEX = "index.json"
+ARCHIVE_SUFFIX = ".jsonl.gz"
+# Month data files are named YYYY-MM; other files share the directory
+ARCHIVE_MONTH_GLOB = f"[0-9][0-9][0-9][0-9]-[0-9][0-9]{ARCHIVE_SUFFIX}"
+LEDGER_ARCHIVE = f"ledger{ARCHIVE_SUFFIX}"
+
+
+def _epoch(value: str | datetime | None) -> int | None:
+    """Convert a stored datetime value to epoch seconds."""
+    parsed = parse_datetime(value)
+    return int(parsed.timestamp()) if parsed is not None else None
+
+
+def _iso(value: int | None) -> str | None:
+    """Convert epoch seconds back to the stored ISO format."""
+    if value is None:
+        return None
+    return format_datetime(datetime.fromtimestamp(value, timezone.utc))
+
+
+def _month_key(epoch: int) -> str:
+    """Return the YYYY-MM bucket (UTC) for an epoch timestamp."""
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m")
+
+
+def _pack(record: dict[str, Any]) -> list[Any]:
+    """Pack a completion dict into a compact positional row."""
+    return [
+        record.get("id"),
+        record.get("child_id", ""),
+        record.get("chore_id", ""),
+        _epoch(record.get("completed_at")),
+        _epoch(record.get("approved_at")),
+        record.get("points_awarded", 0),
+    ]
+
+
+def _unpack(row: list[Any]) -> dict[str, Any]:
+    """Unpack a positional row into the stored completion dict format."""
+    completion_id, child_id, chore_id, completed_at, approved_at, points = row
+    return {
+        "chore_id": chore_id,
+        "child_id": child_id,
+        "completed_at": _iso(completed_at),
+        "approved": True,
+        "approved_at": _iso(approved_at),
+        "points_awarded": points,
+        "id": completion_id,
+    }
+
+
+class CompletionArchive:
+    """Append-only archive of approved completions.
+
+    Records are stored as gzip'd JSON lines, one file per UTC month, each line
+    a compact positional row. A small JSON index records the row count and
+    timestamp bounds of every month so readers only open the files that
+    overlap the requested range.
+
+    All methods without an ``async_`` prefix do blocking I/O and must be run
+    in the executor. ``iter_records`` is a generator so that exports and
+    statistics can stream years of history without loading it into memory.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str | Path) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self.path = Path(path)
+        self._index: dict[str, dict[str, int]] | None = None
+        self._lock = threading.Lock()
+
+    # Index handling
+    def _index_path(self) -> Path:
+        """Return the index file path."""
+        return self.path / ARCHIVE_INDEX
+
+    def _month_path(self, month: str) -> Path:
+        """Return the data file path for a month."""
+        return self.path / f"{month}{ARCHIVE_SUFFIX}"
+
+    def _load_index(self) -> dict[str, dict[str, int]]:
+        """Load the month index from disk (blocking)."""
+        if self._index is None:
+            try:
+                self._index = json_loads(self._index_path().read_bytes())["months"]
+            except FileNotFoundError:
+                self._index = {}
+            except (ValueError, KeyError) as err:
+                _LOGGER.warning("Rebuilding corrupt archive index at %s: %s", self.path, err)
+                self._index = self._rebuild_index()
+        return self._index
+
+    def _rebuild_index(self) -> dict[str, dict[str, int]]:
+        """Rebuild the month index by scanning every data file (blocking)."""
+        index: dict[str, dict[str, int]] = {}
+        for month_file in sorted(self.path.glob(ARCHIVE_MONTH_GLOB)):
+            month = month_file.name[: -len(ARCHIVE_SUFFIX)]
+            entry = {"count": 0, "first": 0, "last": 0}
+            with gzip.open(month_file, "rb") as handle:
+                for line in handle:
+                    completed_at = json_loads(line)[3]
+                    if not entry["count"] or completed_at < entry["first"]:
+                        entry["first"] = completed_at
+                    entry["last"] = max(entry["last"], completed_at)
+                    entry["count"] += 1
+            index[month] = entry
+        return index
+
+    def _write_index(self) -> None:
+        """Atomically persist the month index (blocking)."""
+        tmp_path = self._index_path().with_suffix(".tmp")
+        tmp_path.write_bytes(json_bytes({"version": 1, "months": self._index}))
+        os.replace(tmp_path, self._index_path())
+
+    def _month_ids(self, month: str) -> set[str]:
+        """Return the completion IDs already archived for a month (blocking)."""
+        try:
+            with gzip.open(self._month_path(month), "rb") as handle:
+                return {json_loads(line)[0] for line in handle}
+        except FileNotFoundError:
+            return set()
+
+    # Writing
+    def write_records(self, records: Iterable[dict[str, Any]]) -> int:
+        """Append completion dicts to the archive (blocking).
+
+        Records whose ID is already in their month's file are skipped, so
+        re-archiving rows after an interrupted run never duplicates them.
+
+        Returns the number of records written.
+        """
+        by_month: dict[str, list[list[Any]]] = {}
+        for record in records:
+            row = _pack(record)
+            if row[3] is None:
+                continue
+            by_month.setdefault(_month_key(row[3]), []).append(row)
+
+        if not by_month:
+            return 0
+
+        written = 0
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            index = self._load_index()
+            for month, rows in sorted(by_month.items()):
+                if month in index:
+                    archived_ids = self._month_ids(month)
+                    rows = [row for row in rows if row[0] not in archived_ids]
+                    if not rows:
+                        continue
+
+                # Appending creates a new gzip member; readers see one stream
+                with gzip.open(self._month_path(month), "ab") as handle:
+                    handle.writelines(json_bytes(row) + b"\n" for row in rows)
+
+                entry = index.setdefault(month, {"count": 0, "first": 0, "last": 0})
+                first = min(row[3] for row in rows)
+                if not entry["count"] or first < entry["first"]:
+                    entry["first"] = first
+                entry["last"] = max(entry["last"], max(row[3] for row in rows))
+                entry["count"] += len(rows)
+                written += len(rows)
+            self._write_index()
+        return written
+
+    async def async_write_records(self, records: list[dict[str, Any]]) -> int:
+        """Append completion dicts to the archive from the executor."""
+        return await self.hass.async_add_executor_job(self.write_records, records)
+
+    # Reading
+    def months(self) -> list[str]:
+        """Return the archived months in chronological order (blocking)."""
+        return sorted(self._load_index())
+
+    def count(self) -> int:
+        """Return the total number of archived records (blocking)."""
+        return sum(entry["count"] for entry in self._load_index().values())
+
+    def iter_records(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield archived completion dicts completed in [start, end) (blocking).
+
+        Only month files whose bounds overlap the range are opened, and rows
+        are decoded one line at a time.
+        """
+        low = int(start.timestamp()) if start is not None else None
+        high = int(end.timestamp()) if end is not None else None
+
+        for month, entry in sorted(self._load_index().items()):
+            if low is not None and entry["last"] < low:
+                continue
+            if high is not None and entry["first"] >= high:
+                continue
+            # Rows in a month that lies fully inside the range need no check
+            bounded = (low is not None and entry["first"] < low) or (
+                high is not None and entry["last"] >= high
+            )
+            try:
+                with gzip.open(self._month_path(month), "rb") as handle:
+                    for line in handle:
+                        row = json_loads(line)
+                        if bounded and (
+                            (low is not None and row[3] < low)
+                            or (high is not None and row[3] >= high)
+                        ):
+                            continue
+                        yield _unpack(row)
+            except FileNotFoundError:
+                _LOGGER.warning("Archive month %s listed in index but missing", month)
+
+
+class LedgerArchive:
+    """Append-only archive of settled points ledger entries.
+
+    Entries covered by a balance snapshot are no longer needed to compute
+    balances, so they move here from the hot store as gzip'd JSON lines in
+    ledger order. Each entry's absolute ledger position is its line number,
+    which lets an interrupted compaction be re-run without duplicating rows.
+
+    Methods without an ``async_`` prefix do blocking I/O and must be run in
+    the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str | Path) -> None:
+        """Initialize the ledger archive in the completion archive directory."""
+        self.hass = hass
+        self.path = Path(path)
+        self._count: int | None = None
+        self._lock = threading.Lock()
+
+    def _file_path(self) -> Path:
+        """Return the ledger data file path."""
+        return self.path / LEDGER_ARCHIVE
+
+    def count(self) -> int:
+        """Return the number of archived entries, counting lines once (blocking)."""
+        if self._count is None:
+            try:
+                with gzip.open(self._file_path(), "rb") as handle:
+                    self._count = sum(1 for _ in handle)
+            except FileNotFoundError:
+                self._count = 0
+        return self._count
+
+    def write_entries(self, position: int, entries: list[dict[str, Any]]) -> int:
+        """Append entries starting at an absolute ledger position (blocking).
+
+        Entries before the archive's current length are already archived and
+        are skipped. Returns the number of entries written.
+        """
+        with self._lock:
+            entries = entries[max(0, self.count() - position) :]
+            if not entries:
+                return 0
+            self.path.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self._file_path(), "ab") as handle:
+                handle.writelines(json_bytes(entry) + b"\n" for entry in entries)
+            self._count += len(entries)
+        return len(entries)
+
+    async def async_write_entries(self, position: int, entries: list[dict[str, Any]]) -> int:
+        """Append entries from the executor."""
+        return await self.hass.async_add_executor_job(self.write_entries, position, entries)
+
+    def iter_entries_newest_first(self) -> Iterator[dict[str, Any]]:
+        """Yield archived entries, newest first (blocking).
+
+        gzip streams can only be read forwards, so the file is decoded in one
+        pass before yielding.
+        """
+        try:
+            with gzip.open(self._file_path(), "rb") as handle:
+                entries = [json_loads(line) for line in handle]
+        except FileNotFoundError:
+            return
+        yield from reversed(entries)
@@ -10,12 +10,16 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
+from homeassistant.util import slugify
 
 from .const import (
     AVATAR_OPTIONS,
     COMPLETION_SOUND_OPTIONS,
     DAYS_OF_WEEK,
+    DEFAULT_APPROVAL_EXPIRY_DAYS,
+    DEFAULT_AUTO_APPROVE_HOURS,
     DEFAULT_COMPLETION_SOUND,
+    DEFAULT_INSTANCE_NAME,
     DEFAULT_POINTS_ICON,
     DEFAULT_POINTS_NAME,
     DOMAIN,
@@ -39,12 +43,14 @@ class ChoremanderConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Check if already configured
-            await self.async_set_unique_id(DOMAIN)
+            # Each household is its own entry; the default name keeps the
+            # original single-instance unique ID
+            name = user_input.get("name", "").strip() or DEFAULT_INSTANCE_NAME
+            await self.async_set_unique_id(slugify(name))
             self._abort_if_unique_id_configured()
 
             return self.async_create_entry(
-                title="Choremander",
+                title=name,
                 data={
                     "points_name": user_input.get("points_name", DEFAULT_POINTS_NAME),
                     "points_icon": user_input.get("points_icon", DEFAULT_POINTS_ICON),
@@ -55,6 +61,7 @@ class ChoremanderConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user",
             data_schema=vol.Schema(
                 {
+                    vol.Optional("name", default=DEFAULT_INSTANCE_NAME): str,
                     vol.Optional("points_name", default=DEFAULT_POINTS_NAME): str,
                     vol.Optional("points_icon", default=DEFAULT_POINTS_ICON): selector.IconSelector(),
                 }
@@ -714,6 +721,14 @@ class ChoremanderOptionsFlow(config_entries.OptionsFlow):
                 name=user_input.get("points_name", DEFAULT_POINTS_NAME),
                 icon=user_input.get("points_icon", DEFAULT_POINTS_ICON),
             )
+            await self.coordinator.async_set_approval_settings(
+                auto_approve_hours=int(user_input.get(
+                    "auto_approve_hours", DEFAULT_AUTO_APPROVE_HOURS
+                )),
+                expiry_days=int(user_input.get(
+                    "approval_expiry_days", DEFAULT_APPROVAL_EXPIRY_DAYS
+                )),
+            )
             return await self.async_step_init()
 
         return self.async_show_form(
@@ -728,6 +743,18 @@ class ChoremanderOptionsFlow(config_entries.OptionsFlow):
                         "points_icon",
                         default=self.coordinator.storage.get_points_icon(),
                     ): selector.IconSelector(),
+                    vol.Required(
+                        "auto_approve_hours",
+                        default=self.coordinator.storage.get_auto_approve_hours(),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=0, max=168, mode=selector.NumberSelectorMode.BOX)
+                    ),
+                    vol.Required(
+                        "approval_expiry_days",
+                        default=self.coordinator.storage.get_approval_expiry_days(),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=0, max=365, mode=selector.NumberSelectorMode.BOX)
+                    ),
                 }
             ),
         )
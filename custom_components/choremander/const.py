@@ -33,9 +33,35 @@ CONF_REWARD_ICON: Final = "icon"
 CONF_REWARD_ID: Final = "id"
 
 # Default values
+DEFAULT_INSTANCE_NAME: Final = "Choremander"
 DEFAULT_POINTS_NAME: Final = "Stars"
 DEFAULT_POINTS_ICON: Final = "mdi:star"
 
+# Approved completions older than this are moved to the compressed archive
+ARCHIVE_AFTER_DAYS: Final = 90
+
+# How long, in seconds, a repeated idempotency key replays the original result
+IDEMPOTENCY_KEY_TTL: Final = 300
+# Maximum number of idempotency keys remembered at once
+IDEMPOTENCY_MAX_KEYS: Final = 256
+
+# Number of recent completions per child that can be undone
+RECENT_ACTIVITY_LIMIT: Final = 20
+
+# How often, in minutes, the approval queue is checked for auto-approval and expiry
+APPROVAL_CHECK_INTERVAL_MINUTES: Final = 5
+# Default hours before a pending item is auto-approved (0 = never)
+DEFAULT_AUTO_APPROVE_HOURS: Final = 0
+# Default days before a pending item expires and is rejected (0 = never)
+DEFAULT_APPROVAL_EXPIRY_DAYS: Final = 0
+
+# Version of the reward pricing formula recorded on each reward claim
+PRICING_VERSION: Final = 1
+
+# Directory (relative to the HA config directory) for history exports
+EXPORT_DIRECTORY: Final = "choremander_exports"
+EXPORT_FORMATS: Final = ["csv", "jsonl"]
+
 # Days of week
 DAYS_OF_WEEK: Final = [
     "monday",
@@ -174,11 +200,27 @@ SERVICE_REMOVE_POINTS: Final = "remove_points"
 SERVICE_RESET_DAILY: Final = "reset_daily"
 SERVICE_SET_CHORE_ORDER: Final = "set_chore_order"
 SERVICE_PREVIEW_SOUND: Final = "preview_sound"
+SERVICE_EXPORT_HISTORY: Final = "export_history"
+SERVICE_IMPORT: Final = "import"
+SERVICE_GET_CHILD: Final = "get_child"
+SERVICE_GET_PENDING: Final = "get_pending"
+SERVICE_GET_HISTORY: Final = "get_history"
+SERVICE_UNDO_LAST_COMPLETION: Final = "undo_last_completion"
+SERVICE_SET_APPROVAL_RULES: Final = "set_approval_rules"
 
 # Events
 EVENT_PREVIEW_SOUND: Final = "choremander_preview_sound"
+EVENT_CHORE_COMPLETED: Final = "choremander_chore_completed"
+EVENT_CHORE_APPROVED: Final = "choremander_chore_approved"
+EVENT_CHORE_REJECTED: Final = "choremander_chore_rejected"
+EVENT_CHORE_UNDONE: Final = "choremander_chore_undone"
+EVENT_REWARD_CLAIMED: Final = "choremander_reward_claimed"
+EVENT_REWARD_APPROVED: Final = "choremander_reward_approved"
+EVENT_REWARD_REJECTED: Final = "choremander_reward_rejected"
+EVENT_POINTS_CHANGED: Final = "choremander_points_changed"
 
 # Attributes
+ATTR_ENTRY_ID: Final = "entry_id"
 ATTR_CHILD_ID: Final = "child_id"
 ATTR_CHORE_ID: Final = "chore_id"
 ATTR_REWARD_ID: Final = "reward_id"
@@ -186,6 +228,16 @@ ATTR_POINTS: Final = "points"
 ATTR_REASON: Final = "reason"
 ATTR_CHORE_ORDER: Final = "chore_order"
 ATTR_SOUND: Final = "sound"
+ATTR_FORMAT: Final = "format"
+ATTR_FILENAME: Final = "filename"
+ATTR_START_DATE: Final = "start_date"
+ATTR_END_DATE: Final = "end_date"
+ATTR_INCLUDE_CLAIMS: Final = "include_claims"
+ATTR_FILE_PATH: Final = "file_path"
+ATTR_INCLUDE_HISTORY: Final = "include_history"
+ATTR_LIMIT: Final = "limit"
+ATTR_IDEMPOTENCY_KEY: Final = "idempotency_key"
+ATTR_RULES: Final = "rules"
 
 # States
 STATE_PENDING: Final = "pending"
@@ -1,20 +1,77 @@
 """Data coordinator for Choremander integration."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from functools import partial
+import itertools
 import logging
-from typing import Any
+from pathlib import Path
+import time
+from typing import Any, TypeVar
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
-from .models import Child, Chore, ChoreCompletion, Reward, RewardClaim
+from .approvals import APPROVAL_KIND_CHORE, APPROVAL_KIND_REWARD, ApprovalQueue
+from .const import (
+    APPROVAL_CHECK_INTERVAL_MINUTES,
+    ARCHIVE_AFTER_DAYS,
+    DOMAIN,
+    EVENT_CHORE_APPROVED,
+    EVENT_CHORE_COMPLETED,
+    EVENT_CHORE_REJECTED,
+    EVENT_CHORE_UNDONE,
+    EVENT_POINTS_CHANGED,
+    EVENT_REWARD_APPROVED,
+    EVENT_REWARD_CLAIMED,
+    EVENT_REWARD_REJECTED,
+    EXPORT_DIRECTORY,
+    IDEMPOTENCY_KEY_TTL,
+    IDEMPOTENCY_MAX_KEYS,
+    PRICING_VERSION,
+    RECENT_ACTIVITY_LIMIT,
+)
+from .export import claim_rows, completion_rows, write_export
+from .importer import load_import_plan
+from .models import (
+    ApprovalRule,
+    Child,
+    Chore,
+    ChoreCompletion,
+    PointsTransaction,
+    Reward,
+    RewardClaim,
+    parse_datetime,
+)
+from .pricing import calculate_child_daily_points, calculate_reward_costs
+from .rules import AutoApprovalRules
 from .storage import ChoremanderStorage
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class ChildView:
+    """A child's slice of the coordinator snapshot.
+
+    ``version`` only changes when something in the view changes, so child
+    entities can skip state writes on refreshes that did not affect them.
+    """
+
+    child: Child
+    assigned_chores: tuple[Chore, ...]
+    points_name: str
+    points_icon: str
+    version: int = 0
+
 
 class ChoremanderCoordinator(DataUpdateCoordinator):
     """Coordinator to manage Choremander data."""
@@ -29,26 +86,142 @@ class ChoremanderCoordinator(DataUpdateCoordinator):
         )
         self.storage = ChoremanderStorage(hass, entry_id)
         self.entry_id = entry_id
+        # Idempotency key -> (time first seen, future holding the result)
+        self._idempotency_results: OrderedDict[
+            str, tuple[float, asyncio.Future[Any]]
+        ] = OrderedDict()
+        self.approvals = ApprovalQueue()
+        self.approval_rules = AutoApprovalRules(hass)
+        # Child ID -> IDs of that child's most recent completions, newest last
+        self._recent_completions: dict[str, deque[str]] = {}
+        self._child_views: dict[str, ChildView] = {}
 
     async def async_initialize(self) -> None:
         """Initialize the coordinator."""
         await self.storage.async_load()
+        await self.storage.async_archive_completions(
+            dt_util.start_of_local_day() - timedelta(days=ARCHIVE_AFTER_DAYS)
+        )
+        history = self.storage.history
+        for completion in history.completions(
+            history.by_date_range(dt_util.start_of_local_day())
+        ):
+            self._push_recent_completion(completion)
+        self._rebuild_approvals()
+        try:
+            await self.approval_rules.async_set_rules(self.storage.get_approval_rules())
+        except ValueError as err:
+            _LOGGER.error("Auto-approval rules disabled: %s", err)
         await self.async_refresh()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from storage."""
+        history = self.storage.history
+        reward_claims = self.storage.get_reward_claims()
+        claims_by_id = {claim.id: claim for claim in reward_claims}
+        pending_completions = [
+            completion
+            for completion_id in self.approvals.ids(APPROVAL_KIND_CHORE)
+            if (completion := history.get(completion_id))
+        ]
+        children = self.storage.get_children()
+        chores = self.storage.get_chores()
+        self._child_views = self._build_child_views(children, chores)
         return {
-            "children": self.storage.get_children(),
-            "chores": self.storage.get_chores(),
+            "children": children,
+            "child_views": self._child_views,
+            "chores": chores,
             "rewards": self.storage.get_rewards(),
-            "completions": self.storage.get_completions(),
-            "pending_completions": self.storage.get_pending_completions(),
-            "reward_claims": self.storage.get_reward_claims(),
-            "pending_reward_claims": self.storage.get_pending_reward_claims(),
+            "todays_completions": history.completions(
+                history.by_date_range(dt_util.start_of_local_day())
+            ),
+            "total_completions": self.storage.total_completions,
+            "pending_completions": pending_completions,
+            "reward_claims": reward_claims,
+            "pending_reward_claims": [
+                claims_by_id[claim_id]
+                for claim_id in self.approvals.ids(APPROVAL_KIND_REWARD)
+                if claim_id in claims_by_id
+            ],
             "points_name": self.storage.get_points_name(),
             "points_icon": self.storage.get_points_icon(),
         }
 
+    def _build_child_views(
+        self, children: list[Child], chores: list[Chore]
+    ) -> dict[str, ChildView]:
+        """Build each child's view, bumping its version only if it changed."""
+        points_name = self.storage.get_points_name()
+        points_icon = self.storage.get_points_icon()
+        views = {}
+        for child in children:
+            view = ChildView(
+                child=child,
+                assigned_chores=tuple(
+                    chore
+                    for chore in chores
+                    if child.id in chore.assigned_to or not chore.assigned_to
+                ),
+                points_name=points_name,
+                points_icon=points_icon,
+            )
+            previous = self._child_views.get(child.id)
+            if previous is None:
+                views[child.id] = view
+            elif replace(view, version=previous.version) == previous:
+                views[child.id] = previous
+            else:
+                views[child.id] = replace(view, version=previous.version + 1)
+        return views
+
+    def get_routing_ids(self) -> set[str]:
+        """Get the IDs service calls can use to target this entry."""
+        data = self.data or {}
+        return {
+            record.id
+            for key in (
+                "children",
+                "chores",
+                "rewards",
+                "pending_completions",
+                "todays_completions",
+                "pending_reward_claims",
+            )
+            for record in data.get(key, [])
+        }
+
+    def _fire_event(self, event_type: str, data: dict[str, Any]) -> None:
+        """Fire a Choremander event tagged with this entry."""
+        self.hass.bus.async_fire(event_type, {"entry_id": self.entry_id, **data})
+
+    def _fire_completion_event(
+        self, event_type: str, completion: ChoreCompletion
+    ) -> None:
+        """Fire an event about a chore completion."""
+        self._fire_event(
+            event_type,
+            {
+                "completion_id": completion.id,
+                "chore_id": completion.chore_id,
+                "child_id": completion.child_id,
+                "approved": completion.approved,
+                "points": completion.points_awarded,
+            },
+        )
+
+    def _fire_claim_event(self, event_type: str, claim: RewardClaim) -> None:
+        """Fire an event about a reward claim."""
+        self._fire_event(
+            event_type,
+            {
+                "claim_id": claim.id,
+                "reward_id": claim.reward_id,
+                "child_id": claim.child_id,
+                "approved": claim.approved,
+                "cost": claim.cost,
+            },
+        )
+
     # Child operations
     async def async_add_child(self, name: str, avatar: str = "mdi:account-circle") -> Child:
         """Add a new child."""
@@ -166,161 +339,17 @@ class ChoremanderCoordinator(DataUpdateCoordinator):
     def calculate_dynamic_reward_costs(self, reward: Reward) -> dict[str, int]:
         """Calculate the dynamic cost of a reward for each child.
 
-        By default, all rewards use dynamic pricing. If override_point_value is True,
-        the manual cost is used instead.
-
-        For non-jackpot rewards, each child has their own calculated cost based on
-        their specific chores and completion rates.
-
-        For jackpot rewards, all children share the same cost (sum of all daily points).
-
-        Returns:
-            Dict mapping child_id to their calculated cost for this reward.
-            For jackpot rewards, all children have the same value.
+        Returns a dict mapping child_id to their calculated cost for this reward.
         """
-        result: dict[str, int] = {}
-
-        # Get all children and chores
-        all_children = self.storage.get_children()
-        all_chores = self.storage.get_chores()
-
-        _LOGGER.warning(
-            "CALC_COSTS: reward=%s, override=%s, days_to_goal=%s, cost=%s, assigned_to=%s",
-            reward.name,
-            getattr(reward, 'override_point_value', False),
-            getattr(reward, 'days_to_goal', 30),
-            reward.cost,
-            reward.assigned_to
+        return calculate_reward_costs(
+            reward, self.storage.get_children(), self.storage.get_chores()
         )
-        _LOGGER.warning("CALC_COSTS: found %d children, %d chores", len(all_children), len(all_chores))
-
-        # Determine which children are assigned to this reward
-        if reward.assigned_to:
-            assigned_children = [c for c in all_children if c.id in reward.assigned_to]
-        else:
-            assigned_children = all_children
-
-        _LOGGER.debug("calculate_dynamic_reward_costs: assigned_children=%s", [c.name for c in assigned_children])
-
-        if not assigned_children:
-            _LOGGER.debug("calculate_dynamic_reward_costs: no assigned children, returning empty")
-            return result
-
-        # If override is enabled, use the manual cost for all children
-        if getattr(reward, 'override_point_value', False):
-            _LOGGER.debug("calculate_dynamic_reward_costs: override enabled, using manual cost %d", reward.cost)
-            for child in assigned_children:
-                result[child.id] = reward.cost
-            return result
-
-        # Get days_to_goal with a sensible default
-        days_to_goal = getattr(reward, 'days_to_goal', 30)
-        if days_to_goal <= 0:
-            days_to_goal = 30
-
-        if not all_chores:
-            # Fall back to static cost if no chores
-            _LOGGER.debug("calculate_dynamic_reward_costs: no chores, falling back to cost %d", reward.cost)
-            for child in assigned_children:
-                result[child.id] = reward.cost
-            return result
-
-        # Calculate daily expected points for each child
-        child_daily_points: dict[str, float] = {}
-
-        for child in assigned_children:
-            daily_points = 0.0
-            chores_counted = 0
-
-            for chore in all_chores:
-                # Check if this chore is assigned to this child
-                # Empty assigned_to means all children can do it
-                if chore.assigned_to and child.id not in chore.assigned_to:
-                    continue
-
-                chores_counted += 1
-                # Get the completion percentage per month (default to 100% if not set)
-                # completion_percentage_per_month: 100 = daily, 50 = every other day, etc.
-                completion_pct = chore.completion_percentage_per_month
-
-                # Calculate daily expected points for this chore
-                # Formula: points * (completion_percentage / 100)
-                daily_expected = chore.points * (completion_pct / 100)
-                daily_points += daily_expected
-
-            child_daily_points[child.id] = daily_points
-            _LOGGER.warning(
-                "CALC_COSTS: child=%s, chores_counted=%d, daily_points=%.2f",
-                child.name, chores_counted, daily_points
-            )
-
-        # Calculate costs based on whether this is a jackpot reward
-        if reward.is_jackpot:
-            # Jackpot: sum of ALL children's daily points, same cost for everyone
-            total_daily_points = sum(child_daily_points.values())
-            jackpot_cost = max(1, round(total_daily_points * days_to_goal))
-            _LOGGER.debug(
-                "calculate_dynamic_reward_costs: jackpot total_daily=%.2f, cost=%d",
-                total_daily_points, jackpot_cost
-            )
-            for child in assigned_children:
-                result[child.id] = jackpot_cost
-        else:
-            # Non-jackpot: each child has their own cost based on their chores
-            for child in assigned_children:
-                daily_pts = child_daily_points.get(child.id, 0)
-                if daily_pts > 0:
-                    calculated = max(1, round(daily_pts * days_to_goal))
-                    result[child.id] = calculated
-                    _LOGGER.debug(
-                        "calculate_dynamic_reward_costs: child=%s, daily=%.2f * days=%d = %d",
-                        child.name, daily_pts, days_to_goal, calculated
-                    )
-                else:
-                    result[child.id] = reward.cost  # Fall back to manual cost
-                    _LOGGER.debug(
-                        "calculate_dynamic_reward_costs: child=%s, no daily points, fallback to %d",
-                        child.name, reward.cost
-                    )
-
-        _LOGGER.warning("CALC_COSTS: final result for %s = %s", reward.name, result)
-        return result
 
     def get_child_daily_points(self, reward: Reward) -> dict[str, float]:
-        """Get the daily expected points for each child assigned to a reward.
-
-        This is used to calculate weighted contributions for jackpot rewards.
-        Returns a dict mapping child_id to their daily expected points.
-        """
-        result: dict[str, float] = {}
-
-        all_children = self.storage.get_children()
-        all_chores = self.storage.get_chores()
-
-        # Determine which children are assigned to this reward
-        if reward.assigned_to:
-            assigned_children = [c for c in all_children if c.id in reward.assigned_to]
-        else:
-            assigned_children = all_children
-
-        if not assigned_children or not all_chores:
-            return result
-
-        for child in assigned_children:
-            daily_points = 0.0
-
-            for chore in all_chores:
-                # Check if this chore is assigned to this child
-                if chore.assigned_to and child.id not in chore.assigned_to:
-                    continue
-
-                completion_pct = chore.completion_percentage_per_month
-                daily_expected = chore.points * (completion_pct / 100)
-                daily_points += daily_expected
-
-            result[child.id] = daily_points
-
-        return result
+        """Get the daily expected points for each child assigned to a reward."""
+        return calculate_child_daily_points(
+            reward, self.storage.get_children(), self.storage.get_chores()
+        )
 
     def calculate_dynamic_reward_cost(self, reward: Reward, child_id: str | None = None) -> int:
         """Calculate the dynamic cost of a reward.
@@ -381,8 +410,65 @@ class ChoremanderCoordinator(DataUpdateCoordinator):
         """Get a reward by ID."""
         return self.storage.get_reward(reward_id)
 
+    # Idempotency
+    async def _async_run_idempotent(
+        self, key: str | None, action: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run an action once per idempotency key, replaying its result for repeats.
+
+        Keys are remembered for IDEMPOTENCY_KEY_TTL seconds, up to
+        IDEMPOTENCY_MAX_KEYS at a time. A repeat that arrives while the first
+        call is still running waits for it. Failed calls are forgotten so they
+        can be retried with the same key.
+        """
+        if key is None:
+            return await action()
+
+        now = time.monotonic()
+        while self._idempotency_results:
+            first_seen, _ = next(iter(self._idempotency_results.values()))
+            if now - first_seen < IDEMPOTENCY_KEY_TTL:
+                break
+            self._idempotency_results.popitem(last=False)
+
+        if cached := self._idempotency_results.get(key):
+            _LOGGER.debug("Replaying result for idempotency key %s", key)
+            return await asyncio.shield(cached[1])
+
+        future: asyncio.Future[_T] = self.hass.loop.create_future()
+        self._idempotency_results[key] = (now, future)
+        if len(self._idempotency_results) > IDEMPOTENCY_MAX_KEYS:
+            self._idempotency_results.popitem(last=False)
+
+        try:
+            result = await action()
+        except BaseException as err:
+            self._idempotency_results.pop(key, None)
+            if isinstance(err, Exception):
+                future.set_exception(err)
+                # Mark retrieved so an unawaited failure is not logged twice
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        future.set_result(result)
+        return result
+
     # Chore completion operations
-    async def async_complete_chore(self, chore_id: str, child_id: str) -> ChoreCompletion:
+    async def async_complete_chore(
+        self, chore_id: str, child_id: str, idempotency_key: str | None = None
+    ) -> ChoreCompletion:
+        """Mark a chore as completed by a child.
+
+        Repeated calls with the same idempotency key return the original
+        completion instead of completing the chore again.
+        """
+        return await self._async_run_idempotent(
+            f"complete_chore:{idempotency_key}" if idempotency_key else None,
+            partial(self._async_complete_chore, chore_id, child_id),
+        )
+
+    async def _async_complete_chore(self, chore_id: str, child_id: str) -> ChoreCompletion:
         """Mark a chore as completed by a child."""
         chore = self.get_chore(chore_id)
         if not chore:
@@ -395,18 +481,15 @@ class ChoremanderCoordinator(DataUpdateCoordinator):
         # Check daily limit - count today's completions for this chore by this child
         # Both pending (unapproved) and approved completions count toward the limit
         now = dt_util.now()
-        today = now.date()
-        all_completions = self.storage.get_completions()
-        todays_completions_count = 0
-        for comp in all_completions:
-            if comp.chore_id == chore_id and comp.child_id == child_id:
-                # Convert to local timezone for date comparison
-                comp_dt = comp.completed_at
-                if hasattr(comp_dt, 'astimezone'):
-                    comp_dt = dt_util.as_local(comp_dt)
-                comp_date = comp_dt.date() if hasattr(comp_dt, 'date') else comp_dt
-                if comp_date == today:
-                    todays_completions_count += 1
+        history = self.storage.history
+        todays_completions_count = len(
+            history.by_chore(
+                chore_id,
+                history.by_child(
+                    child_id, history.by_date_range(dt_util.start_of_local_day(now))
+                ),
+            )
+        )
 
         daily_limit = getattr(chore, 'daily_limit', 1)
         if todays_completions_count >= daily_limit:
@@ -415,66 +498,168 @@ class ChoremanderCoordinator(DataUpdateCoordinator):
                 f"Already completed {todays_completions_count} time(s) today (limit: {daily_limit})"
             )
 
+        # Completions matching an auto-approval rule skip the pending queue
+        requires_approval = chore.requires_approval
+        if requires_approval and (rule := self.approval_rules.match(chore, child_id, now)):
+            _LOGGER.debug(
+                "Completion of '%s' auto-approved by rule %s",
+                chore.name,
+                rule.name or rule.id,
+            )
+            requires_approval = False
+
         completion = ChoreCompletion(
             chore_id=chore_id,
             child_id=child_id,
             completed_at=now,
-            approved=not chore.requires_approval,
-            points_awarded=chore.points if not chore.requires_approval else 0,
+            approved=not requires_approval,
+            points_awarded=chore.points if not requires_approval else 0,
         )
 
         # If no approval required, award points immediately
-        if not chore.requires_approval:
-            await self._award_points(child, chore.points)
+        if not requires_approval:
+            await self._award_points(child, chore.points, ref_id=completion.id)
             completion.approved = True
             completion.approved_at = dt_util.now()
             completion.points_awarded = chore.points
 
         self.storage.add_completion(completion)
+        self._push_recent_completion(completion)
+        if not completion.approved:
+            self.approvals.add_completion(completion)
+        self._fire_completion_event(EVENT_CHORE_COMPLETED, completion)
         await self.storage.async_save()
         await self.async_refresh()
         return completion
 
-    async def async_approve_chore(self, completion_id: str) -> None:
+    def _push_recent_completion(self, completion: ChoreCompletion) -> None:
+        """Remember a completion on its child's recent-activity stack."""
+        self._recent_completions.setdefault(
+            completion.child_id, deque(maxlen=RECENT_ACTIVITY_LIMIT)
+        ).append(completion.id)
+
+    async def async_undo_last_completion(
+        self, child_id: str, chore_id: str | None = None
+    ) -> ChoreCompletion | None:
+        """Undo a child's most recent completion today, optionally of one chore.
+
+        The completion is usually found on the child's recent-activity stack.
+        Completions the stack does not hold, such as imported ones or those
+        pushed out by RECENT_ACTIVITY_LIMIT newer ones, are found through
+        today's rows of the history. Any points awarded for the completion are
+        reversed along with the child's counters.
+        """
+        child = self.get_child(child_id)
+        if not child:
+            raise ValueError(f"Child {child_id} not found")
+
+        start_of_day = dt_util.start_of_local_day()
+        recent = self._recent_completions.get(child_id)
+        completion = None
+        for completion_id in reversed(recent or ()):
+            candidate = self.storage.get_completion(completion_id)
+            if candidate is None or candidate.completed_at < start_of_day:
+                continue
+            if chore_id and candidate.chore_id != chore_id:
+                continue
+            completion = candidate
+            break
+        if completion is None:
+            history = self.storage.history
+            rows = history.by_child(child_id, history.by_date_range(start_of_day))
+            if chore_id:
+                rows = history.by_chore(chore_id, rows)
+            if not rows:
+                return None
+            # Rows are in completion time order, so the last is the most recent
+            completion = history.completion_at(rows[-1])
+
+        if recent and completion.id in recent:
+            recent.remove(completion.id)
+        if completion.points_awarded > 0:
+            child.total_points_earned = max(
+                0, child.total_points_earned - completion.points_awarded
+            )
+            child.total_chores_completed = max(0, child.total_chores_completed - 1)
+            self._record_points(
+                child, -completion.points_awarded, "reversal", ref_id=completion.id
+            )
+
+        self.storage.remove_completion(completion.id)
+        self.approvals.remove(completion.id)
+        self._fire_completion_event(EVENT_CHORE_UNDONE, completion)
+        await self.storage.async_save()
+        await self.async_refresh()
+        return completion
+
+    async def async_approve_chore(self, completion_id: str) -> ChoreCompletion | None:
         """Approve a chore completion."""
-        completions = self.storage.get_completions()
-        for completion in completions:
-            if completion.id == completion_id:
-                chore = self.get_chore(completion.chore_id)
-                child = self.get_child(completion.child_id)
-
-                if chore and child:
-                    completion.approved = True
-                    completion.approved_at = dt_util.now()
-                    completion.points_awarded = chore.points
-                    await self._award_points(child, chore.points)
-                    self.storage.update_completion(completion)
-                    await self.storage.async_save()
-                    await self.async_refresh()
-                return
-
-    async def async_reject_chore(self, completion_id: str) -> None:
-        """Reject a chore completion and deduct points if they were already awarded."""
-        completions = self.storage.get_completions()
-        for completion in completions:
-            if completion.id == completion_id:
-                # If points were already awarded, deduct them
-                if completion.points_awarded > 0:
-                    child = self.get_child(completion.child_id)
-                    if child:
-                        child.points -= completion.points_awarded
-                        # Ensure points don't go negative
-                        if child.points < 0:
-                            child.points = 0
-                        self.storage.update_child(child)
-                break
+        completion = self.storage.get_completion(completion_id)
+        if not completion:
+            return None
+
+        if await self._approve_completion(completion):
+            await self.storage.async_save()
+            await self.async_refresh()
+        return completion
+
+    async def _approve_completion(self, completion: ChoreCompletion) -> bool:
+        """Approve a completion and award its points without saving.
 
-        self.storage.remove_completion(completion_id)
+        Returns False if its chore or child no longer exists.
+        """
+        chore = self.get_chore(completion.chore_id)
+        child = self.get_child(completion.child_id)
+        if not chore or not child:
+            return False
+
+        completion.approved = True
+        completion.approved_at = dt_util.now()
+        completion.points_awarded = chore.points
+        await self._award_points(child, chore.points, ref_id=completion.id)
+        self.storage.update_completion(completion)
+        self.approvals.remove(completion.id)
+        self._fire_completion_event(EVENT_CHORE_APPROVED, completion)
+        return True
+
+    async def async_reject_chore(self, completion_id: str) -> ChoreCompletion | None:
+        """Reject a chore completion and deduct points if they were already awarded."""
+        completion = self.storage.get_completion(completion_id)
+        if completion:
+            self._reject_completion(completion)
         await self.storage.async_save()
         await self.async_refresh()
+        return completion
+
+    def _reject_completion(self, completion: ChoreCompletion) -> None:
+        """Remove a completion, deducting any awarded points, without saving."""
+        # If points were already awarded, deduct them
+        if completion.points_awarded > 0:
+            child = self.get_child(completion.child_id)
+            if child:
+                self._record_points(
+                    child, -completion.points_awarded, "reversal", ref_id=completion.id
+                )
+
+        self.storage.remove_completion(completion.id)
+        self.approvals.remove(completion.id)
+        self._fire_completion_event(EVENT_CHORE_REJECTED, completion)
 
     # Reward claim operations
-    async def async_claim_reward(self, reward_id: str, child_id: str) -> RewardClaim:
+    async def async_claim_reward(
+        self, reward_id: str, child_id: str, idempotency_key: str | None = None
+    ) -> RewardClaim:
+        """Child claims a reward.
+
+        Repeated calls with the same idempotency key return the original claim
+        instead of charging the child again.
+        """
+        return await self._async_run_idempotent(
+            f"claim_reward:{idempotency_key}" if idempotency_key else None,
+            partial(self._async_claim_reward, reward_id, child_id),
+        )
+
+    async def _async_claim_reward(self, reward_id: str, child_id: str) -> RewardClaim:
         """Child claims a reward."""
         reward = self.get_reward(reward_id)
         if not reward:
@@ -484,88 +669,352 @@ class ChoremanderCoordinator(DataUpdateCoordinator):
         if not child:
             raise ValueError(f"Child {child_id} not found")
 
-        # Get the effective cost for this child (dynamic or override)
-        costs = self.calculate_dynamic_reward_costs(reward)
+        # Get the effective cost for this child (dynamic or override), walking
+        # the chores once for both the cost and the recorded pricing inputs
+        children = self.storage.get_children()
+        chores = self.storage.get_chores()
+        daily_points = calculate_child_daily_points(reward, children, chores)
+        costs = calculate_reward_costs(reward, children, chores, daily_points)
         effective_cost = costs.get(child_id, reward.cost)
 
-        if child.points < effective_cost:
-            raise ValueError(f"Not enough points. Need {effective_cost}, have {child.points}")
+        balance = self.storage.ledger.balance(child_id)
+        if balance < effective_cost:
+            raise ValueError(f"Not enough points. Need {effective_cost}, have {balance}")
 
+        # Record the price and its inputs so later lifecycle steps never reprice
         claim = RewardClaim(
             reward_id=reward_id,
             child_id=child_id,
             claimed_at=dt_util.now(),
+            cost=effective_cost,
+            pricing={
+                "override_point_value": reward.override_point_value,
+                "is_jackpot": reward.is_jackpot,
+                "days_to_goal": reward.days_to_goal,
+                "manual_cost": reward.cost,
+                "daily_points": round(daily_points.get(child_id, 0.0), 2),
+            },
+            pricing_version=PRICING_VERSION,
         )
 
         # Deduct points immediately using the effective cost
-        child.points -= effective_cost
-        self.storage.update_child(child)
+        self._record_points(
+            child, -effective_cost, "claim", reason=reward.name, ref_id=claim.id
+        )
 
         self.storage.add_reward_claim(claim)
+        self.approvals.add_claim(claim)
+        self._fire_claim_event(EVENT_REWARD_CLAIMED, claim)
         await self.storage.async_save()
         await self.async_refresh()
         return claim
 
-    async def async_approve_reward(self, claim_id: str) -> None:
+    async def async_approve_reward(self, claim_id: str) -> RewardClaim | None:
         """Approve a reward claim."""
         claims = self.storage.get_reward_claims()
         for claim in claims:
             if claim.id == claim_id:
-                claim.approved = True
-                claim.approved_at = dt_util.now()
-                self.storage.update_reward_claim(claim)
+                self._approve_claim(claim)
                 await self.storage.async_save()
                 await self.async_refresh()
-                return
-
-    async def async_reject_reward(self, claim_id: str) -> None:
+                return claim
+        return None
+
+    def _approve_claim(self, claim: RewardClaim) -> None:
+        """Approve a reward claim without saving."""
+        claim.approved = True
+        claim.approved_at = dt_util.now()
+        self.storage.update_reward_claim(claim)
+        self.approvals.remove(claim.id)
+        self._fire_claim_event(EVENT_REWARD_APPROVED, claim)
+
+    async def async_reject_reward(self, claim_id: str) -> RewardClaim | None:
         """Reject a reward claim and refund points."""
         claims = self.storage.get_reward_claims()
         for claim in claims:
             if claim.id == claim_id:
-                reward = self.get_reward(claim.reward_id)
-                child = self.get_child(claim.child_id)
-                if reward and child:
-                    # Refund points using the effective cost for this child
-                    costs = self.calculate_dynamic_reward_costs(reward)
-                    effective_cost = costs.get(claim.child_id, reward.cost)
-                    child.points += effective_cost
-                    self.storage.update_child(child)
-                self.storage._data["reward_claims"] = [
-                    c for c in self.storage._data.get("reward_claims", [])
-                    if c.get("id") != claim_id
-                ]
+                self._reject_claim(claim)
                 await self.storage.async_save()
                 await self.async_refresh()
-                return
+                return claim
+        return None
+
+    def _reject_claim(self, claim: RewardClaim) -> None:
+        """Remove a reward claim and refund its cost without saving."""
+        child = self.get_child(claim.child_id)
+        # Refund exactly what the claim charged
+        if child and claim.cost > 0:
+            self._record_points(child, claim.cost, "refund", ref_id=claim.id)
+        self.storage.remove_reward_claim(claim.id)
+        self.approvals.remove(claim.id)
+        self._fire_claim_event(EVENT_REWARD_REJECTED, claim)
+
+    # Approval queue
+    def _rebuild_approvals(self) -> None:
+        """Rebuild the approval queue from stored completions and claims."""
+        self.approvals = ApprovalQueue.from_records(
+            self.storage.get_pending_completions(),
+            self.storage.get_pending_reward_claims(),
+        )
+
+    def async_schedule_approvals(self) -> CALLBACK_TYPE:
+        """Start processing auto-approval and expiry of queued items.
+
+        Returns a callback that stops the scheduled job.
+        """
+        return async_track_time_interval(
+            self.hass,
+            self._async_process_approvals,
+            timedelta(minutes=APPROVAL_CHECK_INTERVAL_MINUTES),
+        )
+
+    async def _async_process_approvals(self, now: datetime | None = None) -> None:
+        """Auto-approve or expire queued items past their configured timeouts.
+
+        Expiry is checked before auto-approval, so whichever timeout is
+        shorter decides an item's fate. Everything is saved once at the end.
+        """
+        auto_approve_hours = self.storage.get_auto_approve_hours()
+        expiry_days = self.storage.get_approval_expiry_days()
+        if not auto_approve_hours and not expiry_days:
+            return
+
+        now = dt_util.now()
+        expire_before = now - timedelta(days=expiry_days) if expiry_days else None
+        approve_before = (
+            now - timedelta(hours=auto_approve_hours) if auto_approve_hours else None
+        )
+        due = self.approvals.older_than(
+            max(cutoff for cutoff in (expire_before, approve_before) if cutoff)
+        )
+        if not due:
+            return
+
+        claims_by_id = {claim.id: claim for claim in self.storage.get_reward_claims()}
+        approved = expired = 0
+        for item in due:
+            expire = expire_before is not None and item.created_at < expire_before
+            if item.kind == APPROVAL_KIND_CHORE:
+                completion = self.storage.get_completion(item.id)
+                if completion is None:
+                    self.approvals.remove(item.id)
+                elif expire:
+                    self._reject_completion(completion)
+                    expired += 1
+                elif await self._approve_completion(completion):
+                    approved += 1
+                else:
+                    # Chore or child is gone; leave the item for a parent
+                    continue
+            else:
+                claim = claims_by_id.get(item.id)
+                if claim is None:
+                    self.approvals.remove(item.id)
+                elif expire:
+                    self._reject_claim(claim)
+                    expired += 1
+                else:
+                    self._approve_claim(claim)
+                    approved += 1
+
+        if approved or expired:
+            _LOGGER.info(
+                "Auto-approved %d and expired %d pending item(s)", approved, expired
+            )
+            await self.storage.async_save()
+            await self.async_refresh()
+
+    async def async_set_approval_rules(
+        self, rules: list[ApprovalRule]
+    ) -> list[ApprovalRule]:
+        """Replace the auto-approval rules.
+
+        Raises ValueError, keeping the current rules, if any rule is invalid.
+        """
+        await self.approval_rules.async_set_rules(rules)
+        self.storage.set_approval_rules(rules)
+        await self.storage.async_save()
+        return rules
+
+    async def async_set_approval_settings(
+        self, auto_approve_hours: int, expiry_days: int
+    ) -> None:
+        """Set the auto-approval and expiry timeouts (0 disables each)."""
+        self.storage.set_auto_approve_hours(auto_approve_hours)
+        self.storage.set_approval_expiry_days(expiry_days)
+        await self.storage.async_save()
+        await self._async_process_approvals()
 
     # Points operations
-    async def async_add_points(self, child_id: str, points: int, reason: str = "") -> None:
-        """Add points to a child (bonus)."""
+    async def async_add_points(self, child_id: str, points: int, reason: str = "") -> int:
+        """Add points to a child (bonus). Returns the points applied."""
         child = self.get_child(child_id)
         if not child:
             raise ValueError(f"Child {child_id} not found")
-        await self._award_points(child, points)
+        await self._award_points(child, points, kind="bonus", reason=reason)
         await self.storage.async_save()
         await self.async_refresh()
+        return points
 
-    async def async_remove_points(self, child_id: str, points: int, reason: str = "") -> None:
-        """Remove points from a child (penalty)."""
+    async def async_remove_points(self, child_id: str, points: int, reason: str = "") -> int:
+        """Remove points from a child (penalty). Returns the points removed."""
         child = self.get_child(child_id)
         if not child:
             raise ValueError(f"Child {child_id} not found")
-        child.points = max(0, child.points - points)
-        self.storage.update_child(child)
+        applied = self._record_points(child, -points, "penalty", reason=reason)
         await self.storage.async_save()
         await self.async_refresh()
+        return -applied
 
-    async def _award_points(self, child: Child, points: int) -> None:
+    async def _award_points(
+        self,
+        child: Child,
+        points: int,
+        kind: str = "award",
+        reason: str = "",
+        ref_id: str | None = None,
+    ) -> None:
         """Award points to a child."""
-        child.points += points
         child.total_points_earned += points
         child.total_chores_completed += 1
+        self._record_points(child, points, kind, reason=reason, ref_id=ref_id)
 
+    def _record_points(
+        self,
+        child: Child,
+        amount: int,
+        kind: str,
+        reason: str = "",
+        ref_id: str | None = None,
+    ) -> int:
+        """Record a points transaction in the ledger and sync the child's balance.
+
+        Deductions are capped so a balance never goes negative. Returns the
+        amount actually applied.
+        """
+        balance = self.storage.ledger.balance(child.id)
+        amount = max(amount, -balance)
+        if amount:
+            self.storage.ledger.append(
+                PointsTransaction(
+                    child_id=child.id,
+                    amount=amount,
+                    kind=kind,
+                    created_at=dt_util.now(),
+                    reason=reason,
+                    ref_id=ref_id,
+                )
+            )
+        child.points = balance + amount
         self.storage.update_child(child)
+        if amount:
+            self._fire_event(
+                EVENT_POINTS_CHANGED,
+                {
+                    "child_id": child.id,
+                    "amount": amount,
+                    "balance": child.points,
+                    "kind": kind,
+                    "reason": reason,
+                    "ref_id": ref_id,
+                },
+            )
+        return amount
+
+    def get_points_history(
+        self, child_id: str | None = None, limit: int | None = None
+    ) -> list[PointsTransaction]:
+        """Get ledger transactions still in the store, newest first."""
+        return self.storage.ledger.transactions(child_id, limit)
+
+    # Queries
+    def get_child_summary(self, child_id: str) -> dict[str, Any] | None:
+        """Get a child's record with balances, suitable for service responses."""
+        child = self.get_child(child_id)
+        if not child:
+            return None
+        history = self.storage.history
+        pending_points = 0
+        for completion_id in self.approvals.ids(APPROVAL_KIND_CHORE, child_id):
+            completion = history.get(completion_id)
+            chore = self.get_chore(completion.chore_id) if completion else None
+            if chore:
+                pending_points += chore.points
+        return {
+            **child.to_dict(),
+            "pending_points": pending_points,
+        }
+
+    def get_pending(self, child_id: str | None = None) -> dict[str, Any]:
+        """Get pending completions and reward claims, optionally for one child."""
+        history = self.storage.history
+        completions = [
+            completion.to_dict()
+            for completion_id in self.approvals.ids(APPROVAL_KIND_CHORE, child_id)
+            if (completion := history.get(completion_id))
+        ]
+        claims_by_id = {claim.id: claim for claim in self.storage.get_reward_claims()}
+        claims = [
+            claims_by_id[claim_id].to_dict()
+            for claim_id in self.approvals.ids(APPROVAL_KIND_REWARD, child_id)
+            if claim_id in claims_by_id
+        ]
+        return {"completions": completions, "reward_claims": claims}
+
+    async def async_get_history(
+        self,
+        child_id: str | None = None,
+        chore_id: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        """Get the most recent completions and points transactions, newest first.
+
+        Completions are streamed from the archive and store in the executor,
+        keeping only the last ``limit`` matches in memory. Transactions are
+        read from the store first and the ledger archive only when needed.
+        """
+        start = dt_util.start_of_local_day(start_date) if start_date else None
+        end = (
+            dt_util.start_of_local_day(end_date + timedelta(days=1))
+            if end_date
+            else None
+        )
+        records = self.storage.iter_completion_records(start, end)
+
+        def _collect() -> list[dict[str, Any]]:
+            recent: deque[dict[str, Any]] = deque(maxlen=limit)
+            for record in records:
+                if child_id and record.get("child_id") != child_id:
+                    continue
+                if chore_id and record.get("chore_id") != chore_id:
+                    continue
+                recent.append(record)
+            return list(reversed(recent))
+
+        completions = await self.hass.async_add_executor_job(_collect)
+
+        entries = self.storage.iter_ledger_records()
+
+        def _collect_transactions() -> list[dict[str, Any]]:
+            transactions = []
+            for entry in entries:
+                if child_id and entry.get("child_id") != child_id:
+                    continue
+                transaction = PointsTransaction.from_dict(entry)
+                if end and transaction.created_at >= end:
+                    continue
+                if start and transaction.created_at < start:
+                    break
+                transactions.append(transaction.to_dict())
+                if len(transactions) >= limit:
+                    break
+            return transactions
+
+        transactions = await self.hass.async_add_executor_job(_collect_transactions)
+
+        return {"completions": completions, "transactions": transactions}
 
     # Child chore order operations
     async def async_set_chore_order(self, child_id: str, chore_order: list[str]) -> None:
@@ -579,6 +1028,124 @@ class ChoremanderCoordinator(DataUpdateCoordinator):
         await self.storage.async_save()
         await self.async_refresh()
 
+    # Bulk import
+    async def async_import(self, path: Path, include_history: bool = True) -> dict[str, int]:
+        """Import children, chores, rewards and optionally completions from a file.
+
+        The file is parsed and validated in the executor. Everything is then
+        applied in one pass with a single storage write and refresh. Imported
+        completions are recorded as history only; balances come from each
+        imported child's ``points``.
+        """
+        data = self.storage.data
+        existing = {
+            "children": {c.get("name", ""): c.get("id", "") for c in data.get("children", [])},
+            "chores": {c.get("name", ""): c.get("id", "") for c in data.get("chores", [])},
+            "rewards": {r.get("name", ""): r.get("id", "") for r in data.get("rewards", [])},
+            "chore_points": {c.get("id", ""): c.get("points", 0) for c in data.get("chores", [])},
+            # Read lazily in the executor, archived history included
+            "completions": self.storage.iter_completion_records() if include_history else (),
+        }
+
+        plan = await self.hass.async_add_executor_job(
+            load_import_plan, path, existing, include_history
+        )
+
+        for child in plan.children:
+            self.storage.add_child(child)
+            if child.points:
+                self.storage.ledger.append(
+                    PointsTransaction(
+                        child_id=child.id,
+                        amount=child.points,
+                        kind="opening",
+                        created_at=dt_util.now(),
+                        reason="Imported balance",
+                    )
+                )
+        for chore in plan.chores:
+            self.storage.add_chore(chore)
+        for reward in plan.rewards:
+            self.storage.add_reward(reward)
+        self.storage.add_completions(plan.completions)
+        if plan.completions:
+            self._rebuild_approvals()
+
+        summary = {
+            "children": len(plan.children),
+            "chores": len(plan.chores),
+            "rewards": len(plan.rewards),
+            "completions": len(plan.completions),
+            "skipped": plan.skipped,
+        }
+        if any(summary[key] for key in ("children", "chores", "rewards", "completions")):
+            await self.storage.async_save()
+            await self.async_refresh()
+        _LOGGER.info("Imported from %s: %s", path, summary)
+        return summary
+
+    # History export
+    async def async_export_history(
+        self,
+        export_format: str = "csv",
+        filename: str | None = None,
+        child_id: str | None = None,
+        chore_id: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        include_claims: bool = True,
+    ) -> dict[str, Any]:
+        """Export completion and reward claim history to a file.
+
+        The file is written from the executor, streaming archived history so
+        that years of completions are never held in memory at once.
+        """
+        start = dt_util.start_of_local_day(start_date) if start_date else None
+        end = (
+            dt_util.start_of_local_day(end_date + timedelta(days=1))
+            if end_date
+            else None
+        )
+
+        if not filename:
+            filename = f"{DOMAIN}_{self.entry_id}_{dt_util.now():%Y%m%d_%H%M%S}"
+        # Never allow writing outside the export directory
+        filename = Path(filename).name
+        if not filename.endswith(f".{export_format}"):
+            filename = f"{filename}.{export_format}"
+        path = Path(self.hass.config.path(EXPORT_DIRECTORY, filename))
+
+        data = self.storage.data
+        child_names = {c.get("id", ""): c.get("name", "") for c in data.get("children", [])}
+        chore_names = {c.get("id", ""): c.get("name", "") for c in data.get("chores", [])}
+        reward_names = {r.get("id", ""): r.get("name", "") for r in data.get("rewards", [])}
+
+        rows = completion_rows(
+            self.storage.iter_completion_records(start, end),
+            child_names,
+            chore_names,
+            child_id,
+            chore_id,
+        )
+        if include_claims and not chore_id:
+            claims = []
+            for claim in data.get("reward_claims", []):
+                claimed_at = parse_datetime(claim.get("claimed_at"))
+                if claimed_at is None:
+                    continue
+                if (start and claimed_at < start) or (end and claimed_at >= end):
+                    continue
+                claims.append(dict(claim))
+            rows = itertools.chain(
+                rows, claim_rows(claims, child_names, reward_names, child_id)
+            )
+
+        written = await self.hass.async_add_executor_job(
+            write_export, path, export_format, rows
+        )
+        _LOGGER.info("Exported %d history rows to %s", written, path)
+        return {"path": str(path), "rows": written}
+
     # Settings
     async def async_set_points_settings(self, name: str, icon: str) -> None:
         """Update points settings."""
@@ -0,0 +1,114 @@
+"""History export for Choremander integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+from pathlib import Path
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes
+
+# Number of rows buffered before each write to the export file
+EXPORT_CHUNK_SIZE = 500
+
+EXPORT_FIELDS = [
+    "type",
+    "id",
+    "child_id",
+    "child_name",
+    "item_id",
+    "item_name",
+    "points",
+    "timestamp",
+    "approved",
+    "approved_at",
+]
+
+
+def completion_rows(
+    records: Iterable[dict[str, Any]],
+    child_names: dict[str, str],
+    chore_names: dict[str, str],
+    child_id: str | None = None,
+    chore_id: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield export rows for stored completion dicts."""
+    for record in records:
+        if child_id and record.get("child_id") != child_id:
+            continue
+        if chore_id and record.get("chore_id") != chore_id:
+            continue
+        yield {
+            "type": "completion",
+            "id": record.get("id"),
+            "child_id": record.get("child_id"),
+            "child_name": child_names.get(record.get("child_id", ""), ""),
+            "item_id": record.get("chore_id"),
+            "item_name": chore_names.get(record.get("chore_id", ""), ""),
+            "points": record.get("points_awarded", 0),
+            "timestamp": record.get("completed_at"),
+            "approved": record.get("approved", False),
+            "approved_at": record.get("approved_at"),
+        }
+
+
+def claim_rows(
+    records: Iterable[dict[str, Any]],
+    child_names: dict[str, str],
+    reward_names: dict[str, str],
+    child_id: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield export rows for stored reward claim dicts."""
+    for record in records:
+        if child_id and record.get("child_id") != child_id:
+            continue
+        yield {
+            "type": "reward_claim",
+            "id": record.get("id"),
+            "child_id": record.get("child_id"),
+            "child_name": child_names.get(record.get("child_id", ""), ""),
+            "item_id": record.get("reward_id"),
+            "item_name": reward_names.get(record.get("reward_id", ""), ""),
+            "points": record.get("cost"),
+            "timestamp": record.get("claimed_at"),
+            "approved": record.get("approved", False),
+            "approved_at": record.get("approved_at"),
+        }
+
+
+def write_export(path: Path, export_format: str, rows: Iterable[dict[str, Any]]) -> int:
+    """Stream export rows to a CSV or JSONL file (blocking).
+
+    Rows are consumed lazily and flushed in chunks of EXPORT_CHUNK_SIZE, so
+    memory use does not grow with the size of the history. Returns the number
+    of rows written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+
+    if export_format == "csv":
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            chunk: list[dict[str, Any]] = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= EXPORT_CHUNK_SIZE:
+                    writer.writerows(chunk)
+                    written += len(chunk)
+                    chunk.clear()
+            writer.writerows(chunk)
+            written += len(chunk)
+        return written
+
+    with open(path, "wb") as handle:
+        lines: list[bytes] = []
+        for row in rows:
+            lines.append(json_bytes(row) + b"\n")
+            if len(lines) >= EXPORT_CHUNK_SIZE:
+                handle.writelines(lines)
+                written += len(lines)
+                lines.clear()
+        handle.writelines(lines)
+        written += len(lines)
+    return written
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+import re
 from typing import Final
 
 from homeassistant.components.http import StaticPathConfig
@@ -25,6 +26,17 @@ CARDS: Final = [
     "choremander-reorder-card.js",
 ]
 
+# Shared runtime imported by every card and the config flow sound preview.
+# When serving raw sources it is loaded globally at the same versioned URL
+# the cards import it from, so the browser fetches and evaluates it once per
+# page and picks up a new copy after every upgrade.
+RUNTIME_MODULE: Final = "choremander-runtime.js"
+
+# Directory in www holding the minified, content-hashed bundles built by
+# dev/build-frontend.mjs, and the manifest mapping source files to bundles
+DIST_DIRECTORY: Final = "dist"
+BUILD_MANIFEST: Final = "manifest.json"
+
 # JS modules to load globally (for config flow sound preview)
 GLOBAL_MODULES: Final = [
     "choremander-config-sounds.js",
@@ -32,6 +44,8 @@ GLOBAL_MODULES: Final = [
 
 # Track if frontend is registered
 FRONTEND_REGISTERED: Final = "frontend_registered"
+# Source file name -> bundle file name, empty when no build is present
+FRONTEND_BUNDLES: Final = "frontend_bundles"
 
 
 def _get_version() -> str:
@@ -47,6 +61,43 @@ def _get_version() -> str:
         return "1.0.0"
 
 
+def _load_bundles(dist_path: Path) -> dict[str, str]:
+    """Load the build manifest mapping source files to hashed bundles."""
+    import json
+
+    try:
+        with open(dist_path / BUILD_MANIFEST) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _module_url(hass: HomeAssistant, filename: str, version: str) -> str:
+    """Get the URL of a card or module, preferring its built bundle.
+
+    Bundle names change with their content. Raw sources are served under a
+    versioned path rather than with a version query, so their relative
+    imports of the shared runtime change URL with every release too.
+    """
+    bundle = hass.data.get(DOMAIN, {}).get(FRONTEND_BUNDLES, {}).get(filename)
+    if bundle:
+        return f"{URL_BASE}/{DIST_DIRECTORY}/{bundle}"
+    return f"{URL_BASE}/{version}/{filename}"
+
+
+def _is_card_url(url: str, card: str) -> bool:
+    """Check whether a resource URL loads a card, as a raw source or bundle."""
+    path = url.split("?")[0]
+    if path == f"{URL_BASE}/{card}":
+        return True
+    versioned_pattern = rf"{re.escape(URL_BASE)}/[^/]+/{re.escape(card)}"
+    if re.fullmatch(versioned_pattern, path):
+        return True
+    stem = card.removesuffix(".js")
+    bundle_pattern = rf"{re.escape(URL_BASE)}/{DIST_DIRECTORY}/{re.escape(stem)}-\w+\.js"
+    return re.fullmatch(bundle_pattern, path) is not None
+
+
 async def async_register_frontend(hass: HomeAssistant) -> None:
     """Register static paths for serving card JavaScript files."""
     # Only register once
@@ -60,17 +111,44 @@ async def async_register_frontend(hass: HomeAssistant) -> None:
         _LOGGER.warning("www directory not found at %s", www_path)
         return
 
-    # Register the www folder as a static path
-    await hass.http.async_register_static_paths(
-        [StaticPathConfig(URL_BASE, str(www_path), False)]
+    dist_path = www_path / DIST_DIRECTORY
+    bundles = await hass.async_add_executor_job(_load_bundles, dist_path)
+    hass.data.setdefault(DOMAIN, {})[FRONTEND_BUNDLES] = bundles
+    version = _get_version()
+
+    # Register the www folder as a static path. Bundles are immutable, so
+    # their folder is served with long-lived cache headers; precompressed
+    # .gz/.br siblings are sent to clients that accept them. Without a build
+    # the raw sources are also served under a versioned path. More specific
+    # paths come first so the plain www path does not shadow them.
+    static_paths = []
+    if bundles:
+        static_paths.append(
+            StaticPathConfig(f"{URL_BASE}/{DIST_DIRECTORY}", str(dist_path), True)
+        )
+    else:
+        static_paths.append(
+            StaticPathConfig(f"{URL_BASE}/{version}", str(www_path), False)
+        )
+    static_paths.append(StaticPathConfig(URL_BASE, str(www_path), False))
+    await hass.http.async_register_static_paths(static_paths)
+
+    _LOGGER.debug(
+        "Registered static path: %s -> %s (%s bundles)",
+        URL_BASE,
+        www_path,
+        len(bundles) or "no",
     )
 
-    _LOGGER.debug("Registered static path: %s -> %s", URL_BASE, www_path)
+    if not bundles:
+        # Register the shared runtime without a query string: the raw cards'
+        # relative imports resolve to this exact URL, and a query would load
+        # a second copy. Bundles import their own hashed runtime chunk.
+        add_extra_js_url(hass, _module_url(hass, RUNTIME_MODULE, version))
 
     # Register global JS modules (loaded on all pages, including config flow)
-    version = _get_version()
     for module in GLOBAL_MODULES:
-        module_url = f"{URL_BASE}/{module}?v={version}"
+        module_url = _module_url(hass, module, version)
         add_extra_js_url(hass, module_url)
         _LOGGER.info("Registered global frontend module: %s", module_url)
 
@@ -95,7 +173,7 @@ async def async_register_cards(hass: HomeAssistant) -> None:
             "Lovelace is in YAML mode. Add these resources to configuration.yaml:"
         )
         for card in CARDS:
-            _LOGGER.info("  - url: %s/%s", URL_BASE, card)
+            _LOGGER.info("  - url: %s", _module_url(hass, card, version))
             _LOGGER.info("    type: module")
         return
 
@@ -106,33 +184,30 @@ async def async_register_cards(hass: HomeAssistant) -> None:
             _LOGGER.debug("Lovelace resources collection not available")
             return
 
-        # Get existing resource URLs (strip query params for comparison)
-        existing_urls = set()
-        for item in resources.async_items():
-            url = item.get("url", "")
-            existing_urls.add(url.split("?")[0])
-
-        # Register each card
+        # Register each card, pointing existing resources (raw or bundled)
+        # at the current URL
         for card in CARDS:
-            card_url = f"{URL_BASE}/{card}"
-            versioned_url = f"{card_url}?v={version}"
-
-            if card_url in existing_urls:
-                # Update version if needed
-                for item in resources.async_items():
-                    if item.get("url", "").split("?")[0] == card_url:
-                        if item.get("url") != versioned_url:
-                            await resources.async_update_item(
-                                item["id"],
-                                {"url": versioned_url},
-                            )
-                            _LOGGER.debug("Updated card version: %s", versioned_url)
-                        break
-            else:
+            card_url = _module_url(hass, card, version)
+            existing = next(
+                (
+                    item
+                    for item in resources.async_items()
+                    if _is_card_url(item.get("url", ""), card)
+                ),
+                None,
+            )
+
+            if existing is None:
                 await resources.async_create_item(
-                    {"url": versioned_url, "res_type": "module"}
+                    {"url": card_url, "res_type": "module"}
+                )
+                _LOGGER.info("Registered Lovelace resource: %s", card_url)
+            elif existing.get("url") != card_url:
+                await resources.async_update_item(
+                    existing["id"],
+                    {"url": card_url},
                 )
-                _LOGGER.info("Registered Lovelace resource: %s", versioned_url)
+                _LOGGER.debug("Updated card version: %s", card_url)
 
     except Exception as err:  # noqa: BLE001
         _LOGGER.warning(
@@ -0,0 +1,404 @@
+"""Compact columnar completion history for Choremander integration."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from itertools import compress
+from typing import Any
+
+from .models import ChoreCompletion, format_datetime
+
+# Sentinel stored in the approved_at column when a completion is not approved
+_NO_TIMESTAMP = -1
+
+# Interned IDs fit a byte column up to this many distinct values
+_BYTE_COLUMN_LIMIT = 256
+
+# Storage for one column; ID and flag columns are bytearrays while they fit
+Column = array | bytearray
+
+
+def _to_epoch(value: datetime) -> int:
+    """Convert a timezone-aware datetime to epoch seconds."""
+    return int(value.timestamp())
+
+
+def _from_epoch(value: int) -> datetime:
+    """Convert epoch seconds to a UTC datetime."""
+    return datetime.fromtimestamp(value, timezone.utc)
+
+
+def _id_column(values: Iterable[int], distinct: int) -> Column:
+    """Return a column for interned IDs, one byte per row while they fit."""
+    if distinct <= _BYTE_COLUMN_LIMIT:
+        return bytearray(values)
+    return array("I", values)
+
+
+def _take(column: Column, rows: Iterable[int]) -> Column:
+    """Return a new column of the same type holding only the given rows."""
+    values = map(column.__getitem__, rows)
+    if isinstance(column, bytearray):
+        return bytearray(values)
+    return array(column.typecode, values)
+
+
+class CompletionHistory:
+    """Columnar, interned in-memory representation of chore completions.
+
+    Each completion is one row spread across parallel columns. Child and chore
+    IDs are interned into small integers, timestamps are stored as epoch
+    seconds and flags as bytes, so a row costs a few dozen bytes instead of a
+    dict with repeated string keys and two ISO strings.
+
+    Filters return lists of row numbers and accept an optional ``rows``
+    argument so they can be chained, e.g.
+    ``history.pending(history.by_child(child_id))``. Child, chore and approval
+    columns hold one byte per row (child and chore columns widen to 32 bits
+    past 256 distinct IDs), so equality filters run in C: ``translate`` turns
+    a column into a 0/1 mask and ``compress`` keeps the marked rows. Rows are
+    only hydrated into ``ChoreCompletion`` objects when explicitly requested.
+
+    The store persists the columns as flat lists (see ``to_columns``), so
+    saving never builds a dict per completion either.
+    """
+
+    __slots__ = (
+        "_ids",
+        "_positions",
+        "_child_ids",
+        "_child_index",
+        "_chore_ids",
+        "_chore_index",
+        "_child",
+        "_chore",
+        "_completed_at",
+        "_approved_at",
+        "_approved",
+        "_points",
+        "_sorted",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._child_ids: list[str] = []
+        self._child_index: dict[str, int] = {}
+        self._chore_ids: list[str] = []
+        self._chore_index: dict[str, int] = {}
+        self._child: Column = bytearray()
+        self._chore: Column = bytearray()
+        self._completed_at = array("q")
+        self._approved_at = array("q")
+        self._approved = bytearray()
+        self._points = array("l")
+        # True while completed_at is non-decreasing, enabling bisection
+        self._sorted = True
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict[str, Any]]) -> CompletionHistory:
+        """Build a history from stored completion dictionaries."""
+        history = cls()
+        for item in items:
+            history.append(ChoreCompletion.from_dict(item))
+        # Older stores may hold rows out of order; restore bisectable order once
+        history.sort()
+        return history
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, list[Any]]) -> CompletionHistory:
+        """Build a history from the stored columnar payload."""
+        history = cls()
+        if not columns:
+            return history
+        history._ids = list(columns["ids"])
+        history._positions = {
+            completion_id: row for row, completion_id in enumerate(history._ids)
+        }
+        history._child_ids = list(columns["child_ids"])
+        history._child_index = {
+            child_id: index for index, child_id in enumerate(history._child_ids)
+        }
+        history._chore_ids = list(columns["chore_ids"])
+        history._chore_index = {
+            chore_id: index for index, chore_id in enumerate(history._chore_ids)
+        }
+        history._child = _id_column(columns["child"], len(history._child_ids))
+        history._chore = _id_column(columns["chore"], len(history._chore_ids))
+        history._completed_at = array("q", columns["completed_at"])
+        history._approved_at = array("q", columns["approved_at"])
+        history._approved = bytearray(columns["approved"])
+        history._points = array("l", columns["points"])
+
+        completed_at = history._completed_at
+        history._sorted = all(
+            completed_at[row - 1] <= completed_at[row] for row in range(1, len(completed_at))
+        )
+        history.sort()
+        return history
+
+    def to_columns(self) -> dict[str, list[Any]]:
+        """Return the columns as flat lists for the store.
+
+        Unapproved rows hold -1 in ``approved_at``; timestamps are epoch
+        seconds and child/chore columns index into the interned ID lists.
+        """
+        return {
+            "ids": list(self._ids),
+            "child_ids": list(self._child_ids),
+            "chore_ids": list(self._chore_ids),
+            "child": list(self._child),
+            "chore": list(self._chore),
+            "completed_at": self._completed_at.tolist(),
+            "approved_at": self._approved_at.tolist(),
+            "approved": list(self._approved),
+            "points": self._points.tolist(),
+        }
+
+    def __len__(self) -> int:
+        """Return the number of completions."""
+        return len(self._ids)
+
+    def __contains__(self, completion_id: object) -> bool:
+        """Return True if a completion with this ID exists."""
+        return completion_id in self._positions
+
+    # Interning
+    def _intern_child(self, child_id: str) -> int:
+        """Return the small integer for a child ID, interning if needed."""
+        index = self._child_index.get(child_id)
+        if index is None:
+            index = len(self._child_ids)
+            self._child_ids.append(child_id)
+            self._child_index[child_id] = index
+            if index == _BYTE_COLUMN_LIMIT:
+                self._child = array("I", list(self._child))
+        return index
+
+    def _intern_chore(self, chore_id: str) -> int:
+        """Return the small integer for a chore ID, interning if needed."""
+        index = self._chore_index.get(chore_id)
+        if index is None:
+            index = len(self._chore_ids)
+            self._chore_ids.append(chore_id)
+            self._chore_index[chore_id] = index
+            if index == _BYTE_COLUMN_LIMIT:
+                self._chore = array("I", list(self._chore))
+        return index
+
+    # Mutation
+    def append(self, completion: ChoreCompletion) -> None:
+        """Append a completion as a new row."""
+        completed_at = _to_epoch(completion.completed_at)
+        if self._completed_at and completed_at < self._completed_at[-1]:
+            self._sorted = False
+
+        # Intern first: a new ID may widen the column being appended to
+        child = self._intern_child(completion.child_id)
+        chore = self._intern_chore(completion.chore_id)
+        self._positions[completion.id] = len(self._ids)
+        self._ids.append(completion.id)
+        self._child.append(child)
+        self._chore.append(chore)
+        self._completed_at.append(completed_at)
+        self._approved_at.append(
+            _to_epoch(completion.approved_at)
+            if completion.approved_at is not None
+            else _NO_TIMESTAMP
+        )
+        self._approved.append(1 if completion.approved else 0)
+        self._points.append(completion.points_awarded)
+
+    def update(self, completion: ChoreCompletion) -> bool:
+        """Overwrite the row for an existing completion.
+
+        Returns False if the completion is not present.
+        """
+        row = self._positions.get(completion.id)
+        if row is None:
+            return False
+
+        completed_at = _to_epoch(completion.completed_at)
+        self._child[row] = self._intern_child(completion.child_id)
+        self._chore[row] = self._intern_chore(completion.chore_id)
+        self._completed_at[row] = completed_at
+        self._approved_at[row] = (
+            _to_epoch(completion.approved_at)
+            if completion.approved_at is not None
+            else _NO_TIMESTAMP
+        )
+        self._approved[row] = 1 if completion.approved else 0
+        self._points[row] = completion.points_awarded
+        if (row > 0 and completed_at < self._completed_at[row - 1]) or (
+            row + 1 < len(self._ids) and completed_at > self._completed_at[row + 1]
+        ):
+            self._sorted = False
+        return True
+
+    def remove(self, completion_id: str) -> bool:
+        """Remove a completion row.
+
+        Returns False if the completion is not present.
+        """
+        row = self._positions.pop(completion_id, None)
+        if row is None:
+            return False
+
+        del self._ids[row]
+        del self._child[row]
+        del self._chore[row]
+        del self._completed_at[row]
+        del self._approved_at[row]
+        del self._approved[row]
+        del self._points[row]
+
+        # Shift the positions of every row after the removed one
+        for index in range(row, len(self._ids)):
+            self._positions[self._ids[index]] = index
+        return True
+
+    def remove_rows(self, rows: Iterable[int]) -> None:
+        """Remove several rows at once, rebuilding the columns in one pass."""
+        drop = set(rows)
+        if not drop:
+            return
+        keep = [row for row in range(len(self._ids)) if row not in drop]
+
+        self._ids = [self._ids[row] for row in keep]
+        self._child = _take(self._child, keep)
+        self._chore = _take(self._chore, keep)
+        self._completed_at = _take(self._completed_at, keep)
+        self._approved_at = _take(self._approved_at, keep)
+        self._approved = _take(self._approved, keep)
+        self._points = _take(self._points, keep)
+        self._positions = {
+            completion_id: row for row, completion_id in enumerate(self._ids)
+        }
+
+    def sort(self) -> None:
+        """Reorder rows by completion time so date filters can bisect again.
+
+        Call after appending rows out of order, e.g. a bulk import of older
+        history. The sort is stable, so rows with equal timestamps keep their
+        relative order. Row numbers change, so previously returned rows must
+        not be reused.
+        """
+        if self._sorted:
+            return
+        order = sorted(range(len(self._ids)), key=self._completed_at.__getitem__)
+
+        self._ids = [self._ids[row] for row in order]
+        self._child = _take(self._child, order)
+        self._chore = _take(self._chore, order)
+        self._completed_at = _take(self._completed_at, order)
+        self._approved_at = _take(self._approved_at, order)
+        self._approved = _take(self._approved, order)
+        self._points = _take(self._points, order)
+        self._positions = {
+            completion_id: row for row, completion_id in enumerate(self._ids)
+        }
+        self._sorted = True
+
+    # Filters
+    def _all_rows(self, rows: Iterable[int] | None) -> Iterable[int]:
+        """Return the rows to scan, defaulting to every row."""
+        return range(len(self._ids)) if rows is None else rows
+
+    def _matching(self, column: Column, value: int, rows: Iterable[int] | None) -> list[int]:
+        """Return the rows whose column holds ``value``."""
+        if not isinstance(column, bytearray):
+            return [row for row in self._all_rows(rows) if column[row] == value]
+
+        table = bytearray(256)
+        table[value] = 1
+        if rows is None:
+            return list(compress(range(len(column)), column.translate(table)))
+        if not isinstance(rows, (list, range)):
+            rows = list(rows)
+        return list(compress(rows, bytes(map(column.__getitem__, rows)).translate(table)))
+
+    def by_child(self, child_id: str, rows: Iterable[int] | None = None) -> list[int]:
+        """Return the rows completed by a child."""
+        index = self._child_index.get(child_id)
+        if index is None:
+            return []
+        return self._matching(self._child, index, rows)
+
+    def by_chore(self, chore_id: str, rows: Iterable[int] | None = None) -> list[int]:
+        """Return the rows for a chore."""
+        index = self._chore_index.get(chore_id)
+        if index is None:
+            return []
+        return self._matching(self._chore, index, rows)
+
+    def by_date_range(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        rows: Iterable[int] | None = None,
+    ) -> list[int]:
+        """Return the rows completed in the half-open range [start, end)."""
+        column = self._completed_at
+        low = _to_epoch(start) if start is not None else None
+        high = _to_epoch(end) if end is not None else None
+
+        if rows is None and self._sorted:
+            first = bisect_left(column, low) if low is not None else 0
+            last = bisect_left(column, high) if high is not None else len(column)
+            return list(range(first, last))
+
+        return [
+            row
+            for row in self._all_rows(rows)
+            if (low is None or column[row] >= low) and (high is None or column[row] < high)
+        ]
+
+    def pending(self, rows: Iterable[int] | None = None) -> list[int]:
+        """Return the rows that have not been approved."""
+        return self._matching(self._approved, 0, rows)
+
+    # Hydration
+    def completion_at(self, row: int) -> ChoreCompletion:
+        """Hydrate a single row into a ChoreCompletion."""
+        approved_at = self._approved_at[row]
+        return ChoreCompletion(
+            chore_id=self._chore_ids[self._chore[row]],
+            child_id=self._child_ids[self._child[row]],
+            completed_at=_from_epoch(self._completed_at[row]),
+            approved=bool(self._approved[row]),
+            approved_at=_from_epoch(approved_at) if approved_at != _NO_TIMESTAMP else None,
+            points_awarded=self._points[row],
+            id=self._ids[row],
+        )
+
+    def get(self, completion_id: str) -> ChoreCompletion | None:
+        """Return a completion by ID."""
+        row = self._positions.get(completion_id)
+        if row is None:
+            return None
+        return self.completion_at(row)
+
+    def completions(self, rows: Iterable[int] | None = None) -> list[ChoreCompletion]:
+        """Hydrate the given rows (or every row) into ChoreCompletion objects."""
+        return [self.completion_at(row) for row in self._all_rows(rows)]
+
+    def iter_dicts(self, rows: Iterable[int] | None = None) -> Iterator[dict[str, Any]]:
+        """Yield rows in the stored dictionary format."""
+        for row in self._all_rows(rows):
+            approved_at = self._approved_at[row]
+            yield {
+                "chore_id": self._chore_ids[self._chore[row]],
+                "child_id": self._child_ids[self._child[row]],
+                "completed_at": format_datetime(_from_epoch(self._completed_at[row])),
+                "approved": bool(self._approved[row]),
+                "approved_at": (
+                    format_datetime(_from_epoch(approved_at))
+                    if approved_at != _NO_TIMESTAMP
+                    else None
+                ),
+                "points_awarded": self._points[row],
+                "id": self._ids[row],
+            }
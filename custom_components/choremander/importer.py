@@ -0,0 +1,277 @@
+"""Bulk import of children, chores, rewards and history for Choremander."""
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+from pathlib import Path
+from typing import Any
+
+import voluptuous as vol
+import yaml
+
+from homeassistant.helpers import config_validation as cv
+
+from .const import COMPLETION_SOUND_OPTIONS, DAYS_OF_WEEK, TIME_CATEGORIES
+from .models import Child, Chore, ChoreCompletion, Reward, parse_datetime
+
+# Separator for list values (due_days, assigned_to) in CSV cells
+CSV_LIST_SEPARATOR = ";"
+
+# Section name for each CSV "type" column value
+CSV_TYPES = {
+    "child": "children",
+    "chore": "chores",
+    "reward": "rewards",
+    "completion": "completions",
+}
+
+
+def _csv_list(value: Any) -> list[str]:
+    """Split a CSV cell into a list, passing real lists through."""
+    if isinstance(value, list):
+        return value
+    return [item.strip() for item in str(value).split(CSV_LIST_SEPARATOR) if item.strip()]
+
+
+CHILD_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): cv.string,
+        vol.Optional("id"): cv.string,
+        vol.Optional("avatar", default="mdi:account-circle"): cv.icon,
+        vol.Optional("points", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+CHORE_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): cv.string,
+        vol.Optional("id"): cv.string,
+        vol.Optional("points", default=10): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("description", default=""): cv.string,
+        vol.Optional("due_days", default=[]): vol.All(
+            _csv_list, [vol.All(vol.Lower, vol.In(DAYS_OF_WEEK))]
+        ),
+        vol.Optional("assigned_to", default=[]): vol.All(_csv_list, [cv.string]),
+        vol.Optional("requires_approval", default=True): cv.boolean,
+        vol.Optional("time_category", default="anytime"): vol.All(
+            vol.Lower, vol.In(TIME_CATEGORIES)
+        ),
+        vol.Optional("daily_limit", default=1): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("completion_sound", default="coin"): vol.In(COMPLETION_SOUND_OPTIONS),
+        vol.Optional("completion_percentage_per_month", default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+REWARD_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): cv.string,
+        vol.Optional("id"): cv.string,
+        vol.Optional("cost", default=50): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("description", default=""): cv.string,
+        vol.Optional("icon", default="mdi:gift"): cv.icon,
+        vol.Optional("assigned_to", default=[]): vol.All(_csv_list, [cv.string]),
+        vol.Optional("is_jackpot", default=False): cv.boolean,
+        vol.Optional("override_point_value", default=False): cv.boolean,
+        vol.Optional("days_to_goal", default=30): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+COMPLETION_SCHEMA = vol.Schema(
+    {
+        vol.Required("child"): cv.string,
+        vol.Required("chore"): cv.string,
+        vol.Required("completed_at"): cv.string,
+        vol.Optional("approved", default=True): cv.boolean,
+        vol.Optional("approved_at"): cv.string,
+        vol.Optional("points_awarded"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+
+@dataclass
+class ImportPlan:
+    """Validated import ready to be applied to storage."""
+
+    children: list[Child] = field(default_factory=list)
+    chores: list[Chore] = field(default_factory=list)
+    rewards: list[Reward] = field(default_factory=list)
+    completions: list[ChoreCompletion] = field(default_factory=list)
+    skipped: int = 0
+
+
+def load_import_file(path: Path) -> dict[str, list[dict[str, Any]]]:
+    """Read a YAML, JSON or CSV import file into sections (blocking).
+
+    CSV files hold every section in one table with a ``type`` column of
+    child, chore, reward or completion; list cells are separated by ``;``.
+    """
+    suffix = path.suffix.lower()
+    with open(path, encoding="utf-8", newline="" if suffix == ".csv" else None) as handle:
+        if suffix in (".yaml", ".yml"):
+            raw = yaml.safe_load(handle) or {}
+        elif suffix == ".json":
+            raw = json.load(handle)
+        elif suffix == ".csv":
+            raw = {section: [] for section in CSV_TYPES.values()}
+            for line, row in enumerate(csv.DictReader(handle), start=2):
+                row_type = (row.pop("type", None) or "").strip().lower()
+                if row_type not in CSV_TYPES:
+                    raise ValueError(f"Line {line}: unknown row type '{row_type}'")
+                # Empty cells fall back to schema defaults
+                raw[CSV_TYPES[row_type]].append(
+                    {key: value for key, value in row.items() if key and value not in ("", None)}
+                )
+        else:
+            raise ValueError(f"Unsupported import file type '{suffix}'")
+
+    if not isinstance(raw, dict):
+        raise ValueError("Import file must contain a mapping of sections")
+    return {section: raw.get(section) or [] for section in CSV_TYPES.values()}
+
+
+def _validate_section(
+    schema: vol.Schema, section: str, items: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Validate every item of a section, reporting the failing entry."""
+    validated = []
+    for position, item in enumerate(items, start=1):
+        try:
+            validated.append(schema(item))
+        except vol.Invalid as err:
+            raise ValueError(f"Invalid {section} entry {position}: {err}") from err
+    return validated
+
+
+def _completion_key(child_id: str, chore_id: str, completed_at: datetime) -> tuple[str, str, int]:
+    """Return the key identifying a completion across imports."""
+    return (child_id, chore_id, int(completed_at.timestamp()))
+
+
+def build_import_plan(
+    raw: dict[str, list[dict[str, Any]]],
+    existing: dict[str, Any],
+    include_history: bool = True,
+) -> ImportPlan:
+    """Validate raw import sections and resolve references (blocking).
+
+    ``existing`` maps each of ``children``, ``chores`` and ``rewards`` to a
+    dict of name -> ID for items already in storage, ``chore_points`` to
+    chore ID -> points for completions that omit ``points_awarded``, and
+    ``completions`` to an iterable of stored completion records. Items whose
+    name or ID already exists are skipped, but can still be referenced by
+    later rows. Completions are skipped when a stored or earlier imported
+    completion has the same child, chore and completion time, so re-running
+    an import never duplicates history.
+    References (``assigned_to``, completion ``child``/``chore``) accept
+    either names or IDs.
+    """
+    plan = ImportPlan()
+    child_ids = dict(existing["children"])
+    chore_ids = dict(existing["chores"])
+    reward_ids = dict(existing["rewards"])
+
+    def resolve(known: dict[str, str], reference: str, what: str) -> str:
+        if reference in known:
+            return known[reference]
+        if reference in known.values():
+            return reference
+        raise ValueError(f"Unknown {what} '{reference}'")
+
+    for item in _validate_section(CHILD_SCHEMA, "children", raw["children"]):
+        if item["name"] in child_ids or item.get("id") in child_ids.values():
+            plan.skipped += 1
+            continue
+        child = Child.from_dict(item)
+        child.total_points_earned = child.points
+        child_ids[child.name] = child.id
+        plan.children.append(child)
+
+    for item in _validate_section(CHORE_SCHEMA, "chores", raw["chores"]):
+        if item["name"] in chore_ids or item.get("id") in chore_ids.values():
+            plan.skipped += 1
+            continue
+        item["assigned_to"] = [
+            resolve(child_ids, ref, "child") for ref in item["assigned_to"]
+        ]
+        chore = Chore.from_dict(item)
+        chore_ids[chore.name] = chore.id
+        plan.chores.append(chore)
+
+    for item in _validate_section(REWARD_SCHEMA, "rewards", raw["rewards"]):
+        if item["name"] in reward_ids or item.get("id") in reward_ids.values():
+            plan.skipped += 1
+            continue
+        item["assigned_to"] = [
+            resolve(child_ids, ref, "child") for ref in item["assigned_to"]
+        ]
+        reward = Reward.from_dict(item)
+        reward_ids[reward.name] = reward.id
+        plan.rewards.append(reward)
+
+    if not include_history:
+        return plan
+
+    chore_points = {chore.id: chore.points for chore in plan.chores}
+    chore_points.update(existing.get("chore_points", {}))
+    known_completions = {
+        _completion_key(record["child_id"], record["chore_id"], completed_at)
+        for record in existing.get("completions", ())
+        if (completed_at := parse_datetime(record.get("completed_at"))) is not None
+    }
+    for position, item in enumerate(
+        _validate_section(COMPLETION_SCHEMA, "completions", raw["completions"]), start=1
+    ):
+        try:
+            completed_at = parse_datetime(item["completed_at"])
+            approved_at = (
+                parse_datetime(item.get("approved_at")) if item["approved"] else None
+            )
+        except ValueError as err:
+            raise ValueError(f"Invalid completions entry {position}: {err}") from err
+        if completed_at is None:
+            raise ValueError(f"Invalid completions entry {position}: missing completed_at")
+        chore_id = resolve(chore_ids, item["chore"], "chore")
+        child_id = resolve(child_ids, item["child"], "child")
+        key = _completion_key(child_id, chore_id, completed_at)
+        if key in known_completions:
+            plan.skipped += 1
+            continue
+        known_completions.add(key)
+        plan.completions.append(
+            ChoreCompletion(
+                chore_id=chore_id,
+                child_id=child_id,
+                completed_at=completed_at,
+                approved=item["approved"],
+                approved_at=approved_at or (completed_at if item["approved"] else None),
+                points_awarded=item.get(
+                    "points_awarded",
+                    chore_points.get(chore_id, 0) if item["approved"] else 0,
+                ),
+            )
+        )
+
+    # Import in time order; storage re-sorts the merged history afterwards
+    plan.completions.sort(key=lambda completion: completion.completed_at)
+    return plan
+
+
+def load_import_plan(
+    path: Path,
+    existing: dict[str, Any],
+    include_history: bool = True,
+) -> ImportPlan:
+    """Read and validate an import file (blocking)."""
+    try:
+        raw = load_import_file(path)
+    except (OSError, yaml.YAMLError, json.JSONDecodeError, csv.Error) as err:
+        raise ValueError(f"Could not read import file {path}: {err}") from err
+    return build_import_plan(raw, existing, include_history)
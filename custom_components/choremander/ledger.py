@@ -0,0 +1,126 @@
+"""Points ledger for Choremander integration."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from .models import PointsTransaction, format_datetime
+
+# Take a balance snapshot after this many transactions
+LEDGER_SNAPSHOT_INTERVAL = 50
+
+
+class PointsLedger:
+    """Append-only ledger of point transactions with periodic snapshots.
+
+    Every change to a child's balance is recorded as a transaction (award,
+    bonus, penalty, reversal, claim, refund). Every LEDGER_SNAPSHOT_INTERVAL
+    transactions the balance of every child is snapshotted, so a balance is
+    the last snapshot plus the short tail of transactions after it.
+
+    The ledger operates directly on the lists stored in the storage data, so
+    appended entries are persisted with the next storage save. Entries before
+    the last snapshot are settled: storage moves them to the ledger archive
+    and ``compact`` drops them, leaving only the last snapshot and its tail in
+    the store.
+    """
+
+    def __init__(
+        self, entries: list[dict[str, Any]], snapshots: list[dict[str, Any]]
+    ) -> None:
+        """Initialize the ledger over stored entries and snapshots."""
+        self._entries = entries
+        self._snapshots = snapshots
+        self._by_ref: dict[str, list[int]] = {}
+        self._index_refs()
+
+    def _index_refs(self) -> None:
+        """Index the stored entries by the record that caused them."""
+        self._by_ref.clear()
+        for position, entry in enumerate(self._entries):
+            if ref_id := entry.get("ref_id"):
+                self._by_ref.setdefault(ref_id, []).append(position)
+
+    def __len__(self) -> int:
+        """Return the number of transactions."""
+        return len(self._entries)
+
+    def _snapshot_position(self) -> int:
+        """Return the ledger position covered by the last snapshot."""
+        return self._snapshots[-1]["position"] if self._snapshots else 0
+
+    def _balances(self) -> dict[str, int]:
+        """Return the current balance of every child."""
+        balances = dict(self._snapshots[-1]["balances"]) if self._snapshots else {}
+        for entry in self._entries[self._snapshot_position():]:
+            child_id = entry["child_id"]
+            balances[child_id] = balances.get(child_id, 0) + entry["amount"]
+        return balances
+
+    def balance(self, child_id: str) -> int:
+        """Return a child's balance from the last snapshot plus the tail."""
+        balance = (
+            self._snapshots[-1]["balances"].get(child_id, 0) if self._snapshots else 0
+        )
+        for entry in self._entries[self._snapshot_position():]:
+            if entry["child_id"] == child_id:
+                balance += entry["amount"]
+        return balance
+
+    def append(self, transaction: PointsTransaction) -> None:
+        """Append a transaction, snapshotting balances when due."""
+        if transaction.ref_id:
+            self._by_ref.setdefault(transaction.ref_id, []).append(len(self._entries))
+        self._entries.append(transaction.to_dict())
+
+        if len(self._entries) - self._snapshot_position() >= LEDGER_SNAPSHOT_INTERVAL:
+            self.snapshot(transaction.created_at)
+
+    def snapshot(self, at: datetime) -> None:
+        """Record the balance of every child at the current position."""
+        self._snapshots.append(
+            {
+                "position": len(self._entries),
+                "created_at": format_datetime(at),
+                "balances": self._balances(),
+            }
+        )
+
+    def settled(self) -> list[dict[str, Any]]:
+        """Return the stored entries covered by the last snapshot."""
+        return self._entries[: self._snapshot_position()]
+
+    def compact(self, count: int) -> None:
+        """Drop the first ``count`` settled entries and every older snapshot.
+
+        Call once those entries are safely archived. Balances are unchanged,
+        since the last snapshot already includes them.
+        """
+        count = min(count, self._snapshot_position())
+        del self._entries[:count]
+        del self._snapshots[:-1]
+        if self._snapshots:
+            self._snapshots[-1]["position"] -= count
+        self._index_refs()
+
+    def amount_for_ref(self, ref_id: str) -> int:
+        """Return the net amount of every stored transaction caused by a record."""
+        return sum(
+            self._entries[position]["amount"]
+            for position in self._by_ref.get(ref_id, [])
+        )
+
+    def iter_transactions(self, child_id: str | None = None) -> Iterator[PointsTransaction]:
+        """Yield stored transactions, newest first, optionally for a single child."""
+        for entry in reversed(self._entries):
+            if child_id and entry["child_id"] != child_id:
+                continue
+            yield PointsTransaction.from_dict(entry)
+
+    def transactions(
+        self, child_id: str | None = None, limit: int | None = None
+    ) -> list[PointsTransaction]:
+        """Return stored transactions, newest first, optionally for a single child."""
+        return list(islice(self.iter_transactions(child_id), limit))
@@ -6,6 +6,8 @@ from datetime import datetime, timezone
 from typing import Any
 import uuid
 
+from .const import PRICING_VERSION
+
 
 def generate_id() -> str:
     """Generate a unique ID."""
@@ -165,12 +167,6 @@ class Reward:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Reward:
         """Create a Reward from a dictionary."""
-        # Handle migration from old is_dynamic field
-        override_point_value = data.get("override_point_value", None)
-        if override_point_value is None:
-            # Migrate from is_dynamic: if is_dynamic was True, override is False; if is_dynamic was False, override is True
-            old_is_dynamic = data.get("is_dynamic", False)
-            override_point_value = not old_is_dynamic
         return cls(
             name=data.get("name", ""),
             cost=data.get("cost", 50),
@@ -178,7 +174,7 @@ class Reward:
             icon=data.get("icon", "mdi:gift"),
             assigned_to=data.get("assigned_to", []),
             is_jackpot=data.get("is_jackpot", False),
-            override_point_value=override_point_value,
+            override_point_value=data.get("override_point_value", False),
             days_to_goal=data.get("days_to_goal", 30),
             id=data.get("id", generate_id()),
         )
@@ -248,6 +244,9 @@ class RewardClaim:
     claimed_at: datetime
     approved: bool = False
     approved_at: datetime | None = None
+    cost: int = 0  # Points actually charged for this claim
+    pricing: dict[str, Any] = field(default_factory=dict)  # Pricing inputs at claim time
+    pricing_version: int = PRICING_VERSION
     id: str = field(default_factory=generate_id)
 
     @classmethod
@@ -262,6 +261,9 @@ class RewardClaim:
             claimed_at=claimed_at or datetime.now(timezone.utc),
             approved=data.get("approved", False),
             approved_at=approved_at,
+            cost=data.get("cost", 0),
+            pricing=data.get("pricing", {}),
+            pricing_version=data.get("pricing_version", PRICING_VERSION),
             id=data.get("id", generate_id()),
         )
 
@@ -273,5 +275,93 @@ class RewardClaim:
             "claimed_at": format_datetime(self.claimed_at),
             "approved": self.approved,
             "approved_at": format_datetime(self.approved_at),
+            "cost": self.cost,
+            "pricing": self.pricing,
+            "pricing_version": self.pricing_version,
+            "id": self.id,
+        }
+
+
+@dataclass
+class PointsTransaction:
+    """Represents a single entry in the points ledger."""
+
+    child_id: str
+    amount: int  # Signed change to the child's balance
+    kind: str  # opening, award, bonus, penalty, reversal, claim, refund
+    created_at: datetime
+    reason: str = ""
+    ref_id: str | None = None  # Completion or claim ID that caused this entry
+    id: str = field(default_factory=generate_id)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PointsTransaction:
+        """Create a PointsTransaction from a dictionary."""
+        created_at = parse_datetime(data.get("created_at"))
+
+        return cls(
+            child_id=data.get("child_id", ""),
+            amount=data.get("amount", 0),
+            kind=data.get("kind", ""),
+            created_at=created_at or datetime.now(timezone.utc),
+            reason=data.get("reason", ""),
+            ref_id=data.get("ref_id"),
+            id=data.get("id", generate_id()),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "child_id": self.child_id,
+            "amount": self.amount,
+            "kind": self.kind,
+            "created_at": format_datetime(self.created_at),
+            "reason": self.reason,
+            "ref_id": self.ref_id,
+            "id": self.id,
+        }
+
+
+@dataclass
+class ApprovalRule:
+    """Represents a rule that auto-approves matching chore completions.
+
+    Every set criterion must match; empty lists and unset values match
+    anything.
+    """
+
+    name: str = ""
+    chore_ids: list[str] = field(default_factory=list)
+    child_ids: list[str] = field(default_factory=list)
+    max_points: int | None = None  # Only chores worth at most this many points
+    after: str | None = None  # Local time of day "HH:MM:SS" the window opens
+    before: str | None = None  # Local time of day "HH:MM:SS" the window closes
+    conditions: list[dict[str, Any]] = field(default_factory=list)  # HA conditions
+    id: str = field(default_factory=generate_id)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ApprovalRule:
+        """Create an ApprovalRule from a dictionary."""
+        return cls(
+            name=data.get("name", ""),
+            chore_ids=data.get("chore_ids", []),
+            child_ids=data.get("child_ids", []),
+            max_points=data.get("max_points"),
+            after=data.get("after"),
+            before=data.get("before"),
+            conditions=data.get("conditions", []),
+            id=data.get("id", generate_id()),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "chore_ids": self.chore_ids,
+            "child_ids": self.child_ids,
+            "max_points": self.max_points,
+            "after": self.after,
+            "before": self.before,
+            "conditions": self.conditions,
             "id": self.id,
         }
@@ -0,0 +1,154 @@
+"""Reward pricing for Choremander integration."""
+from __future__ import annotations
+
+import logging
+
+from .models import Child, Chore, Reward
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def calculate_reward_costs(
+    reward: Reward,
+    all_children: list[Child],
+    all_chores: list[Chore],
+    daily_points: dict[str, float] | None = None,
+) -> dict[str, int]:
+    """Calculate the dynamic cost of a reward for each child.
+
+    By default, all rewards use dynamic pricing. If override_point_value is True,
+    the manual cost is used instead.
+
+    For non-jackpot rewards, each child has their own calculated cost based on
+    their specific chores and completion rates.
+
+    For jackpot rewards, all children share the same cost (sum of all daily points).
+
+    Pass ``daily_points`` from calculate_child_daily_points when the caller
+    also needs them, so the chores are only walked once.
+
+    Returns:
+        Dict mapping child_id to their calculated cost for this reward.
+        For jackpot rewards, all children have the same value.
+    """
+    result: dict[str, int] = {}
+
+    _LOGGER.debug(
+        "calculate_reward_costs: reward=%s, override=%s, days_to_goal=%s, cost=%s, assigned_to=%s",
+        reward.name,
+        getattr(reward, 'override_point_value', False),
+        getattr(reward, 'days_to_goal', 30),
+        reward.cost,
+        reward.assigned_to
+    )
+    _LOGGER.debug("calculate_reward_costs: found %d children, %d chores", len(all_children), len(all_chores))
+
+    # Determine which children are assigned to this reward
+    if reward.assigned_to:
+        assigned_children = [c for c in all_children if c.id in reward.assigned_to]
+    else:
+        assigned_children = all_children
+
+    _LOGGER.debug("calculate_reward_costs: assigned_children=%s", [c.name for c in assigned_children])
+
+    if not assigned_children:
+        _LOGGER.debug("calculate_reward_costs: no assigned children, returning empty")
+        return result
+
+    # If override is enabled, use the manual cost for all children
+    if getattr(reward, 'override_point_value', False):
+        _LOGGER.debug("calculate_reward_costs: override enabled, using manual cost %d", reward.cost)
+        for child in assigned_children:
+            result[child.id] = reward.cost
+        return result
+
+    # Get days_to_goal with a sensible default
+    days_to_goal = getattr(reward, 'days_to_goal', 30)
+    if days_to_goal <= 0:
+        days_to_goal = 30
+
+    if not all_chores:
+        # Fall back to static cost if no chores
+        _LOGGER.debug("calculate_reward_costs: no chores, falling back to cost %d", reward.cost)
+        for child in assigned_children:
+            result[child.id] = reward.cost
+        return result
+
+    # Daily expected points for each child
+    child_daily_points = (
+        daily_points
+        if daily_points is not None
+        else calculate_child_daily_points(reward, all_children, all_chores)
+    )
+    _LOGGER.debug("calculate_reward_costs: daily_points=%s", child_daily_points)
+
+    # Calculate costs based on whether this is a jackpot reward
+    if reward.is_jackpot:
+        # Jackpot: sum of ALL children's daily points, same cost for everyone
+        total_daily_points = sum(child_daily_points.values())
+        jackpot_cost = max(1, round(total_daily_points * days_to_goal))
+        _LOGGER.debug(
+            "calculate_reward_costs: jackpot total_daily=%.2f, cost=%d",
+            total_daily_points, jackpot_cost
+        )
+        for child in assigned_children:
+            result[child.id] = jackpot_cost
+    else:
+        # Non-jackpot: each child has their own cost based on their chores
+        for child in assigned_children:
+            daily_pts = child_daily_points.get(child.id, 0)
+            if daily_pts > 0:
+                calculated = max(1, round(daily_pts * days_to_goal))
+                result[child.id] = calculated
+                _LOGGER.debug(
+                    "calculate_reward_costs: child=%s, daily=%.2f * days=%d = %d",
+                    child.name, daily_pts, days_to_goal, calculated
+                )
+            else:
+                result[child.id] = reward.cost  # Fall back to manual cost
+                _LOGGER.debug(
+                    "calculate_reward_costs: child=%s, no daily points, fallback to %d",
+                    child.name, reward.cost
+                )
+
+    _LOGGER.debug("calculate_reward_costs: final result for %s = %s", reward.name, result)
+    return result
+
+
+def calculate_child_daily_points(
+    reward: Reward, all_children: list[Child], all_chores: list[Chore]
+) -> dict[str, float]:
+    """Get the daily expected points for each child assigned to a reward.
+
+    This is used to calculate weighted contributions for jackpot rewards.
+    Returns a dict mapping child_id to their daily expected points.
+    """
+    result: dict[str, float] = {}
+
+    # Determine which children are assigned to this reward
+    if reward.assigned_to:
+        assigned_children = [c for c in all_children if c.id in reward.assigned_to]
+    else:
+        assigned_children = all_children
+
+    if not assigned_children or not all_chores:
+        return result
+
+    for child in assigned_children:
+        daily_points = 0.0
+
+        for chore in all_chores:
+            # Check if this chore is assigned to this child
+            # Empty assigned_to means all children can do it
+            if chore.assigned_to and child.id not in chore.assigned_to:
+                continue
+
+            # completion_percentage_per_month: 100 = daily, 50 = every other day, etc.
+            # Formula: points * (completion_percentage / 100)
+            completion_pct = chore.completion_percentage_per_month
+            daily_expected = chore.points * (completion_pct / 100)
+            daily_points += daily_expected
+
+        result[child.id] = daily_points
+
+    return result
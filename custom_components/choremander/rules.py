@@ -0,0 +1,127 @@
+"""Auto-approval rules for Choremander integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, time
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import condition, config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .models import ApprovalRule, Chore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _time_string(value: time) -> str:
+    """Store a validated time of day as an ISO string."""
+    return value.isoformat()
+
+
+RULE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("name", default=""): cv.string,
+        vol.Optional("chore_ids", default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("child_ids", default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("max_points"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("after"): vol.All(cv.time, _time_string),
+        vol.Optional("before"): vol.All(cv.time, _time_string),
+        vol.Optional("conditions", default=[]): vol.All(cv.ensure_list, [dict]),
+    }
+)
+
+
+@dataclass
+class _CompiledRule:
+    """An approval rule with its time window and conditions ready to evaluate."""
+
+    rule: ApprovalRule
+    after: time | None
+    before: time | None
+    check_conditions: condition.ConditionCheckerType | None
+
+    def matches(self, chore: Chore, child_id: str, now: time) -> bool:
+        """Return True if a completion of a chore by a child matches."""
+        rule = self.rule
+        if rule.chore_ids and chore.id not in rule.chore_ids:
+            return False
+        if rule.child_ids and child_id not in rule.child_ids:
+            return False
+        if rule.max_points is not None and chore.points > rule.max_points:
+            return False
+        if self.after and self.before and self.after > self.before:
+            # Window wraps past midnight, e.g. 20:00 to 06:00
+            if self.before <= now < self.after:
+                return False
+        else:
+            if self.after and now < self.after:
+                return False
+            if self.before and now >= self.before:
+                return False
+        if self.check_conditions is None:
+            return True
+        return bool(
+            self.check_conditions({"chore_id": chore.id, "child_id": child_id})
+        )
+
+
+class AutoApprovalRules:
+    """Rules that approve chore completions as soon as they are recorded.
+
+    Rules are compiled once when set, including any Home Assistant
+    conditions, so matching a completion is an in-process check with no
+    storage access.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize with no rules."""
+        self.hass = hass
+        self._compiled: list[_CompiledRule] = []
+
+    @property
+    def rules(self) -> list[ApprovalRule]:
+        """Return the active rules."""
+        return [compiled.rule for compiled in self._compiled]
+
+    async def async_set_rules(self, rules: list[ApprovalRule]) -> None:
+        """Compile and activate rules, replacing the current ones.
+
+        Raises ValueError, leaving the current rules active, if any rule's
+        conditions are invalid.
+        """
+        compiled = []
+        for rule in rules:
+            check_conditions = None
+            if rule.conditions:
+                try:
+                    config = await condition.async_validate_conditions_config(
+                        self.hass, cv.CONDITIONS_SCHEMA(rule.conditions)
+                    )
+                    check_conditions = await condition.async_conditions_from_config(
+                        self.hass, config, _LOGGER, f"approval rule {rule.name or rule.id}"
+                    )
+                except (vol.Invalid, HomeAssistantError) as err:
+                    raise ValueError(
+                        f"Invalid conditions in approval rule {rule.name or rule.id}: {err}"
+                    ) from err
+            compiled.append(
+                _CompiledRule(
+                    rule,
+                    dt_util.parse_time(rule.after) if rule.after else None,
+                    dt_util.parse_time(rule.before) if rule.before else None,
+                    check_conditions,
+                )
+            )
+        self._compiled = compiled
+
+    def match(self, chore: Chore, child_id: str, now: datetime) -> ApprovalRule | None:
+        """Return the first rule approving a completion, if any."""
+        local_time = dt_util.as_local(now).time()
+        for compiled in self._compiled:
+            if compiled.matches(chore, child_id, local_time):
+                return compiled.rule
+        return None
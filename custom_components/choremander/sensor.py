@@ -7,6 +7,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -17,7 +18,7 @@ from datetime import datetime
 import logging
 
 from .const import DOMAIN
-from .coordinator import ChoremanderCoordinator
+from .coordinator import ChildView, ChoremanderCoordinator
 from .models import Child, Chore, Reward
 
 _LOGGER = logging.getLogger(__name__)
@@ -120,30 +121,21 @@ class ChoremandorOverallStatsSensor(ChoremandorBaseSensor):
         total_points = sum(c.points for c in children)
         total_chores_completed = sum(c.total_chores_completed for c in children)
 
-        # Get all completions and pending completions
-        all_completions = data.get("completions", [])
+        # Today's completions (both approved and pending) are pre-filtered by
+        # the coordinator from the columnar history
+        todays_completion_records = data.get("todays_completions", [])
         pending_completions = data.get("pending_completions", [])
 
-        # Build today's completions summary (both approved and pending)
-        # Use HA timezone-aware datetime for proper date comparison
-        now = dt_util.now()
-        today = now.date()
-        todays_completions = []
-        for comp in all_completions:
-            # Convert completion time to HA timezone for proper date comparison
-            comp_dt = comp.completed_at
-            if hasattr(comp_dt, 'astimezone'):
-                # If timezone-aware, convert to HA timezone
-                comp_dt = dt_util.as_local(comp_dt)
-            comp_date = comp_dt.date() if hasattr(comp_dt, 'date') else comp_dt
-            if comp_date == today:
-                todays_completions.append({
-                    "completion_id": comp.id,
-                    "chore_id": comp.chore_id,
-                    "child_id": comp.child_id,
-                    "approved": comp.approved,
-                    "completed_at": comp.completed_at.isoformat() if hasattr(comp.completed_at, 'isoformat') else str(comp.completed_at),
-                })
+        todays_completions = [
+            {
+                "completion_id": comp.id,
+                "chore_id": comp.chore_id,
+                "child_id": comp.child_id,
+                "approved": comp.approved,
+                "completed_at": comp.completed_at.isoformat(),
+            }
+            for comp in todays_completion_records
+        ]
 
         # Calculate pending points per child
         pending_points_by_child = {}
@@ -220,11 +212,22 @@ class ChoremandorOverallStatsSensor(ChoremandorBaseSensor):
             "total_chores_completed": total_chores_completed,
             "points_name": data.get("points_name", "Stars"),
             "points_icon": data.get("points_icon", "mdi:star"),
-            "children": [{"id": c.id, "name": c.name, "points": c.points, "pending_points": pending_points_by_child.get(c.id, 0), "chore_order": c.chore_order} for c in children],
+            "children": [
+                {
+                    "id": c.id,
+                    "name": c.name,
+                    "avatar": c.avatar,
+                    "points": c.points,
+                    "pending_points": pending_points_by_child.get(c.id, 0),
+                    "chore_order": c.chore_order,
+                    "entity_id": self._child_entity_id(c.id),
+                }
+                for c in children
+            ],
             "chores": chores_list,
             "rewards": rewards_list,
             "todays_completions": todays_completions,
-            "total_completions_all_time": len(all_completions),
+            "total_completions_all_time": data.get("total_completions", 0),
             "total_pending_completions": len(pending_completions),
         }
 
@@ -233,9 +236,15 @@ class ChoremandorOverallStatsSensor(ChoremandorBaseSensor):
         """Return the icon."""
         return "mdi:clipboard-check-multiple"
 
+    def _child_entity_id(self, child_id: str) -> str | None:
+        """Return the entity ID of a child's points sensor, so cards need not search for it."""
+        return er.async_get(self.hass).async_get_entity_id(
+            "sensor", DOMAIN, f"{self._entry.entry_id}_{child_id}_points"
+        )
+
 
-class ChildPointsSensor(ChoremandorBaseSensor):
-    """Sensor for a child's points."""
+class ChoremanderChildSensor(ChoremandorBaseSensor):
+    """Base class for sensors bound to one child's view of the snapshot."""
 
     def __init__(
         self,
@@ -246,6 +255,35 @@ class ChildPointsSensor(ChoremandorBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self.child_id = child.id
+        self._written_key: tuple[int | None, bool] | None = None
+
+    @property
+    def _view(self) -> ChildView | None:
+        """Return this child's view of the current snapshot."""
+        return self.coordinator.data.get("child_views", {}).get(self.child_id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this child's view or availability changed."""
+        view = self._view
+        key = (view.version if view else None, self.coordinator.last_update_success)
+        if key == self._written_key:
+            return
+        self._written_key = key
+        super()._handle_coordinator_update()
+
+
+class ChildPointsSensor(ChoremanderChildSensor):
+    """Sensor for a child's points."""
+
+    def __init__(
+        self,
+        coordinator: ChoremandorCoordinator,
+        entry: ConfigEntry,
+        child: Child,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, child)
         self._attr_unique_id = f"{entry.entry_id}_{child.id}_points"
         self._attr_name = f"{child.name} Points"
         self._attr_state_class = SensorStateClass.TOTAL
@@ -253,25 +291,28 @@ class ChildPointsSensor(ChoremandorBaseSensor):
     @property
     def native_value(self) -> int:
         """Return the child's current points."""
-        child = self.coordinator.get_child(self.child_id)
-        return child.points if child else 0
+        view = self._view
+        return view.child.points if view else 0
 
     @property
     def native_unit_of_measurement(self) -> str:
         """Return the unit of measurement."""
-        return self.coordinator.data.get("points_name", "Stars")
+        view = self._view
+        return view.points_name if view else "Stars"
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        return self.coordinator.data.get("points_icon", "mdi:star")
+        view = self._view
+        return view.points_icon if view else "mdi:star"
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional attributes."""
-        child = self.coordinator.get_child(self.child_id)
-        if not child:
+        view = self._view
+        if not view:
             return {}
+        child = view.child
 
         return {
             "child_id": child.id,
@@ -284,7 +325,7 @@ class ChildPointsSensor(ChoremandorBaseSensor):
         }
 
 
-class ChildStatsSensor(ChoremandorBaseSensor):
+class ChildStatsSensor(ChoremanderChildSensor):
     """Sensor for a child's statistics."""
 
     def __init__(
@@ -294,8 +335,7 @@ class ChildStatsSensor(ChoremandorBaseSensor):
         child: Child,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry)
-        self.child_id = child.id
+        super().__init__(coordinator, entry, child)
         self._attr_unique_id = f"{entry.entry_id}_{child.id}_stats"
         self._attr_name = f"{child.name} Stats"
         self._attr_state_class = SensorStateClass.TOTAL
@@ -303,8 +343,8 @@ class ChildStatsSensor(ChoremandorBaseSensor):
     @property
     def native_value(self) -> int:
         """Return the child's total chores completed."""
-        child = self.coordinator.get_child(self.child_id)
-        return child.total_chores_completed if child else 0
+        view = self._view
+        return view.child.total_chores_completed if view else 0
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -314,19 +354,17 @@ class ChildStatsSensor(ChoremandorBaseSensor):
     @property
     def icon(self) -> str:
         """Return the icon."""
-        child = self.coordinator.get_child(self.child_id)
-        return child.avatar if child else "mdi:account-circle"
+        view = self._view
+        return view.child.avatar if view else "mdi:account-circle"
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional attributes."""
-        child = self.coordinator.get_child(self.child_id)
-        if not child:
+        view = self._view
+        if not view:
             return {}
-
-        # Get chores assigned to this child
-        chores = self.coordinator.data.get("chores", [])
-        assigned_chores = [c for c in chores if child.id in c.assigned_to or not c.assigned_to]
+        child = view.child
+        assigned_chores = view.assigned_chores
 
         return {
             "child_id": child.id,
@@ -403,7 +441,7 @@ class PendingApprovalsSensor(ChoremandorBaseSensor):
                     "child_id": child.id,
                     "reward_name": reward.name,
                     "reward_id": reward.id,
-                    "cost": reward.cost,
+                    "cost": claim.cost,
                     "claimed_at": claim.claimed_at.isoformat(),
                 })
 
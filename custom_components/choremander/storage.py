@@ -1,21 +1,207 @@
 """Storage management for Choremander integration."""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timezone
+import itertools
 import logging
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
-from .models import Child, Chore, ChoreCompletion, Reward, RewardClaim
+from .archive import CompletionArchive, LedgerArchive
+from .const import DEFAULT_APPROVAL_EXPIRY_DAYS, DEFAULT_AUTO_APPROVE_HOURS, DOMAIN
+from .history import CompletionHistory
+from .ledger import PointsLedger
+from .models import (
+    ApprovalRule,
+    Child,
+    Chore,
+    ChoreCompletion,
+    PointsTransaction,
+    Reward,
+    RewardClaim,
+    format_datetime,
+)
+from .pricing import calculate_reward_costs
 
 _LOGGER = logging.getLogger(__name__)
 
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
+STORAGE_MINOR_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}.storage"
 
 
+def _migrate_assigned_to_child_ids(data: dict[str, Any]) -> dict[str, Any]:
+    """Migrate chore assigned_to from child names to child IDs.
+
+    This handles legacy data where assigned_to might contain child names
+    instead of child IDs.
+    """
+    children = data.get("children", [])
+    chores = data.get("chores", [])
+
+    if not children or not chores:
+        return data
+
+    # Build a map of child name -> child ID for migration
+    name_to_id = {}
+    valid_ids = set()
+    for child in children:
+        child_id = child.get("id", "")
+        child_name = child.get("name", "")
+        if child_id:
+            valid_ids.add(child_id)
+        if child_name and child_id:
+            name_to_id[child_name] = child_id
+
+    for chore in chores:
+        assigned_to = chore.get("assigned_to", [])
+        if not assigned_to:
+            continue
+
+        new_assigned_to = []
+        for assignment in assigned_to:
+            if assignment in valid_ids:
+                # Already a valid child ID
+                new_assigned_to.append(assignment)
+            elif assignment in name_to_id:
+                # This is a child name, convert to ID
+                new_assigned_to.append(name_to_id[assignment])
+                _LOGGER.warning(
+                    "Migrating chore '%s' assigned_to: '%s' -> '%s' (name to ID)",
+                    chore.get("name", "unknown"),
+                    assignment,
+                    name_to_id[assignment]
+                )
+            else:
+                # Unknown value, keep it but log a warning
+                new_assigned_to.append(assignment)
+                _LOGGER.warning(
+                    "Chore '%s' has unknown assigned_to value: '%s'",
+                    chore.get("name", "unknown"),
+                    assignment
+                )
+        chore["assigned_to"] = new_assigned_to
+
+    return data
+
+
+def _migrate_reward_override_point_value(data: dict[str, Any]) -> dict[str, Any]:
+    """Replace the legacy reward is_dynamic flag with override_point_value."""
+    for reward in data.get("rewards", []):
+        if "override_point_value" not in reward:
+            # is_dynamic True means no override; missing is_dynamic means override
+            reward["override_point_value"] = not reward.get("is_dynamic", False)
+        reward.pop("is_dynamic", None)
+    return data
+
+
+def _migrate_seed_points_ledger(data: dict[str, Any]) -> dict[str, Any]:
+    """Seed the points ledger with an opening balance for each child."""
+    now = datetime.now(timezone.utc)
+    entries = data.setdefault("ledger", [])
+    balances: dict[str, int] = {}
+    for child in data.get("children", []):
+        child_id = child.get("id", "")
+        points = child.get("points", 0)
+        if points:
+            entries.append(
+                PointsTransaction(
+                    child_id=child_id,
+                    amount=points,
+                    kind="opening",
+                    created_at=now,
+                    reason="Opening balance",
+                ).to_dict()
+            )
+        balances[child_id] = points
+    data.setdefault("ledger_snapshots", []).append(
+        {"position": len(entries), "created_at": format_datetime(now), "balances": balances}
+    )
+    return data
+
+
+def _migrate_reward_claim_cost(data: dict[str, Any]) -> dict[str, Any]:
+    """Record the charged price on existing reward claims.
+
+    Uses the claim's ledger entries when present, otherwise prices the claim
+    once with the current pricing. Pricing inputs are unknown for these claims,
+    so they are recorded with pricing version 0.
+    """
+    charged: dict[str, int] = {}
+    for entry in data.get("ledger", []):
+        if entry.get("kind") == "claim" and entry.get("ref_id"):
+            charged[entry["ref_id"]] = charged.get(entry["ref_id"], 0) - entry["amount"]
+
+    children = [Child.from_dict(c) for c in data.get("children", [])]
+    chores = [Chore.from_dict(c) for c in data.get("chores", [])]
+    rewards = {r.get("id"): Reward.from_dict(r) for r in data.get("rewards", [])}
+
+    for claim in data.get("reward_claims", []):
+        if "cost" in claim:
+            continue
+        if claim.get("id") in charged:
+            cost = charged[claim["id"]]
+        elif reward := rewards.get(claim.get("reward_id")):
+            cost = calculate_reward_costs(reward, children, chores).get(
+                claim.get("child_id", ""), reward.cost
+            )
+        else:
+            cost = 0
+        claim["cost"] = cost
+        claim["pricing"] = {}
+        claim["pricing_version"] = 0
+    return data
+
+
+def _migrate_columnar_completions(data: dict[str, Any]) -> dict[str, Any]:
+    """Store completions as flat columns instead of one dict per completion.
+
+    This is a major version bump: older releases would read the missing
+    completions list as an empty history and overwrite it on their next save.
+    """
+    history = CompletionHistory.from_dicts(data.pop("completions", []))
+    data["completion_history"] = history.to_columns()
+    return data
+
+
+# (major, minor) version -> migration that upgrades data from the version
+# before it. Each migration runs exactly once, when older data is loaded.
+MIGRATIONS: dict[tuple[int, int], Callable[[dict[str, Any]], dict[str, Any]]] = {
+    (1, 2): _migrate_assigned_to_child_ids,
+    (1, 3): _migrate_reward_override_point_value,
+    (1, 4): _migrate_seed_points_ledger,
+    (1, 5): _migrate_reward_claim_cost,
+    (2, 1): _migrate_columnar_completions,
+}
+
+
+class ChoremanderStore(Store[dict[str, Any]]):
+    """Store that upgrades Choremander data through versioned migrations."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Run every migration newer than the stored minor version."""
+        if old_major_version > STORAGE_VERSION:
+            raise NotImplementedError(
+                f"Cannot downgrade Choremander storage from version {old_major_version}"
+            )
+
+        old_version = (old_major_version, old_minor_version)
+        data = old_data
+        for version in sorted(MIGRATIONS):
+            if old_version < version <= (STORAGE_VERSION, STORAGE_MINOR_VERSION):
+                _LOGGER.info("Migrating Choremander storage to version %s.%s", *version)
+                data = MIGRATIONS[version](data)
+        return data
+
+
 class ChoremanderStorage:
     """Manage Choremander data storage."""
 
@@ -23,8 +209,19 @@ class ChoremanderStorage:
         """Initialize storage."""
         self.hass = hass
         self.entry_id = entry_id
-        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        self._store = ChoremanderStore(
+            hass,
+            STORAGE_VERSION,
+            f"{STORAGE_KEY}.{entry_id}",
+            minor_version=STORAGE_MINOR_VERSION,
+        )
         self._data: dict[str, Any] = {}
+        self._history = CompletionHistory()
+        self.ledger = PointsLedger([], [])
+        archive_path = hass.config.path(".storage", f"{STORAGE_KEY}.archive.{entry_id}")
+        self.archive = CompletionArchive(hass, archive_path)
+        self.ledger_archive = LedgerArchive(hass, archive_path)
+        self._archived_count = 0
 
     async def async_load(self) -> dict[str, Any]:
         """Load data from storage."""
@@ -34,91 +231,84 @@ class ChoremanderStorage:
                 "children": [],
                 "chores": [],
                 "rewards": [],
-                "completions": [],
+                "completion_history": {},
                 "reward_claims": [],
+                "ledger": [],
+                "ledger_snapshots": [],
                 "points_name": "Stars",
                 "points_icon": "mdi:star",
             }
+        # Completions live in the columnar history rather than the raw dict
+        self._history = CompletionHistory.from_columns(data.pop("completion_history", {}))
         self._data = data
-
-        # Run data migrations
-        await self._migrate_assigned_to_child_ids()
+        self.ledger = PointsLedger(
+            data.setdefault("ledger", []), data.setdefault("ledger_snapshots", [])
+        )
+        self._archived_count = await self.hass.async_add_executor_job(self.archive.count)
 
         return data
 
-    async def _migrate_assigned_to_child_ids(self) -> None:
-        """Migrate chore assigned_to from child names to child IDs if needed.
+    async def async_archive_completions(self, before: datetime) -> int:
+        """Move approved completions older than ``before`` to the archive.
 
-        This handles legacy data where assigned_to might contain child names
-        instead of child IDs.
+        Rows are written to the archive before being dropped from the store,
+        so an interrupted run never loses history, and rows the archive
+        already holds are skipped, so re-running it never duplicates history.
         """
-        children = self._data.get("children", [])
-        chores = self._data.get("chores", [])
-
-        if not children or not chores:
+        history = self._history
+        candidates = history.by_date_range(end=before)
+        pending = set(history.pending(candidates))
+        rows = [row for row in candidates if row not in pending]
+        if not rows:
+            return 0
+
+        archived = await self.archive.async_write_records(list(history.iter_dicts(rows)))
+        self._archived_count += archived
+        history.remove_rows(rows)
+        await self.async_save()
+        _LOGGER.info("Archived %d completions older than %s", archived, before)
+        return archived
+
+    async def _async_compact_ledger(self) -> None:
+        """Move ledger entries covered by the last snapshot to the archive.
+
+        Entries are archived before being dropped from the store, and the
+        archive skips positions it already holds, so an interrupted run never
+        loses or duplicates transactions.
+        """
+        settled = self.ledger.settled()
+        if not settled:
             return
-
-        # Build a map of child name -> child ID for migration
-        name_to_id = {}
-        valid_ids = set()
-        for child in children:
-            child_id = child.get("id", "")
-            child_name = child.get("name", "")
-            if child_id:
-                valid_ids.add(child_id)
-            if child_name and child_id:
-                name_to_id[child_name] = child_id
-
-        # Check and migrate each chore's assigned_to
-        data_modified = False
-        for chore in chores:
-            assigned_to = chore.get("assigned_to", [])
-            if not assigned_to:
-                continue
-
-            new_assigned_to = []
-            chore_modified = False
-
-            for assignment in assigned_to:
-                if assignment in valid_ids:
-                    # Already a valid child ID
-                    new_assigned_to.append(assignment)
-                elif assignment in name_to_id:
-                    # This is a child name, convert to ID
-                    new_assigned_to.append(name_to_id[assignment])
-                    chore_modified = True
-                    _LOGGER.warning(
-                        "Migrating chore '%s' assigned_to: '%s' -> '%s' (name to ID)",
-                        chore.get("name", "unknown"),
-                        assignment,
-                        name_to_id[assignment]
-                    )
-                else:
-                    # Unknown value, keep it but log a warning
-                    new_assigned_to.append(assignment)
-                    _LOGGER.warning(
-                        "Chore '%s' has unknown assigned_to value: '%s'",
-                        chore.get("name", "unknown"),
-                        assignment
-                    )
-
-            if chore_modified:
-                chore["assigned_to"] = new_assigned_to
-                data_modified = True
-
-        if data_modified:
-            _LOGGER.info("Data migration completed: converted child names to IDs in assigned_to")
-            await self.async_save()
+        offset = self._data.get("ledger_offset", 0)
+        await self.ledger_archive.async_write_entries(offset, settled)
+        if self._data.get("ledger_offset", 0) != offset:
+            # A concurrent save already compacted these entries
+            return
+        self.ledger.compact(len(settled))
+        self._data["ledger_offset"] = offset + len(settled)
 
     async def async_save(self) -> None:
         """Save data to storage."""
-        await self._store.async_save(self._data)
+        await self._async_compact_ledger()
+        await self._store.async_save(
+            {**self._data, "completion_history": self._history.to_columns()}
+        )
 
     @property
     def data(self) -> dict[str, Any]:
         """Return current data."""
         return self._data
 
+    @property
+    def history(self) -> CompletionHistory:
+        """Return the columnar completion history."""
+        return self._history
+
+    @property
+    def total_completions(self) -> int:
+        """Return the all-time completion count, archived rows included."""
+        return self._archived_count + len(self._history)
+
     # Children management
     def get_children(self) -> list[Child]:
         """Get all children."""
@@ -222,31 +412,57 @@ class ChoremanderStorage:
     # Completions management
     def get_completions(self) -> list[ChoreCompletion]:
         """Get all chore completions."""
-        return [ChoreCompletion.from_dict(c) for c in self._data.get("completions", [])]
+        return self._history.completions()
+
+    def get_completion(self, completion_id: str) -> ChoreCompletion | None:
+        """Get a completion by ID."""
+        return self._history.get(completion_id)
 
     def get_pending_completions(self) -> list[ChoreCompletion]:
         """Get pending (unapproved) completions."""
-        return [c for c in self.get_completions() if not c.approved]
+        return self._history.completions(self._history.pending())
+
+    def iter_completion_records(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Return an iterator over archived and stored completions in [start, end).
+
+        Stored rows are snapshotted immediately; archived rows are read lazily,
+        so the iterator must be consumed in the executor.
+        """
+        hot_rows = list(self._history.iter_dicts(self._history.by_date_range(start, end)))
+        return itertools.chain(self.archive.iter_records(start, end), hot_rows)
+
+    def iter_ledger_records(self) -> Iterator[dict[str, Any]]:
+        """Return an iterator over stored and archived ledger entries, newest first.
+
+        Stored entries are snapshotted immediately; archived entries are read
+        lazily, so the iterator must be consumed in the executor.
+        """
+        hot_entries = self._data.get("ledger", [])[::-1]
+        return itertools.chain(hot_entries, self.ledger_archive.iter_entries_newest_first())
 
     def add_completion(self, completion: ChoreCompletion) -> None:
         """Add a completion record."""
-        if "completions" not in self._data:
-            self._data["completions"] = []
-        self._data["completions"].append(completion.to_dict())
+        self._history.append(completion)
+
+    def add_completions(self, completions: Iterable[ChoreCompletion]) -> None:
+        """Add several completion records, e.g. imported history.
+
+        Imported rows are usually older than the stored ones, so the history
+        is re-sorted afterwards to keep date filters bisecting.
+        """
+        for completion in completions:
+            self._history.append(completion)
+        self._history.sort()
 
     def update_completion(self, completion: ChoreCompletion) -> None:
         """Update a completion record."""
-        completions = self._data.get("completions", [])
-        for i, c in enumerate(completions):
-            if c.get("id") == completion.id:
-                completions[i] = completion.to_dict()
-                return
+        self._history.update(completion)
 
     def remove_completion(self, completion_id: str) -> None:
         """Remove a completion record."""
-        self._data["completions"] = [
-            c for c in self._data.get("completions", []) if c.get("id") != completion_id
-        ]
+        self._history.remove(completion_id)
 
     # Reward claims management
     def get_reward_claims(self) -> list[RewardClaim]:
@@ -271,6 +487,12 @@ class ChoremanderStorage:
                 claims[i] = claim.to_dict()
                 return
 
+    def remove_reward_claim(self, claim_id: str) -> None:
+        """Remove a reward claim."""
+        self._data["reward_claims"] = [
+            c for c in self._data.get("reward_claims", []) if c.get("id") != claim_id
+        ]
+
     # Settings
     def get_points_name(self) -> str:
         """Get the points currency name."""
@@ -287,3 +509,27 @@ class ChoremanderStorage:
     def set_points_icon(self, icon: str) -> None:
         """Set the points icon."""
         self._data["points_icon"] = icon
+
+    def get_auto_approve_hours(self) -> int:
+        """Get the hours before a pending item is auto-approved (0 = never)."""
+        return self._data.get("auto_approve_hours", DEFAULT_AUTO_APPROVE_HOURS)
+
+    def set_auto_approve_hours(self, hours: int) -> None:
+        """Set the hours before a pending item is auto-approved."""
+        self._data["auto_approve_hours"] = hours
+
+    def get_approval_expiry_days(self) -> int:
+        """Get the days before a pending item expires (0 = never)."""
+        return self._data.get("approval_expiry_days", DEFAULT_APPROVAL_EXPIRY_DAYS)
+
+    def set_approval_expiry_days(self, days: int) -> None:
+        """Set the days before a pending item expires."""
+        self._data["approval_expiry_days"] = days
+
+    def get_approval_rules(self) -> list[ApprovalRule]:
+        """Get the auto-approval rules."""
+        return [ApprovalRule.from_dict(r) for r in self._data.get("approval_rules", [])]
+
+    def set_approval_rules(self, rules: list[ApprovalRule]) -> None:
+        """Set the auto-approval rules."""
+        self._data["approval_rules"] = [rule.to_dict() for rule in rules]
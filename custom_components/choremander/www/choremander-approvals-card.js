@@ -3,25 +3,38 @@
  * A custom Lovelace card for managing pending chore approvals
  */
 
-const LitElement = customElements.get("hui-masonry-view")
-  ? Object.getPrototypeOf(customElements.get("hui-masonry-view"))
-  : Object.getPrototypeOf(customElements.get("hui-view"));
-
-const html = LitElement.prototype.html;
-const css = LitElement.prototype.css;
-
-class ChoremanderApprovalsCard extends LitElement {
+import {
+  WatchedEntitiesMixin,
+  getLit,
+  getTimeCategoryIcon,
+  getTimeCategoryLabel,
+  getTimeCategoryOrder,
+  getDayBounds,
+  getTimezone,
+  getTodayBounds,
+  isWithinDay,
+  callChoremanderService,
+  showNotification,
+} from "./choremander-runtime.js";
+
+const { LitElement, html, css } = getLit();
+
+class ChoremanderApprovalsCard extends WatchedEntitiesMixin(LitElement) {
   static get properties() {
     return {
       hass: { type: Object },
       config: { type: Object },
       _loading: { type: Object },
+      _resolved: { type: Object },
     };
   }
 
   constructor() {
     super();
     this._loading = {};
+    // Completion IDs approved or rejected on this card, hidden right away
+    // and kept until the pushed state no longer lists them
+    this._resolved = {};
   }
 
   static get styles() {
@@ -299,6 +312,28 @@ class ChoremanderApprovalsCard extends LitElement {
     };
   }
 
+  _watchedEntityIds() {
+    return [this.config.entity];
+  }
+
+  willUpdate(changedProps) {
+    super.willUpdate(changedProps);
+    if (changedProps.has("hass") && Object.keys(this._resolved).length > 0) {
+      // Forget resolved items once the server has dropped them
+      const pendingIds = new Set(
+        (this.hass.states[this.config.entity]?.attributes?.chore_completions || [])
+          .map((c) => c.completion_id)
+      );
+      const resolved = {};
+      for (const completionId of Object.keys(this._resolved)) {
+        if (pendingIds.has(completionId)) {
+          resolved[completionId] = true;
+        }
+      }
+      this._resolved = resolved;
+    }
+  }
+
   render() {
     if (!this.hass || !this.config) {
       return html``;
@@ -317,7 +352,9 @@ class ChoremanderApprovalsCard extends LitElement {
       `;
     }
 
-    const completions = entity.attributes.chore_completions || [];
+    const completions = (entity.attributes.chore_completions || []).filter(
+      (c) => !this._resolved[c.completion_id]
+    );
     const filteredCompletions = this._filterByChild(completions);
     const groupedByDay = this._groupByDay(filteredCompletions);
     const totalPending = filteredCompletions.length;
@@ -349,14 +386,25 @@ class ChoremanderApprovalsCard extends LitElement {
 
   _groupByDay(completions) {
     const groups = {};
+    const timezone = getTimezone(this.hass);
+    const today = getTodayBounds(timezone);
+    // Bounds of each day seen so far; only the first completion on a day
+    // needs its date worked out in the HA timezone
+    const days = [];
 
     completions.forEach((completion) => {
       const date = new Date(completion.completed_at);
-      const dayKey = this._getDayKey(date);
+      const epoch = date.getTime();
+      let day = days.find((bounds) => isWithinDay(epoch, bounds));
+      if (!day) {
+        day = getDayBounds(epoch, timezone);
+        days.push(day);
+      }
+      const dayKey = day.key;
 
       if (!groups[dayKey]) {
         groups[dayKey] = {
-          label: this._getDayLabel(date),
+          label: this._getDayLabel(date, day, today),
           date: date,
           timeCategories: {},
         };
@@ -377,66 +425,21 @@ class ChoremanderApprovalsCard extends LitElement {
     return sortedGroups;
   }
 
-  _getTimezone() {
-    // Get timezone from Home Assistant config, fallback to browser timezone
-    return this.hass?.config?.time_zone || Intl.DateTimeFormat().resolvedOptions().timeZone;
-  }
-
   _getLocale() {
     // Get locale from Home Assistant, fallback to browser locale
     return this.hass?.locale?.language || this.hass?.language || navigator.language || "en";
   }
 
   _formatDateInTimezone(date, options = {}) {
-    const timezone = this._getTimezone();
+    const timezone = getTimezone(this.hass);
     const locale = this._getLocale();
     return date.toLocaleDateString(locale, { ...options, timeZone: timezone });
   }
 
-  _getDatePartsInTimezone(date) {
-    const timezone = this._getTimezone();
-    // Get year, month, day in the HA timezone
-    const formatter = new Intl.DateTimeFormat("en-CA", {
-      timeZone: timezone,
-      year: "numeric",
-      month: "2-digit",
-      day: "2-digit",
-    });
-    // en-CA formats as YYYY-MM-DD
-    const dateStr = formatter.format(date);
-    const [year, month, day] = dateStr.split("-").map(Number);
-    return { year, month, day };
-  }
-
-  _getDayKey(date) {
-    // Use HA timezone to determine the day key
-    const { year, month, day } = this._getDatePartsInTimezone(date);
-    return `${year}-${String(month).padStart(2, "0")}-${String(day).padStart(2, "0")}`;
-  }
-
-  _getDayLabel(date) {
-    const timezone = this._getTimezone();
-
-    // Get today's date parts in HA timezone
-    const now = new Date();
-    const todayParts = this._getDatePartsInTimezone(now);
-    const dateParts = this._getDatePartsInTimezone(date);
-
-    // Calculate yesterday in HA timezone
-    const yesterdayDate = new Date(now);
-    yesterdayDate.setDate(yesterdayDate.getDate() - 1);
-    const yesterdayParts = this._getDatePartsInTimezone(yesterdayDate);
-
-    // Compare date parts
-    const isToday =
-      dateParts.year === todayParts.year &&
-      dateParts.month === todayParts.month &&
-      dateParts.day === todayParts.day;
-
-    const isYesterday =
-      dateParts.year === yesterdayParts.year &&
-      dateParts.month === yesterdayParts.month &&
-      dateParts.day === yesterdayParts.day;
+  _getDayLabel(date, day, today) {
+    // Day bounds are in the HA timezone, so comparing them is enough
+    const isToday = day.start === today.start;
+    const isYesterday = day.end === today.start;
 
     if (isToday) {
       return "Today";
@@ -450,39 +453,6 @@ class ChoremanderApprovalsCard extends LitElement {
     }
   }
 
-  _getTimeCategoryIcon(category) {
-    const icons = {
-      morning: "mdi:weather-sunset-up",
-      afternoon: "mdi:weather-sunny",
-      evening: "mdi:weather-sunset-down",
-      night: "mdi:weather-night",
-      anytime: "mdi:clock-outline",
-    };
-    return icons[category] || icons.anytime;
-  }
-
-  _getTimeCategoryLabel(category) {
-    const labels = {
-      morning: "Morning",
-      afternoon: "Afternoon",
-      evening: "Evening",
-      night: "Night",
-      anytime: "Anytime",
-    };
-    return labels[category] || category;
-  }
-
-  _getTimeCategoryOrder(category) {
-    const order = {
-      morning: 0,
-      afternoon: 1,
-      evening: 2,
-      night: 3,
-      anytime: 4,
-    };
-    return order[category] !== undefined ? order[category] : 5;
-  }
-
   _renderEmptyState() {
     return html`
       <div class="empty-state">
@@ -508,7 +478,7 @@ class ChoremanderApprovalsCard extends LitElement {
 
   _renderTimeCategories(timeCategories) {
     const sortedCategories = Object.entries(timeCategories).sort(
-      ([a], [b]) => this._getTimeCategoryOrder(a) - this._getTimeCategoryOrder(b)
+      ([a], [b]) => getTimeCategoryOrder(a) - getTimeCategoryOrder(b)
     );
 
     return html`
@@ -516,8 +486,8 @@ class ChoremanderApprovalsCard extends LitElement {
         ([category, completions]) => html`
           <div class="time-group">
             <div class="time-header">
-              <ha-icon icon="${this._getTimeCategoryIcon(category)}"></ha-icon>
-              ${this._getTimeCategoryLabel(category)}
+              <ha-icon icon="${getTimeCategoryIcon(category)}"></ha-icon>
+              ${getTimeCategoryLabel(category)}
             </div>
             ${completions.map((completion) => this._renderApprovalItem(completion))}
           </div>
@@ -577,23 +547,26 @@ class ChoremanderApprovalsCard extends LitElement {
   }
 
   async _callService(service, completionId) {
+    // Remove the item immediately; it comes back if the call fails
+    this._resolved = { ...this._resolved, [completionId]: true };
     this._loading = { ...this._loading, [completionId]: true };
     this.requestUpdate();
 
     try {
-      await this.hass.callService("choremander", service, {
+      await callChoremanderService(this.hass, service, {
         completion_id: completionId,
       });
     } catch (error) {
       console.error(`Failed to call ${service}:`, error);
-      // Show error toast if available
-      if (this.hass.callService) {
-        this.hass.callService("persistent_notification", "create", {
-          title: "Choremander Error",
-          message: `Failed to ${service.replace("_", " ")}: ${error.message}`,
-          notification_id: `choremander_error_${completionId}`,
-        });
-      }
+      const resolved = { ...this._resolved };
+      delete resolved[completionId];
+      this._resolved = resolved;
+      showNotification(
+        this.hass,
+        "Choremander Error",
+        `Failed to ${service.replace("_", " ")}: ${error.message}`,
+        `choremander_error_${completionId}`
+      );
     } finally {
       this._loading = { ...this._loading, [completionId]: false };
       this.requestUpdate();
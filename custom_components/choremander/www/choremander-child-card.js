@@ -15,14 +15,26 @@
  * - Clickable chore rows with checkbox visual indicator
  */
 
-const LitElement = customElements.get("hui-masonry-view")
-  ? Object.getPrototypeOf(customElements.get("hui-masonry-view"))
-  : Object.getPrototypeOf(customElements.get("hui-view"));
-
-const html = LitElement.prototype.html;
-const css = LitElement.prototype.css;
-
-class ChoremanderChildCard extends LitElement {
+import {
+  OPTIMISTIC_TIMEOUT_MS,
+  WatchedEntitiesMixin,
+  getLit,
+  getTimeCategoryIcon,
+  getTimezone,
+  getTodayBounds,
+  isWithinDay,
+  callChoremanderService,
+  playSound,
+  preloadSounds,
+  showNotification,
+} from "./choremander-runtime.js";
+
+const { LitElement, html, css } = getLit();
+
+// Logger used when debug is off: arguments are never formatted or printed
+const NOOP_LOG = () => {};
+
+class ChoremanderChildCard extends WatchedEntitiesMixin(LitElement) {
   static get properties() {
     return {
       hass: { type: Object },
@@ -31,6 +43,7 @@ class ChoremanderChildCard extends LitElement {
       _celebrating: { type: String },
       _confetti: { type: Array },
       _optimisticCompletions: { type: Object },
+      _optimisticUndos: { type: Object },
     };
   }
 
@@ -39,363 +52,41 @@ class ChoremanderChildCard extends LitElement {
     this._loading = {};
     this._celebrating = null;
     this._confetti = [];
-    // Optimistic completions: track chores that were just completed
-    // These are used to immediately hide the DONE button before the server confirms
+    // Optimistic changes, keyed by `${chore.id}_${child.id}`, shown before the
+    // server confirms them and kept until the pushed state reflects them.
+    // Completions: [{ tappedAt, completionId, confirmedAt }]
     this._optimisticCompletions = {};
-    // Audio context for generating sounds (lazy initialized)
-    this._audioContext = null;
-  }
-
-  /**
-   * Get or create the AudioContext (lazy initialization)
-   * Must be called after user interaction due to browser autoplay policies
-   */
-  _getAudioContext() {
-    if (!this._audioContext) {
-      this._audioContext = new (window.AudioContext || window.webkitAudioContext)();
-    }
-    // Resume if suspended (required after user interaction)
-    if (this._audioContext.state === 'suspended') {
-      this._audioContext.resume();
-    }
-    return this._audioContext;
-  }
-
-  /**
-   * Play a completion sound using Web Audio API
-   * Generates fun synthesized sounds - no external files needed!
-   * @param {string} soundName - Name of the sound to play (coin, levelup, fanfare, chime, powerup)
-   */
-  _playSound(soundName) {
-    // Don't play if sound is "none" or not specified
-    if (!soundName || soundName === 'none') {
-      console.debug('[Choremander] Sound disabled for this chore');
-      return;
-    }
-
-    try {
-      const ctx = this._getAudioContext();
-      const now = ctx.currentTime;
-
-      switch (soundName) {
-        case 'coin':
-          this._playCoinSound(ctx, now);
-          break;
-        case 'levelup':
-          this._playLevelUpSound(ctx, now);
-          break;
-        case 'fanfare':
-          this._playFanfareSound(ctx, now);
-          break;
-        case 'chime':
-          this._playChimeSound(ctx, now);
-          break;
-        case 'powerup':
-          this._playPowerUpSound(ctx, now);
-          break;
-        case 'undo':
-          this._playUndoSound(ctx, now);
-          break;
-        case 'fart1':
-          this._playAudioFile('fart1.mp3');
-          break;
-        case 'fart2':
-          this._playAudioFile('fart2.mp3');
-          break;
-        case 'fart3':
-          this._playAudioFile('fart3.mp3');
-          break;
-        case 'fart4':
-          this._playAudioFile('fart4.mp3');
-          break;
-        case 'fart5':
-          this._playAudioFile('fart5.mp3');
-          break;
-        case 'fart6':
-          this._playAudioFile('fart6.mp3');
-          break;
-        case 'fart7':
-          this._playAudioFile('fart7.mp3');
-          break;
-        case 'fart8':
-          this._playAudioFile('fart8.mp3');
-          break;
-        case 'fart9':
-          this._playAudioFile('fart9.mp3');
-          break;
-        case 'fart10':
-          this._playAudioFile('fart10.mp3');
-          break;
-        case 'fart_random':
-          // Pick a random fart sound (1-10)
-          const randomFartNum = Math.floor(Math.random() * 10) + 1;
-          this._playAudioFile(`fart${randomFartNum}.mp3`);
-          break;
-        default:
-          console.warn(`[Choremander] Unknown sound: ${soundName}, playing coin`);
-          this._playCoinSound(ctx, now);
-      }
-    } catch (e) {
-      console.warn('[Choremander] Error playing sound:', e);
-    }
-  }
-
-  /**
-   * Coin collect sound - classic video game coin pickup
-   * Two quick ascending tones
-   */
-  _playCoinSound(ctx, startTime) {
-    const masterGain = ctx.createGain();
-    masterGain.connect(ctx.destination);
-    masterGain.gain.value = 0.3;
-
-    // First tone (E6)
-    const osc1 = ctx.createOscillator();
-    const gain1 = ctx.createGain();
-    osc1.connect(gain1);
-    gain1.connect(masterGain);
-    osc1.frequency.value = 1318.5; // E6
-    osc1.type = 'square';
-    gain1.gain.setValueAtTime(0.5, startTime);
-    gain1.gain.exponentialRampToValueAtTime(0.01, startTime + 0.1);
-    osc1.start(startTime);
-    osc1.stop(startTime + 0.1);
-
-    // Second tone (B6) - higher
-    const osc2 = ctx.createOscillator();
-    const gain2 = ctx.createGain();
-    osc2.connect(gain2);
-    gain2.connect(masterGain);
-    osc2.frequency.value = 1975.5; // B6
-    osc2.type = 'square';
-    gain2.gain.setValueAtTime(0.5, startTime + 0.08);
-    gain2.gain.exponentialRampToValueAtTime(0.01, startTime + 0.25);
-    osc2.start(startTime + 0.08);
-    osc2.stop(startTime + 0.25);
-  }
-
-  /**
-   * Level up sound - triumphant ascending arpeggio
-   */
-  _playLevelUpSound(ctx, startTime) {
-    const masterGain = ctx.createGain();
-    masterGain.connect(ctx.destination);
-    masterGain.gain.value = 0.25;
-
-    // C major arpeggio going up: C5, E5, G5, C6
-    const notes = [523.25, 659.25, 783.99, 1046.5];
-    const duration = 0.12;
-
-    notes.forEach((freq, i) => {
-      const osc = ctx.createOscillator();
-      const gain = ctx.createGain();
-      osc.connect(gain);
-      gain.connect(masterGain);
-      osc.frequency.value = freq;
-      osc.type = 'square';
-
-      const noteStart = startTime + i * duration;
-      gain.gain.setValueAtTime(0.6, noteStart);
-      gain.gain.exponentialRampToValueAtTime(0.01, noteStart + duration + 0.1);
-      osc.start(noteStart);
-      osc.stop(noteStart + duration + 0.15);
-    });
-
-    // Final sustained chord
-    const chordNotes = [523.25, 659.25, 783.99]; // C major chord
-    const chordStart = startTime + notes.length * duration;
-    chordNotes.forEach((freq) => {
-      const osc = ctx.createOscillator();
-      const gain = ctx.createGain();
-      osc.connect(gain);
-      gain.connect(masterGain);
-      osc.frequency.value = freq;
-      osc.type = 'triangle';
-      gain.gain.setValueAtTime(0.3, chordStart);
-      gain.gain.exponentialRampToValueAtTime(0.01, chordStart + 0.5);
-      osc.start(chordStart);
-      osc.stop(chordStart + 0.55);
-    });
-  }
-
-  /**
-   * Fanfare sound - celebratory trumpet-like fanfare
-   */
-  _playFanfareSound(ctx, startTime) {
-    const masterGain = ctx.createGain();
-    masterGain.connect(ctx.destination);
-    masterGain.gain.value = 0.2;
-
-    // Fanfare pattern: G4, G4, G4, E4, G4, C5 (classic celebration pattern)
-    const pattern = [
-      { freq: 392.00, duration: 0.1, delay: 0 },      // G4
-      { freq: 392.00, duration: 0.1, delay: 0.12 },   // G4
-      { freq: 392.00, duration: 0.15, delay: 0.24 },  // G4
-      { freq: 329.63, duration: 0.15, delay: 0.42 },  // E4
-      { freq: 392.00, duration: 0.15, delay: 0.6 },   // G4
-      { freq: 523.25, duration: 0.4, delay: 0.78 },   // C5 (long final note)
-    ];
-
-    pattern.forEach(({ freq, duration, delay }) => {
-      const osc = ctx.createOscillator();
-      const gain = ctx.createGain();
-
-      osc.connect(gain);
-      gain.connect(masterGain);
-
-      osc.frequency.value = freq;
-      osc.type = 'sawtooth';
-
-      const noteStart = startTime + delay;
-      gain.gain.setValueAtTime(0.5, noteStart);
-      gain.gain.setValueAtTime(0.5, noteStart + duration * 0.8);
-      gain.gain.exponentialRampToValueAtTime(0.01, noteStart + duration);
-
-      osc.start(noteStart);
-      osc.stop(noteStart + duration + 0.05);
-    });
-  }
-
-  /**
-   * Chime sound - simple pleasant bell chime
-   */
-  _playChimeSound(ctx, startTime) {
-    const masterGain = ctx.createGain();
-    masterGain.connect(ctx.destination);
-    masterGain.gain.value = 0.3;
-
-    // Bell-like sound using multiple harmonics
-    const fundamental = 880; // A5
-    const harmonics = [1, 2, 3, 4.2]; // Slight inharmonicity for bell-like quality
-
-    harmonics.forEach((harmonic, i) => {
-      const osc = ctx.createOscillator();
-      const gain = ctx.createGain();
-
-      osc.connect(gain);
-      gain.connect(masterGain);
-
-      osc.frequency.value = fundamental * harmonic;
-      osc.type = 'sine';
-
-      // Higher harmonics decay faster
-      const amplitude = 0.5 / (i + 1);
-      const decayTime = 0.8 / (i + 1);
-
-      gain.gain.setValueAtTime(amplitude, startTime);
-      gain.gain.exponentialRampToValueAtTime(0.001, startTime + decayTime);
-
-      osc.start(startTime);
-      osc.stop(startTime + decayTime + 0.1);
-    });
-  }
-
-  /**
-   * Power up sound - ascending sweep with sparkle
-   */
-  _playPowerUpSound(ctx, startTime) {
-    const masterGain = ctx.createGain();
-    masterGain.connect(ctx.destination);
-    masterGain.gain.value = 0.25;
-
-    // Ascending sweep
-    const osc1 = ctx.createOscillator();
-    const gain1 = ctx.createGain();
-    osc1.connect(gain1);
-    gain1.connect(masterGain);
-    osc1.type = 'sawtooth';
-    osc1.frequency.setValueAtTime(200, startTime);
-    osc1.frequency.exponentialRampToValueAtTime(1200, startTime + 0.3);
-    gain1.gain.setValueAtTime(0.4, startTime);
-    gain1.gain.exponentialRampToValueAtTime(0.01, startTime + 0.35);
-    osc1.start(startTime);
-    osc1.stop(startTime + 0.4);
-
-    // Sparkle notes at the end
-    const sparkleNotes = [1318.5, 1567.98, 1975.5]; // E6, G6, B6
-    sparkleNotes.forEach((freq, i) => {
-      const osc = ctx.createOscillator();
-      const gain = ctx.createGain();
-      osc.connect(gain);
-      gain.connect(masterGain);
-      osc.frequency.value = freq;
-      osc.type = 'sine';
-
-      const noteStart = startTime + 0.25 + i * 0.05;
-      gain.gain.setValueAtTime(0.3, noteStart);
-      gain.gain.exponentialRampToValueAtTime(0.01, noteStart + 0.2);
-      osc.start(noteStart);
-      osc.stop(noteStart + 0.25);
-    });
-  }
-
-  /**
-   * Undo sound - sad descending "womp womp" style
-   * Two descending tones that sound disappointed/sad
-   */
-  _playUndoSound(ctx, startTime) {
-    const masterGain = ctx.createGain();
-    masterGain.connect(ctx.destination);
-    masterGain.gain.value = 0.25;
-
-    // First "womp" - descending tone
-    const osc1 = ctx.createOscillator();
-    const gain1 = ctx.createGain();
-    osc1.connect(gain1);
-    gain1.connect(masterGain);
-    osc1.type = 'triangle';
-    osc1.frequency.setValueAtTime(311.13, startTime);  // Eb4
-    osc1.frequency.exponentialRampToValueAtTime(233.08, startTime + 0.25);  // Bb3
-    gain1.gain.setValueAtTime(0.6, startTime);
-    gain1.gain.exponentialRampToValueAtTime(0.3, startTime + 0.2);
-    gain1.gain.exponentialRampToValueAtTime(0.01, startTime + 0.3);
-    osc1.start(startTime);
-    osc1.stop(startTime + 0.35);
-
-    // Second "womp" - even lower descending tone (the sad part)
-    const osc2 = ctx.createOscillator();
-    const gain2 = ctx.createGain();
-    osc2.connect(gain2);
-    gain2.connect(masterGain);
-    osc2.type = 'triangle';
-    osc2.frequency.setValueAtTime(233.08, startTime + 0.3);  // Bb3
-    osc2.frequency.exponentialRampToValueAtTime(155.56, startTime + 0.7);  // Eb3
-    gain2.gain.setValueAtTime(0.5, startTime + 0.3);
-    gain2.gain.exponentialRampToValueAtTime(0.25, startTime + 0.55);
-    gain2.gain.exponentialRampToValueAtTime(0.01, startTime + 0.75);
-    osc2.start(startTime + 0.3);
-    osc2.stop(startTime + 0.8);
-
-    // Optional: add a subtle low vibrato for extra sadness
-    const osc3 = ctx.createOscillator();
-    const gain3 = ctx.createGain();
-    osc3.connect(gain3);
-    gain3.connect(masterGain);
-    osc3.type = 'sine';
-    osc3.frequency.setValueAtTime(116.54, startTime + 0.5);  // Bb2 (sub bass)
-    gain3.gain.setValueAtTime(0.15, startTime + 0.5);
-    gain3.gain.exponentialRampToValueAtTime(0.01, startTime + 0.8);
-    osc3.start(startTime + 0.5);
-    osc3.stop(startTime + 0.85);
+    // Undos: { completionId, confirmedAt }
+    this._optimisticUndos = {};
+    // Idempotency key of the last failed completion call, keyed like above.
+    // The next tap reuses it: if the failed call did reach the server (e.g.
+    // the connection dropped before the response), the server replays that
+    // completion instead of recording a second one
+    this._retryKeys = {};
+    // The child's own sensor entity ID, resolved once per config and only
+    // when the overview sensor does not list the child's avatar
+    this._childEntityId = null;
+    this._childEntityResolved = false;
+    // Debug logger, replaced with a console logger when config.debug is set
+    this._log = NOOP_LOG;
+    // Duration of the last render in ms (debug panel only)
+    this._lastRenderMs = null;
+    // Load this card's sounds on the first touch, so the first completion
+    // plays instantly (the AudioContext may only start on a user gesture)
+    this.addEventListener("pointerdown", () => this._preloadSounds(), { once: true });
   }
 
-  /**
-   * Play an audio file from the www folder
-   * Used for fart sounds (real audio files, not synthesized)
-   * CC0 public domain from BigSoundBank.com
-   * @param {string} filename - The audio file name (e.g., 'fart1.mp3')
-   */
-  _playAudioFile(filename) {
-    try {
-      // Build the URL to the audio file in the www folder
-      const audio = new Audio(`/local/choremander/${filename}`);
-      audio.volume = 1.0;
-      audio.play().catch(e => {
-        console.warn('[Choremander] Error playing audio file:', e);
-      });
-    } catch (e) {
-      console.warn('[Choremander] Error creating audio element:', e);
+  _preloadSounds() {
+    const chores = this.hass?.states[this.config?.entity]?.attributes?.chores || [];
+    const childId = String(this.config?.child_id || "");
+    const sounds = [this.config?.default_sound || "coin", this.config?.undo_sound || "undo"];
+    for (const chore of chores) {
+      const assignedTo = Array.isArray(chore.assigned_to) ? chore.assigned_to : [];
+      if (assignedTo.length === 0 || assignedTo.some(id => String(id) === childId)) {
+        sounds.push(chore.completion_sound || sounds[0]);
+      }
     }
+    preloadSounds(sounds);
   }
 
   static get styles() {
@@ -1123,6 +814,11 @@ class ChoremanderChildCard extends LitElement {
       undo_sound: "undo",     // Sound to play when undoing a completion
       ...config,
     };
+    this._log = this.config.debug === true
+      ? (...args) => console.debug("[Choremander]", ...args)
+      : NOOP_LOG;
+    this._childEntityId = null;
+    this._childEntityResolved = false;
   }
 
   getCardSize() {
@@ -1141,11 +837,39 @@ class ChoremanderChildCard extends LitElement {
     };
   }
 
+  _watchedEntityIds() {
+    // The child's own sensor supplies the avatar
+    return this._childEntityId
+      ? [this.config.entity, this._childEntityId]
+      : [this.config.entity];
+  }
+
+  _getChildAvatar(child) {
+    // The overview sensor lists each child's avatar; older versions only
+    // expose it on the child's own sensor, found by a one-off lookup
+    if (child.avatar) {
+      return child.avatar;
+    }
+    if (!this._childEntityResolved) {
+      this._childEntityId = child.entity_id || Object.keys(this.hass.states).find(
+        eid => this.hass.states[eid].attributes?.child_id === child.id
+      ) || null;
+      this._childEntityResolved = true;
+    }
+    const childEntity = this._childEntityId ? this.hass.states[this._childEntityId] : null;
+    return childEntity?.attributes?.avatar || "mdi:account-circle";
+  }
+
   render() {
     if (!this.hass || !this.config) {
       return html``;
     }
 
+    const debug = this.config.debug === true;
+    if (debug) {
+      this._renderStart = performance.now();
+    }
+
     const entity = this.hass.states[this.config.entity];
 
     if (!entity) {
@@ -1177,50 +901,12 @@ class ChoremanderChildCard extends LitElement {
     // Get chores for this child and time category
     const allChores = entity.attributes.chores || [];
 
-    // Log raw data for debugging assignment issues
-    console.debug(
-      `[Choremander] Rendering card for child "${child.name}" (${child.id}), time_category="${this.config.time_category}"`,
-      `\n  Total chores in entity: ${allChores.length}`,
-      `\n  Children in entity:`, children.map(c => ({id: c.id, name: c.name}))
-    );
-
-    // DEBUG: Create debug info object for visible debugging
-    const debugInfo = {
-      configChildId: this.config.child_id,
-      foundChildId: child.id,
-      foundChildName: child.name,
-      totalChores: allChores.length,
-      sampleChores: allChores.slice(0, 3).map(c => ({
-        name: c.name,
-        assigned_to: c.assigned_to,
-        assigned_to_type: typeof c.assigned_to,
-        isArray: Array.isArray(c.assigned_to)
-      }))
-    };
-    console.log('[Choremander DEBUG]', JSON.stringify(debugInfo, null, 2));
-
     const childChores = this._filterAndSortChores(allChores, child);
 
-    // Log the filtering result
-    console.debug(
-      `[Choremander] After filtering: showing ${childChores.length} of ${allChores.length} chores for child "${child.name}" (${child.id})`
-    );
-
-    // Store debug info for rendering
-    this._debugInfo = {
-      ...debugInfo,
-      filteredCount: childChores.length
-    };
-
     const pointsIcon = entity.attributes.points_icon || "mdi:star";
     const pointsName = entity.attributes.points_name || "Stars";
 
-    // Get child entity for avatar
-    const childEntityId = Object.keys(this.hass.states).find(
-      eid => this.hass.states[eid].attributes?.child_id === this.config.child_id
-    );
-    const childEntity = childEntityId ? this.hass.states[childEntityId] : null;
-    const avatar = childEntity?.attributes?.avatar || "mdi:account-circle";
+    const avatar = this._getChildAvatar(child);
 
     // Get pending points for this child
     const pendingPoints = child.pending_points || 0;
@@ -1231,12 +917,24 @@ class ChoremanderChildCard extends LitElement {
     const allCompletions = entity.attributes.todays_completions || entity.attributes.completions || [];
     const todaysCompletions = this._filterCompletionsForToday(allCompletions);
 
-    // Debug logging to help troubleshoot daily limit issues
-    if (allCompletions.length > 0 || todaysCompletions.length > 0) {
-      console.debug(
-        `[Choremander] Child "${child.name}" (${child.id}): ` +
-        `allCompletions = ${allCompletions.length}, todaysCompletions = ${todaysCompletions.length}`,
-        { allCompletions, todaysCompletions }
+    if (debug) {
+      this._debugInfo = {
+        foundChildId: child.id,
+        foundChildName: child.name,
+        totalChores: allChores.length,
+        filteredCount: childChores.length,
+        completionsCount: allCompletions.length,
+        todaysCount: todaysCompletions.length,
+        sampleChores: allChores.slice(0, 3).map(c => ({
+          name: c.name,
+          assigned_to: c.assigned_to,
+          isArray: Array.isArray(c.assigned_to),
+        })),
+      };
+      this._log(
+        `Rendering child "${child.name}" (${child.id}), time_category="${this.config.time_category}": ` +
+        `showing ${childChores.length} of ${allChores.length} chores, ` +
+        `${todaysCompletions.length} of ${allCompletions.length} completions today`
       );
     }
 
@@ -1279,7 +977,7 @@ class ChoremanderChildCard extends LitElement {
             ? this._renderEmptyState()
             : html`
                 <div class="section-title">
-                  <ha-icon icon="${this._getTimeCategoryIcon(this.config.time_category)}"></ha-icon>
+                  <ha-icon icon="${getTimeCategoryIcon(this.config.time_category)}"></ha-icon>
                   ${this._getDynamicTitle()}
                 </div>
                 ${childChores.map((chore, index) => this._renderChoreCard(chore, child, pointsIcon, todaysCompletions, index))}
@@ -1298,6 +996,8 @@ class ChoremanderChildCard extends LitElement {
             <div>Found child.name: "${this._debugInfo?.foundChildName}"</div>
             <div>Total chores: ${this._debugInfo?.totalChores}</div>
             <div>Filtered chores: ${this._debugInfo?.filteredCount}</div>
+            <div>Completions today: ${this._debugInfo?.todaysCount} of ${this._debugInfo?.completionsCount}</div>
+            <div>Last render: ${this._lastRenderMs === null ? "-" : `${this._lastRenderMs.toFixed(1)} ms`}</div>
             <div style="margin-top: 5px;"><strong>Sample chores assigned_to:</strong></div>
             ${(this._debugInfo?.sampleChores || []).map(c => html`
               <div>- ${c.name}: ${JSON.stringify(c.assigned_to)} (isArray: ${c.isArray})</div>
@@ -1308,108 +1008,136 @@ class ChoremanderChildCard extends LitElement {
     `;
   }
 
-  _filterAndSortChores(chores, child) {
-    const childId = String(child.id || "");
-    const childName = child.name;
-    const choreOrder = child.chore_order || [];
+  willUpdate(changedProps) {
+    super.willUpdate(changedProps);
+    if (changedProps.has("hass")) {
+      this._reconcileOptimistic();
+    }
+  }
 
-    // Debug logging to diagnose assignment filtering issues
-    console.debug(
-      `[Choremander] Filtering chores for child: id="${childId}" (type: ${typeof childId}), name="${childName}", config.child_id="${this.config.child_id}"`,
-      `\n  All chores:`, chores.map(c => ({name: c.name, assigned_to: c.assigned_to, assigned_to_type: typeof c.assigned_to}))
+  /**
+   * Drop optimistic changes that the pushed state now reflects: a completion
+   * once its ID appears in today's completions, an undo once its completion
+   * is gone. Confirmed changes that never show up expire after a timeout.
+   * Returns true if anything was dropped.
+   */
+  _reconcileOptimistic() {
+    const entity = this.hass?.states[this.config?.entity];
+    if (!entity) {
+      return false;
+    }
+    const completionIds = new Set(
+      (entity.attributes.todays_completions || []).map(comp => comp.completion_id)
     );
+    const now = Date.now();
+    const isExpired = (change) =>
+      change.confirmedAt !== null && now - change.confirmedAt > OPTIMISTIC_TIMEOUT_MS;
+    let changed = false;
+
+    const completions = {};
+    for (const [key, entries] of Object.entries(this._optimisticCompletions)) {
+      const pending = entries.filter(entry =>
+        !completionIds.has(entry.completionId) && !isExpired(entry)
+      );
+      changed = changed || pending.length !== entries.length;
+      if (pending.length > 0) {
+        completions[key] = pending;
+      }
+    }
+
+    const undos = {};
+    for (const [key, undo] of Object.entries(this._optimisticUndos)) {
+      if ((undo.completionId && !completionIds.has(undo.completionId)) || isExpired(undo)) {
+        changed = true;
+      } else {
+        undos[key] = undo;
+      }
+    }
+
+    if (changed) {
+      this._optimisticCompletions = completions;
+      this._optimisticUndos = undos;
+    }
+    return changed;
+  }
+
+  /**
+   * Net number of completions of a chore shown ahead of the pushed state
+   */
+  _countOptimistic(key) {
+    const added = (this._optimisticCompletions[key] || []).length;
+    return this._optimisticUndos[key] ? added - 1 : added;
+  }
+
+  updated(changedProps) {
+    super.updated(changedProps);
+    // Render time covers building the template and committing it to the DOM;
+    // the debug panel shows it on the next render
+    if (this._renderStart !== undefined) {
+      this._lastRenderMs = performance.now() - this._renderStart;
+      this._renderStart = undefined;
+    }
+  }
+
+  _filterAndSortChores(chores, child) {
+    const childId = String(child.id || "");
+    const timeCategory = this.config.time_category;
+
+    // The result only changes when the overview entity publishes new chores
+    // or a new chore order, or the card config changes, so reuse it across
+    // renders triggered by loading/celebration state
+    const memo = this._choresMemo;
+    if (
+      memo &&
+      memo.chores === chores &&
+      memo.childId === childId &&
+      memo.timeCategory === timeCategory &&
+      memo.choreOrder === child.chore_order
+    ) {
+      return memo.result;
+    }
 
     // First, filter chores for this child and time category
     const filteredChores = chores.filter(chore => {
       // Check time category
       const matchesTime =
-        this.config.time_category === "all" ||
-        chore.time_category === this.config.time_category ||
+        timeCategory === "all" ||
+        chore.time_category === timeCategory ||
         chore.time_category === "anytime";
 
       // Check if chore is assigned to this child
       // If assigned_to is empty or not set, show to ALL children
       // If assigned_to has specific child IDs, only show to those children
-      // Ensure assigned_to is always an array
-      let assignedTo = chore.assigned_to;
-      if (!Array.isArray(assignedTo)) {
-        assignedTo = [];
-      }
-
-      // Convert all assigned_to values to strings for consistent comparison
-      const assignedToStrings = assignedTo.map(id => String(id));
-
       // STRICT: Only check child ID, not name
       // assigned_to should ONLY contain child IDs, never names
-      const isAssignedToAll = assignedToStrings.length === 0;
-      const isAssignedToChild = isAssignedToAll || assignedToStrings.includes(childId);
-
-      // Debug logging for each chore with assignments (always log to help debug)
-      console.debug(
-        `[Choremander] Chore "${chore.name}": ` +
-        `assigned_to=${JSON.stringify(assignedTo)} (isArray: ${Array.isArray(chore.assigned_to)}), ` +
-        `childId="${childId}", isAssignedToAll=${isAssignedToAll}, ` +
-        `isAssignedToChild=${isAssignedToChild}, matchesTime=${matchesTime}, ` +
-        `SHOWING=${matchesTime && isAssignedToChild}`
-      );
+      const assignedTo = Array.isArray(chore.assigned_to) ? chore.assigned_to : [];
+      const isAssignedToChild =
+        assignedTo.length === 0 || assignedTo.some(id => String(id) === childId);
 
       return matchesTime && isAssignedToChild;
     });
 
-    // Debug: Log the filtered results
-    console.debug(
-      `[Choremander] FINAL filtered chores for "${childName}" (${childId}): ${filteredChores.length} of ${chores.length}`,
-      filteredChores.map(c => c.name)
-    );
-
-    // If no custom order is set, return filtered chores as-is
-    if (choreOrder.length === 0) {
-      return filteredChores;
-    }
-
     // Sort by the child's custom chore order
     // Chores in the order list appear first, in their specified order
     // Chores not in the order list appear after, in their default order
-    return filteredChores.sort((a, b) => {
-      const indexA = choreOrder.indexOf(a.id);
-      const indexB = choreOrder.indexOf(b.id);
-
-      // If both are in the order list, sort by their position
-      if (indexA !== -1 && indexB !== -1) {
-        return indexA - indexB;
-      }
-
-      // If only one is in the order list, it comes first
-      if (indexA !== -1) return -1;
-      if (indexB !== -1) return 1;
-
-      // If neither is in the order list, maintain original order
-      return 0;
-    });
-  }
-
-  _getTimeCategoryIcon(category) {
-    const icons = {
-      morning: "mdi:weather-sunset-up",
-      afternoon: "mdi:weather-sunny",
-      evening: "mdi:weather-sunset-down",
-      night: "mdi:weather-night",
-      anytime: "mdi:clock-outline",
-      all: "mdi:clock-outline",
-    };
-    return icons[category] || icons.anytime;
-  }
+    // (Array.prototype.sort is stable)
+    const choreOrder = child.chore_order || [];
+    if (choreOrder.length > 0) {
+      const positions = new Map(choreOrder.map((id, index) => [id, index]));
+      const unordered = choreOrder.length;
+      filteredChores.sort(
+        (a, b) => (positions.get(a.id) ?? unordered) - (positions.get(b.id) ?? unordered)
+      );
+    }
 
-  _getTimeCategoryLabel(category) {
-    const labels = {
-      morning: "Morning",
-      afternoon: "Afternoon",
-      evening: "Evening",
-      night: "Night",
-      anytime: "Anytime",
-      all: "All",
+    this._choresMemo = {
+      chores,
+      childId,
+      timeCategory,
+      choreOrder: child.chore_order,
+      result: filteredChores,
     };
-    return labels[category] || category;
+    return filteredChores;
   }
 
   _getDynamicTitle() {
@@ -1425,45 +1153,12 @@ class ChoremanderChildCard extends LitElement {
     return titles[category] || "Today's Chores";
   }
 
-  _getTimezone() {
-    // Get timezone from Home Assistant config, fallback to browser timezone
-    return this.hass?.config?.time_zone || Intl.DateTimeFormat().resolvedOptions().timeZone;
-  }
-
-  _getDatePartsInTimezone(date) {
-    const timezone = this._getTimezone();
-    // Get year, month, day in the HA timezone
-    const formatter = new Intl.DateTimeFormat("en-CA", {
-      timeZone: timezone,
-      year: "numeric",
-      month: "2-digit",
-      day: "2-digit",
-    });
-    // en-CA formats as YYYY-MM-DD
-    const dateStr = formatter.format(date);
-    const [year, month, day] = dateStr.split("-").map(Number);
-    return { year, month, day };
-  }
-
-  _isToday(date) {
-    const now = new Date();
-    const todayParts = this._getDatePartsInTimezone(now);
-    const dateParts = this._getDatePartsInTimezone(date);
-
-    return (
-      dateParts.year === todayParts.year &&
-      dateParts.month === todayParts.month &&
-      dateParts.day === todayParts.day
-    );
-  }
-
   _filterCompletionsForToday(completions) {
     // Filter completions to only include those completed today (in HA timezone)
-    return completions.filter(comp => {
-      if (!comp.completed_at) return false;
-      const completedDate = new Date(comp.completed_at);
-      return this._isToday(completedDate);
-    });
+    const today = getTodayBounds(getTimezone(this.hass));
+    return completions.filter(comp =>
+      comp.completed_at && isWithinDay(Date.parse(comp.completed_at), today)
+    );
   }
 
   _renderEmptyState() {
@@ -1488,43 +1183,19 @@ class ChoremanderChildCard extends LitElement {
     let completionsToday = childCompletionsToday.length;
     const dailyLimit = chore.daily_limit || 1;
 
-    // Check for optimistic completions (chores just completed but not yet confirmed by HA)
+    // Add changes made on this card that the pushed state does not show yet,
+    // so a tap is reflected immediately
     const optimisticKey = `${chore.id}_${child.id}`;
-    const optimisticData = this._optimisticCompletions && this._optimisticCompletions[optimisticKey];
-    const hasOptimisticCompletion = !!optimisticData;
-
-    // If we have an optimistic completion, always count it toward the limit
-    // This is defensive - we'd rather show "completed" incorrectly than allow double-completions
-    // The optimistic completion will be cleaned up once we verify the server state reflects it
-    if (hasOptimisticCompletion) {
-      // Calculate how many optimistic completions we've tracked that aren't yet in the data
-      const optimisticCount = optimisticData.count || 1;
-
-      // Get timestamps from actual completions for this chore/child today
-      const actualTimestamps = childCompletionsToday.map(comp =>
-        comp.completed_at ? new Date(comp.completed_at).getTime() : 0
-      );
-
-      // Count how many of our optimistic completions are NOT yet reflected in the data
-      // An optimistic completion is "reflected" if there's an actual completion within 2 seconds of it
-      const optimisticTimestamps = optimisticData.timestamps || [optimisticData.timestamp || Date.now()];
-      let unreflectedOptimistic = 0;
-      for (const optTs of optimisticTimestamps) {
-        const isReflected = actualTimestamps.some(actTs => Math.abs(actTs - optTs) < 2000);
-        if (!isReflected) {
-          unreflectedOptimistic += 1;
-        }
-      }
-
-      completionsToday += unreflectedOptimistic;
-    }
+    const optimisticCount = this._countOptimistic(optimisticKey);
+    const hasOptimisticCompletion = optimisticCount > 0;
+    completionsToday = Math.max(0, completionsToday + optimisticCount);
 
     const isCompletedForToday = completionsToday >= dailyLimit;
 
     // Debug logging to help troubleshoot daily limit issues
-    if (childCompletionsToday.length > 0 || isCompletedForToday || hasOptimisticCompletion) {
-      console.debug(
-        `[Choremander] Chore "${chore.name}" (${chore.id}): ` +
+    if (this.config.debug === true && (childCompletionsToday.length > 0 || isCompletedForToday || hasOptimisticCompletion)) {
+      this._log(
+        `Chore "${chore.name}" (${chore.id}): ` +
         `completions today = ${completionsToday}, daily limit = ${dailyLimit}, ` +
         `completed = ${isCompletedForToday}, optimistic = ${!!hasOptimisticCompletion}, ` +
         `completions:`,
@@ -1543,7 +1214,7 @@ class ChoremanderChildCard extends LitElement {
     const handleRowClick = () => {
       if (isLoading) return;
       if (isCompletedForToday) {
-        this._handleUndo(chore, child, childCompletionsToday);
+        this._handleUndo(chore, child);
       } else {
         this._handleComplete(chore, child);
       }
@@ -1628,7 +1299,7 @@ class ChoremanderChildCard extends LitElement {
 
     // Check if already loading for this chore (prevent double-clicks during loading)
     if (this._loading[chore.id]) {
-      console.debug(`[Choremander] Chore "${chore.name}" is already loading, ignoring click`);
+      this._log(`Chore "${chore.name}" is already loading, ignoring click`);
       return;
     }
 
@@ -1639,169 +1310,186 @@ class ChoremanderChildCard extends LitElement {
     const actualCompletionsToday = todaysCompletions.filter(
       (comp) => comp.chore_id === chore.id && comp.child_id === child.id
     ).length;
-
-    // Count existing optimistic completions for this chore/child
-    const existingData = this._optimisticCompletions[key];
-    const existingOptimisticCount = existingData?.count || 0;
-
-    // Calculate total completions (actual + optimistic)
-    // This is a simplified count - we're being defensive and not trying to dedupe
-    const totalCompletions = actualCompletionsToday + existingOptimisticCount;
+    const optimisticCount = this._countOptimistic(key);
 
     // Guard: If daily limit already reached, don't allow another completion
-    if (totalCompletions >= dailyLimit) {
-      console.debug(
-        `[Choremander] Daily limit already reached for chore "${chore.name}": ` +
-        `${actualCompletionsToday} actual + ${existingOptimisticCount} optimistic >= ${dailyLimit} limit`
+    if (actualCompletionsToday + optimisticCount >= dailyLimit) {
+      this._log(
+        `Daily limit already reached for chore "${chore.name}": ` +
+        `${actualCompletionsToday} actual + ${optimisticCount} optimistic >= ${dailyLimit} limit`
       );
       this.requestUpdate(); // Force re-render to show completed state
       return;
     }
 
-    // IMMEDIATELY set optimistic completion BEFORE making the service call
-    // This prevents double-clicks even if the button hasn't re-rendered yet
-    const now = Date.now();
-    const existingTimestamps = existingData?.timestamps || [];
+    // Apply the completion locally right away: show it as done, celebrate
+    // and play the sound before the server confirms, rolling back on failure
+    const entry = { tappedAt: Date.now(), completionId: null, confirmedAt: null };
     this._optimisticCompletions = {
       ...this._optimisticCompletions,
-      [key]: {
-        timestamp: now,
-        timestamps: [...existingTimestamps, now],
-        count: existingOptimisticCount + 1,
-      },
+      [key]: [...(this._optimisticCompletions[key] || []), entry],
     };
-
     this._loading = { ...this._loading, [chore.id]: true };
-    this.requestUpdate();
 
-    try {
-      await this.hass.callService("choremander", "complete_chore", {
-        chore_id: chore.id,
-        child_id: child.id,
-      });
+    // Trigger celebration!
+    this._celebrating = chore.id;
+    this._spawnConfetti();
 
-      // Trigger celebration!
-      this._celebrating = chore.id;
-      this._spawnConfetti();
+    // Play completion sound!
+    // Use the chore's completion_sound, fall back to config default, then to 'coin'
+    const soundToPlay = chore.completion_sound || this.config.default_sound || 'coin';
+    playSound(soundToPlay);
 
-      // Play completion sound!
-      // Use the chore's completion_sound, fall back to config default, then to 'coin'
-      const soundToPlay = chore.completion_sound || this.config.default_sound || 'coin';
-      this._playSound(soundToPlay);
+    // Auto-close celebration after 2.5 seconds
+    const celebrationTimer = setTimeout(() => {
+      this._closeCelebration();
+    }, 2500);
 
-      this.requestUpdate();
+    this.requestUpdate();
 
-      // Auto-close celebration after 2.5 seconds
-      setTimeout(() => {
-        this._closeCelebration();
-      }, 2500);
+    // Taps while a call is in flight are ignored above; a tap after a failed
+    // call retries it under the same key
+    const idempotencyKey = this._retryKeys[key] || `${child.id}:${chore.id}:${entry.tappedAt}`;
 
-      // Clean up optimistic completion after 30 seconds (by then HA state should be updated)
+    try {
+      const response = await callChoremanderService(this.hass, "complete_chore", {
+        chore_id: chore.id,
+        child_id: child.id,
+        idempotency_key: idempotencyKey,
+      }, true);
+      delete this._retryKeys[key];
+
+      // Keep showing the completion until the pushed state includes it,
+      // which may already have happened
+      entry.completionId = response?.completion?.id ?? null;
+      entry.confirmedAt = Date.now();
+      this._reconcileOptimistic();
       setTimeout(() => {
-        const newOptimistic = { ...this._optimisticCompletions };
-        delete newOptimistic[key];
-        this._optimisticCompletions = newOptimistic;
-        this.requestUpdate();
-      }, 30000);
+        if (this._reconcileOptimistic()) {
+          this.requestUpdate();
+        }
+      }, OPTIMISTIC_TIMEOUT_MS + 1);
 
     } catch (error) {
       console.error("Failed to complete chore:", error);
+      this._retryKeys[key] = idempotencyKey;
 
-      // Remove the optimistic completion since the service call failed
+      // Roll back the optimistic completion since the service call failed
+      const remaining = (this._optimisticCompletions[key] || []).filter(e => e !== entry);
       const newOptimistic = { ...this._optimisticCompletions };
-      const currentData = newOptimistic[key];
-      if (currentData) {
-        // Remove the timestamp we just added
-        const newTimestamps = currentData.timestamps.filter(ts => ts !== now);
-        if (newTimestamps.length === 0) {
-          delete newOptimistic[key];
-        } else {
-          newOptimistic[key] = {
-            ...currentData,
-            timestamps: newTimestamps,
-            count: newTimestamps.length,
-          };
-        }
-        this._optimisticCompletions = newOptimistic;
+      if (remaining.length > 0) {
+        newOptimistic[key] = remaining;
+      } else {
+        delete newOptimistic[key];
+      }
+      this._optimisticCompletions = newOptimistic;
+      clearTimeout(celebrationTimer);
+      if (this._celebrating === chore.id) {
+        this._closeCelebration();
       }
 
       // Show error notification
-      if (this.hass.callService) {
-        this.hass.callService("persistent_notification", "create", {
-          title: "Oops!",
-          message: `Something went wrong: ${error.message}`,
-          notification_id: `choremander_error_${chore.id}`,
-        });
-      }
+      showNotification(
+        this.hass,
+        "Oops!",
+        `Something went wrong: ${error.message}`,
+        `choremander_error_${chore.id}`
+      );
     } finally {
       this._loading = { ...this._loading, [chore.id]: false };
       this.requestUpdate();
     }
   }
 
-  async _handleUndo(chore, child, childCompletionsToday) {
+  async _handleUndo(chore, child) {
+    const key = `${chore.id}_${child.id}`;
+
     // Check if already loading for this chore (prevent double-clicks during loading)
     if (this._loading[chore.id]) {
-      console.debug(`[Choremander] Chore "${chore.name}" is already loading, ignoring undo click`);
+      this._log(`Chore "${chore.name}" is already loading, ignoring undo click`);
       return;
     }
 
-    // Find the most recent completion for this chore/child to undo
-    // Sort by completed_at descending to get the most recent
-    const sortedCompletions = [...childCompletionsToday].sort((a, b) => {
-      const dateA = new Date(a.completed_at || 0);
-      const dateB = new Date(b.completed_at || 0);
-      return dateB - dateA;
-    });
+    this._log(`Undoing last completion of chore "${chore.name}"`);
 
-    const completionToUndo = sortedCompletions[0];
-    // Check for completion_id (from sensor) or id (fallback)
-    const completionId = completionToUndo?.completion_id || completionToUndo?.id;
-    if (!completionToUndo || !completionId) {
-      console.warn(`[Choremander] No completion found to undo for chore "${chore.name}"`, sortedCompletions);
-      return;
-    }
+    // Show the undo right away, rolling back on failure
+    const undo = { completionId: null, confirmedAt: null };
+    this._optimisticUndos = { ...this._optimisticUndos, [key]: undo };
+    this._loading = { ...this._loading, [chore.id]: true };
 
-    console.debug(`[Choremander] Undoing completion "${completionId}" for chore "${chore.name}"`);
+    // Play undo sound (sad/descending tone)
+    const undoSoundToPlay = this.config.undo_sound || 'undo';
+    playSound(undoSoundToPlay);
 
-    this._loading = { ...this._loading, [chore.id]: true };
     this.requestUpdate();
 
     try {
-      // Call the reject_chore service to remove the completion
-      await this.hass.callService("choremander", "reject_chore", {
-        completion_id: completionId,
-      });
-
-      console.debug(`[Choremander] Successfully undid completion for chore "${chore.name}"`);
+      // The integration tracks each child's recent completions, so it finds
+      // the one to undo without the card searching today's history
+      const response = await callChoremanderService(this.hass, "undo_last_completion", {
+        child_id: child.id,
+        chore_id: chore.id,
+      }, true);
 
-      // Play undo sound (sad/descending tone)
-      const undoSoundToPlay = this.config.undo_sound || 'undo';
-      this._playSound(undoSoundToPlay);
+      this._log(`Successfully undid completion for chore "${chore.name}"`);
 
-      // Clear any optimistic completion data for this chore/child
-      const key = `${chore.id}_${child.id}`;
-      const newOptimistic = { ...this._optimisticCompletions };
-      delete newOptimistic[key];
-      this._optimisticCompletions = newOptimistic;
+      const undoneId = response?.completion?.id ?? null;
+      const entries = this._optimisticCompletions[key] || [];
+      if (undoneId && !entries.some(entry => entry.completionId === undoneId)) {
+        // Keep showing the undo until the pushed state drops the completion
+        undo.completionId = undoneId;
+        undo.confirmedAt = Date.now();
+        this._reconcileOptimistic();
+      } else {
+        // Either nothing was undone, or the undone completion was one the
+        // pushed state never showed: drop it together with the undo
+        const newOptimistic = { ...this._optimisticCompletions };
+        const remaining = entries.filter(entry => entry.completionId !== undoneId);
+        if (remaining.length > 0) {
+          newOptimistic[key] = remaining;
+        } else {
+          delete newOptimistic[key];
+        }
+        this._optimisticCompletions = newOptimistic;
+        this._dropOptimisticUndo(key, undo);
+        if (!undoneId) {
+          showNotification(
+            this.hass,
+            "Nothing to undo",
+            `"${chore.name}" has no completion today to undo.`,
+            `choremander_undo_error_${chore.id}`,
+            5000
+          );
+        }
+      }
 
     } catch (error) {
       console.error("Failed to undo chore completion:", error);
 
+      // Roll back the optimistic undo since the service call failed
+      this._dropOptimisticUndo(key, undo);
+
       // Show error notification
-      if (this.hass.callService) {
-        this.hass.callService("persistent_notification", "create", {
-          title: "Oops!",
-          message: `Couldn't undo: ${error.message}`,
-          notification_id: `choremander_undo_error_${chore.id}`,
-        });
-      }
+      showNotification(
+        this.hass,
+        "Oops!",
+        `Couldn't undo: ${error.message}`,
+        `choremander_undo_error_${chore.id}`
+      );
     } finally {
       this._loading = { ...this._loading, [chore.id]: false };
       this.requestUpdate();
     }
   }
 
+  _dropOptimisticUndo(key, undo) {
+    if (this._optimisticUndos[key] === undo) {
+      const newUndos = { ...this._optimisticUndos };
+      delete newUndos[key];
+      this._optimisticUndos = newUndos;
+    }
+  }
+
   _spawnConfetti() {
     const confetti = [];
     for (let i = 0; i < 50; i++) {
@@ -4,19 +4,22 @@
  * Allows adding or removing points with optional reasons.
  */
 
-const LitElement = customElements.get("hui-masonry-view")
-  ? Object.getPrototypeOf(customElements.get("hui-masonry-view"))
-  : Object.getPrototypeOf(customElements.get("hui-view"));
+import {
+  OPTIMISTIC_TIMEOUT_MS,
+  WatchedEntitiesMixin,
+  getLit,
+  callChoremanderService,
+} from "./choremander-runtime.js";
 
-const html = LitElement.prototype.html;
-const css = LitElement.prototype.css;
+const { LitElement, html, css } = getLit();
 
-class ChoremanderPointsCard extends LitElement {
+class ChoremanderPointsCard extends WatchedEntitiesMixin(LitElement) {
   static get properties() {
     return {
       hass: { type: Object },
       config: { type: Object },
       _loading: { type: Object },
+      _pendingPoints: { type: Object },
       _dialog: { type: Object },
       _notification: { type: Object },
     };
@@ -27,6 +30,13 @@ class ChoremanderPointsCard extends LitElement {
     this._loading = {};
     this._dialog = null;
     this._notification = null;
+    // Child ID -> point changes shown before the pushed state reflects them:
+    // [{ delta, basePoints, confirmedAt }], basePoints being the pushed
+    // balance when the change was made
+    this._pendingPoints = {};
+    // Child ID -> that child's sensor entity ID (or null), resolved once per
+    // config and only when the overview sensor does not list the avatar
+    this._childEntityIds = {};
   }
 
   static get styles() {
@@ -516,6 +526,7 @@ class ChoremanderPointsCard extends LitElement {
       title: "Manage Points",
       ...config,
     };
+    this._childEntityIds = {};
   }
 
   getCardSize() {
@@ -533,6 +544,79 @@ class ChoremanderPointsCard extends LitElement {
     };
   }
 
+  _watchedEntityIds() {
+    // Each child's own sensor supplies their avatar
+    return [
+      this.config.entity,
+      ...Object.values(this._childEntityIds).filter(Boolean),
+    ];
+  }
+
+  willUpdate(changedProps) {
+    super.willUpdate(changedProps);
+    if (changedProps.has("hass")) {
+      this._reconcilePoints();
+    }
+  }
+
+  _getPushedPoints(childId) {
+    const children = this.hass?.states[this.config?.entity]?.attributes?.children || [];
+    return children.find((c) => c.id === childId)?.points;
+  }
+
+  /**
+   * Drop pending point changes as soon as a child's pushed balance moves
+   * away from the balance the change was made on: Home Assistant writes the
+   * new state before the service responds, so any move means the change (or
+   * a newer one) is already in the pushed balance. Confirmed changes that
+   * never move the balance expire after a timeout. Returns true if anything
+   * was dropped.
+   */
+  _reconcilePoints() {
+    const now = Date.now();
+    let changed = false;
+    const pendingPoints = {};
+
+    for (const [childId, entries] of Object.entries(this._pendingPoints)) {
+      const points = this._getPushedPoints(childId);
+      const pending = entries.filter(
+        (entry) =>
+          entry.basePoints === points &&
+          !(entry.confirmedAt !== null && now - entry.confirmedAt > OPTIMISTIC_TIMEOUT_MS)
+      );
+      changed = changed || pending.length !== entries.length;
+      if (pending.length > 0) {
+        pendingPoints[childId] = pending;
+      }
+    }
+
+    if (changed) {
+      this._pendingPoints = pendingPoints;
+    }
+    return changed;
+  }
+
+  _getDisplayPoints(child) {
+    const pending = this._pendingPoints[child.id] || [];
+    return Math.max(0, pending.reduce((points, entry) => points + entry.delta, child.points));
+  }
+
+  _getChildAvatar(child) {
+    // The overview sensor lists each child's avatar; older versions only
+    // expose it on the child's own sensor, found by a one-off lookup
+    if (child.avatar) {
+      return child.avatar;
+    }
+    if (!(child.id in this._childEntityIds)) {
+      this._childEntityIds[child.id] = child.entity_id || Object.keys(this.hass.states).find(
+        (eid) => this.hass.states[eid].attributes?.child_id === child.id
+      ) || null;
+    }
+    const childEntityId = this._childEntityIds[child.id];
+    const childEntity = childEntityId ? this.hass.states[childEntityId] : null;
+    return childEntity?.attributes?.avatar || "mdi:account-circle";
+  }
+
   render() {
     if (!this.hass || !this.config) {
       return html``;
@@ -591,12 +675,7 @@ class ChoremanderPointsCard extends LitElement {
   _renderChildRow(child, pointsIcon, pointsName) {
     const isLoading = this._loading[child.id];
 
-    // Get child entity for avatar
-    const childEntityId = Object.keys(this.hass.states).find(
-      (eid) => this.hass.states[eid].attributes?.child_id === child.id
-    );
-    const childEntity = childEntityId ? this.hass.states[childEntityId] : null;
-    const avatar = childEntity?.attributes?.avatar || "mdi:account-circle";
+    const avatar = this._getChildAvatar(child);
 
     return html`
       <div class="child-row ${isLoading ? "loading" : ""}">
@@ -608,7 +687,7 @@ class ChoremanderPointsCard extends LitElement {
             <div class="child-name">${child.name}</div>
             <div class="child-points">
               <ha-icon icon="${pointsIcon}"></ha-icon>
-              ${child.points} ${pointsName}
+              ${this._getDisplayPoints(child)} ${pointsName}
             </div>
           </div>
         </div>
@@ -637,7 +716,7 @@ class ChoremanderPointsCard extends LitElement {
   _renderDialog() {
     const { child, action, pointsIcon, pointsName } = this._dialog;
     const isAdd = action === "add";
-    const isLoading = this._loading[`dialog_${child.id}`];
+    const isLoading = this._loading[child.id];
 
     return html`
       <div class="dialog-overlay" @click="${this._closeDialog}">
@@ -753,9 +832,6 @@ class ChoremanderPointsCard extends LitElement {
       return;
     }
 
-    this._loading = { ...this._loading, [`dialog_${child.id}`]: true };
-    this.requestUpdate();
-
     const service = action === "add" ? "add_points" : "remove_points";
     const serviceData = {
       child_id: child.id,
@@ -766,29 +842,64 @@ class ChoremanderPointsCard extends LitElement {
       serviceData.reason = reason;
     }
 
-    try {
-      await this.hass.callService("choremander", service, serviceData);
+    // Show the new balance and close the dialog right away; the change is
+    // rolled back if the call fails
+    const entry = {
+      delta: action === "add" ? points : -points,
+      basePoints: this._getPushedPoints(child.id) ?? child.points,
+      confirmedAt: null,
+    };
+    this._pendingPoints = {
+      ...this._pendingPoints,
+      [child.id]: [...(this._pendingPoints[child.id] || []), entry],
+    };
+    this._loading = { ...this._loading, [child.id]: true };
 
-      // Get points name from entity
-      const entity = this.hass.states[this.config.entity];
-      const pointsName = entity?.attributes?.points_name || "points";
-      const pointsLabel = points === 1 ? pointsName.replace(/s$/, "") : pointsName;
+    // Get points name from entity
+    const entity = this.hass.states[this.config.entity];
+    const pointsName = entity?.attributes?.points_name || "points";
+    const pointsLabel = points === 1 ? pointsName.replace(/s$/, "") : pointsName;
 
-      const message =
-        action === "add"
-          ? `Added ${points} ${pointsLabel} to ${child.name}`
-          : `Removed ${points} ${pointsLabel} from ${child.name}`;
+    const message =
+      action === "add"
+        ? `Added ${points} ${pointsLabel} to ${child.name}`
+        : `Removed ${points} ${pointsLabel} from ${child.name}`;
 
-      this._showNotification(message, "success");
-      this._closeDialog();
+    this._showNotification(message, "success");
+    this._closeDialog();
+
+    try {
+      const response = await callChoremanderService(this.hass, service, serviceData, true);
+
+      if (typeof response?.points === "number") {
+        // Removing points stops at zero, so keep what was actually applied
+        entry.delta = action === "add" ? response.points : -response.points;
+      }
+      entry.confirmedAt = Date.now();
+      this._reconcilePoints();
+      setTimeout(() => {
+        if (this._reconcilePoints()) {
+          this.requestUpdate();
+        }
+      }, OPTIMISTIC_TIMEOUT_MS + 1);
     } catch (error) {
       console.error(`Failed to ${action} points:`, error);
+
+      const remaining = (this._pendingPoints[child.id] || []).filter((e) => e !== entry);
+      const pendingPoints = { ...this._pendingPoints };
+      if (remaining.length > 0) {
+        pendingPoints[child.id] = remaining;
+      } else {
+        delete pendingPoints[child.id];
+      }
+      this._pendingPoints = pendingPoints;
+
       this._showNotification(
         `Failed to ${action} points: ${error.message}`,
         "error"
       );
     } finally {
-      this._loading = { ...this._loading, [`dialog_${child.id}`]: false };
+      this._loading = { ...this._loading, [child.id]: false };
       this.requestUpdate();
     }
   }
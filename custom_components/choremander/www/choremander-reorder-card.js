@@ -7,14 +7,19 @@
  * Last Updated: 2025-12-31
  */
 
-const LitElement = customElements.get("hui-masonry-view")
-  ? Object.getPrototypeOf(customElements.get("hui-masonry-view"))
-  : Object.getPrototypeOf(customElements.get("hui-view"));
-
-const html = LitElement.prototype.html;
-const css = LitElement.prototype.css;
-
-class ChoremanderReorderCard extends LitElement {
+import {
+  WatchedEntitiesMixin,
+  getLit,
+  getTimeCategoryIcon,
+  getTimeCategoryLabel,
+  TIME_CATEGORIES,
+  callChoremanderService,
+  showNotification,
+} from "./choremander-runtime.js";
+
+const { LitElement, html, css } = getLit();
+
+class ChoremanderReorderCard extends WatchedEntitiesMixin(LitElement) {
   static get properties() {
     return {
       hass: { type: Object },
@@ -414,7 +419,7 @@ class ChoremanderReorderCard extends LitElement {
       const childChores = this._getChoresForChild(chores, child.id);
 
       const newLocalOrder = {};
-      const timeCategories = ["morning", "afternoon", "evening", "night", "anytime"];
+      const timeCategories = TIME_CATEGORIES;
 
       for (const category of timeCategories) {
         const categoryChores = childChores.filter(
@@ -434,22 +439,32 @@ class ChoremanderReorderCard extends LitElement {
     // Ensure childId is a string for consistent comparison
     const childIdStr = String(childId || "");
 
-    return chores.filter((chore) => {
-      // Ensure assigned_to is always an array
-      let assignedTo = chore.assigned_to;
-      if (!Array.isArray(assignedTo)) {
-        assignedTo = [];
-      }
+    // Only recompute when the overview entity publishes a new chores list
+    const memo = this._childChoresMemo;
+    if (memo && memo.chores === chores && memo.childId === childIdStr) {
+      return memo.result;
+    }
 
-      // Convert all assigned_to values to strings for consistent comparison
-      const assignedToStrings = assignedTo.map(id => String(id));
+    const result = chores.filter((chore) => {
+      // Ensure assigned_to is always an array
+      const assignedTo = Array.isArray(chore.assigned_to) ? chore.assigned_to : [];
 
       // If no assignments, show to all children. Otherwise, check if child is assigned.
-      const isAssignedToAll = assignedToStrings.length === 0;
-      const isAssignedToChild = isAssignedToAll || assignedToStrings.includes(childIdStr);
-
-      return isAssignedToChild;
+      return assignedTo.length === 0 || assignedTo.some((id) => String(id) === childIdStr);
     });
+
+    this._childChoresMemo = { chores, childId: childIdStr, result };
+    return result;
+  }
+
+  _getChoresById(chores) {
+    if (this._choresByIdMemo?.chores !== chores) {
+      this._choresByIdMemo = {
+        chores,
+        byId: new Map(chores.map((chore) => [chore.id, chore])),
+      };
+    }
+    return this._choresByIdMemo.byId;
   }
 
   _sortChoresByOrder(chores, choreOrder) {
@@ -457,39 +472,17 @@ class ChoremanderReorderCard extends LitElement {
       return [...chores];
     }
 
-    return [...chores].sort((a, b) => {
-      const indexA = choreOrder.indexOf(a.id);
-      const indexB = choreOrder.indexOf(b.id);
-
-      if (indexA !== -1 && indexB !== -1) {
-        return indexA - indexB;
-      }
-      if (indexA !== -1) return -1;
-      if (indexB !== -1) return 1;
-      return 0;
-    });
-  }
-
-  _getTimeCategoryIcon(category) {
-    const icons = {
-      morning: "mdi:weather-sunset-up",
-      afternoon: "mdi:weather-sunny",
-      evening: "mdi:weather-sunset-down",
-      night: "mdi:weather-night",
-      anytime: "mdi:clock-outline",
-    };
-    return icons[category] || icons.anytime;
+    // Chores missing from the order keep their relative order at the end
+    // (Array.prototype.sort is stable)
+    const positions = new Map(choreOrder.map((id, index) => [id, index]));
+    const unordered = choreOrder.length;
+    return [...chores].sort(
+      (a, b) => (positions.get(a.id) ?? unordered) - (positions.get(b.id) ?? unordered)
+    );
   }
 
-  _getTimeCategoryLabel(category) {
-    const labels = {
-      morning: "Morning",
-      afternoon: "Afternoon",
-      evening: "Evening",
-      night: "Night",
-      anytime: "Anytime",
-    };
-    return labels[category] || category;
+  _watchedEntityIds() {
+    return [this.config.entity];
   }
 
   render() {
@@ -545,8 +538,9 @@ class ChoremanderReorderCard extends LitElement {
       `;
     }
 
-    const timeCategories = ["morning", "afternoon", "evening", "night", "anytime"];
+    const timeCategories = TIME_CATEGORIES;
     const pointsIcon = entity.attributes.points_icon || "mdi:star";
+    const choresById = this._getChoresById(chores);
 
     return html`
       <ha-card>
@@ -576,7 +570,7 @@ class ChoremanderReorderCard extends LitElement {
         ${timeCategories.map((category) => {
           const categoryChoreIds = this._localChoreOrder[category] || [];
           const categoryChores = categoryChoreIds
-            .map((id) => chores.find((c) => c.id === id))
+            .map((id) => choresById.get(id))
             .filter((c) => c);
 
           // Also include any chores in this category that aren't in the order yet
@@ -593,8 +587,8 @@ class ChoremanderReorderCard extends LitElement {
           return html`
             <div class="time-category-section">
               <div class="time-category-header">
-                <ha-icon icon="${this._getTimeCategoryIcon(category)}"></ha-icon>
-                ${this._getTimeCategoryLabel(category)}
+                <ha-icon icon="${getTimeCategoryIcon(category)}"></ha-icon>
+                ${getTimeCategoryLabel(category)}
                 <span class="count">${allCategoryChores.length} chore${allCategoryChores.length !== 1 ? "s" : ""}</span>
               </div>
               <div class="chores-list">
@@ -677,7 +671,7 @@ class ChoremanderReorderCard extends LitElement {
 
     try {
       // Combine all category orders into a single flat array
-      const timeCategories = ["morning", "afternoon", "evening", "night", "anytime"];
+      const timeCategories = TIME_CATEGORIES;
       const fullOrder = [];
 
       for (const category of timeCategories) {
@@ -685,37 +679,29 @@ class ChoremanderReorderCard extends LitElement {
         fullOrder.push(...categoryOrder);
       }
 
-      await this.hass.callService("choremander", "set_chore_order", {
+      await callChoremanderService(this.hass, "set_chore_order", {
         child_id: this.config.child_id,
         chore_order: fullOrder,
       });
 
       this._hasChanges = false;
 
-      // Show success feedback
-      if (this.hass.callService) {
-        this.hass.callService("persistent_notification", "create", {
-          title: "Chore Order Saved",
-          message: "The chore order has been updated successfully.",
-          notification_id: "choremander_reorder_success",
-        });
-
-        // Auto-dismiss after 3 seconds
-        setTimeout(() => {
-          this.hass.callService("persistent_notification", "dismiss", {
-            notification_id: "choremander_reorder_success",
-          });
-        }, 3000);
-      }
+      // Show success feedback, auto-dismissed after 3 seconds
+      showNotification(
+        this.hass,
+        "Chore Order Saved",
+        "The chore order has been updated successfully.",
+        "choremander_reorder_success",
+        3000
+      );
     } catch (error) {
       console.error("Failed to save chore order:", error);
-      if (this.hass.callService) {
-        this.hass.callService("persistent_notification", "create", {
-          title: "Error Saving Order",
-          message: `Failed to save chore order: ${error.message}`,
-          notification_id: "choremander_reorder_error",
-        });
-      }
+      showNotification(
+        this.hass,
+        "Error Saving Order",
+        `Failed to save chore order: ${error.message}`,
+        "choremander_reorder_error"
+      );
     } finally {
       this._saving = false;
       this.requestUpdate();
@@ -8,14 +8,11 @@
  * Last Updated: 2026-01-07
  */
 
-const LitElement = customElements.get("hui-masonry-view")
-  ? Object.getPrototypeOf(customElements.get("hui-masonry-view"))
-  : Object.getPrototypeOf(customElements.get("hui-view"));
+import { WatchedEntitiesMixin, getLit } from "./choremander-runtime.js";
 
-const html = LitElement.prototype.html;
-const css = LitElement.prototype.css;
+const { LitElement, html, css } = getLit();
 
-class ChoremanderRewardsCard extends LitElement {
+class ChoremanderRewardsCard extends WatchedEntitiesMixin(LitElement) {
   static get properties() {
     return {
       hass: { type: Object },
@@ -581,6 +578,10 @@ class ChoremanderRewardsCard extends LitElement {
     };
   }
 
+  _watchedEntityIds() {
+    return [this.config.entity];
+  }
+
   render() {
     if (!this.hass || !this.config) {
       return html``;
@@ -0,0 +1,655 @@
+/**
+ * Choremander Card Runtime
+ * Shared code for the Choremander cards and the config flow sound preview.
+ *
+ * Every card imports this module, so the browser downloads and parses it
+ * once: LitElement resolution and render gating, time categories,
+ * timezone-aware dates, service calls, notifications and completion sounds.
+ */
+
+export const DOMAIN = "choremander";
+
+// ============== LIT ==============
+
+let _lit = null;
+
+/**
+ * Get LitElement, html and css from Home Assistant's own view elements.
+ * Resolved on first use, since the config flow sound preview loads this
+ * module on pages where no Lovelace view has been defined.
+ */
+export function getLit() {
+  if (!_lit) {
+    const LitElement = customElements.get("hui-masonry-view")
+      ? Object.getPrototypeOf(customElements.get("hui-masonry-view"))
+      : Object.getPrototypeOf(customElements.get("hui-view"));
+    _lit = {
+      LitElement,
+      html: LitElement.prototype.html,
+      css: LitElement.prototype.css,
+    };
+  }
+  return _lit;
+}
+
+/**
+ * Mixin for cards that skip renders nobody would notice.
+ * Config and internal state changes always re-render; hass changes only
+ * when the locale, language or themes change, or one of the entities
+ * returned by the card's _watchedEntityIds() has a new state object.
+ */
+export const WatchedEntitiesMixin = (Base) =>
+  class extends Base {
+    shouldUpdate(changedProps) {
+      if (!this.config || !changedProps.has("hass") || changedProps.size > 1) {
+        return true;
+      }
+      const oldHass = changedProps.get("hass");
+      if (
+        !oldHass ||
+        oldHass.locale !== this.hass.locale ||
+        oldHass.language !== this.hass.language ||
+        oldHass.themes !== this.hass.themes
+      ) {
+        return true;
+      }
+      return this._watchedEntityIds().some(
+        (entityId) => oldHass.states[entityId] !== this.hass.states[entityId]
+      );
+    }
+  };
+
+// ============== TIME CATEGORIES ==============
+
+export const TIME_CATEGORIES = ["morning", "afternoon", "evening", "night", "anytime"];
+
+const TIME_CATEGORY_ICONS = {
+  morning: "mdi:weather-sunset-up",
+  afternoon: "mdi:weather-sunny",
+  evening: "mdi:weather-sunset-down",
+  night: "mdi:weather-night",
+  anytime: "mdi:clock-outline",
+  all: "mdi:clock-outline",
+};
+
+const TIME_CATEGORY_LABELS = {
+  morning: "Morning",
+  afternoon: "Afternoon",
+  evening: "Evening",
+  night: "Night",
+  anytime: "Anytime",
+  all: "All",
+};
+
+export function getTimeCategoryIcon(category) {
+  return TIME_CATEGORY_ICONS[category] || TIME_CATEGORY_ICONS.anytime;
+}
+
+export function getTimeCategoryLabel(category) {
+  return TIME_CATEGORY_LABELS[category] || category;
+}
+
+export function getTimeCategoryOrder(category) {
+  const order = TIME_CATEGORIES.indexOf(category);
+  return order === -1 ? TIME_CATEGORIES.length : order;
+}
+
+// ============== DATES ==============
+// Intl.DateTimeFormat instances are expensive to build, so one formatter is
+// kept per timezone. Days are represented by their start/end epoch bounds,
+// so checking which day a timestamp falls on is a numeric comparison.
+
+// Timezone -> formatter for the calendar date (en-CA formats as YYYY-MM-DD)
+const _dateFormatters = new Map();
+// Timezone -> formatter for the full wall-clock time, used to find offsets
+const _offsetFormatters = new Map();
+// Timezone -> bounds of the current day, reused until the day rolls over
+const _todayBounds = new Map();
+
+function _getDateFormatter(timeZone) {
+  let formatter = _dateFormatters.get(timeZone);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat("en-CA", {
+      timeZone,
+      year: "numeric",
+      month: "2-digit",
+      day: "2-digit",
+    });
+    _dateFormatters.set(timeZone, formatter);
+  }
+  return formatter;
+}
+
+function _getOffsetFormatter(timeZone) {
+  let formatter = _offsetFormatters.get(timeZone);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat("en-US", {
+      timeZone,
+      hourCycle: "h23",
+      year: "numeric",
+      month: "numeric",
+      day: "numeric",
+      hour: "numeric",
+      minute: "numeric",
+      second: "numeric",
+    });
+    _offsetFormatters.set(timeZone, formatter);
+  }
+  return formatter;
+}
+
+// Offset of the timezone from UTC at the given instant, in ms
+function _getOffset(epoch, timeZone) {
+  const parts = {};
+  for (const { type, value } of _getOffsetFormatter(timeZone).formatToParts(epoch)) {
+    parts[type] = value;
+  }
+  const wallClock = Date.UTC(
+    Number(parts.year),
+    Number(parts.month) - 1,
+    Number(parts.day),
+    Number(parts.hour),
+    Number(parts.minute),
+    Number(parts.second)
+  );
+  return wallClock - Math.floor(epoch / 1000) * 1000;
+}
+
+// Epoch of local midnight on a calendar date in the timezone
+function _startOfDate(year, month, day, timeZone) {
+  const midnightUtc = Date.UTC(year, month - 1, day);
+  const offset = _getOffset(midnightUtc, timeZone);
+  const start = midnightUtc - offset;
+  // Re-check in case a DST change falls between UTC and local midnight
+  const actualOffset = _getOffset(start, timeZone);
+  return actualOffset === offset ? start : midnightUtc - actualOffset;
+}
+
+/**
+ * Get the Home Assistant timezone, falling back to the browser timezone.
+ */
+export function getTimezone(hass) {
+  return hass?.config?.time_zone || Intl.DateTimeFormat().resolvedOptions().timeZone;
+}
+
+/**
+ * Get the calendar year, month and day of a date in a timezone.
+ */
+export function getDatePartsInTimezone(date, timeZone) {
+  const [year, month, day] = _getDateFormatter(timeZone)
+    .format(date)
+    .split("-")
+    .map(Number);
+  return { year, month, day };
+}
+
+/**
+ * Get the bounds of the day containing an instant.
+ * Returns { key, start, end } where key is "YYYY-MM-DD" and start/end are
+ * epoch ms, end exclusive.
+ */
+export function getDayBounds(date, timeZone) {
+  const { year, month, day } = getDatePartsInTimezone(date, timeZone);
+  const next = new Date(Date.UTC(year, month - 1, day + 1));
+  return {
+    key: `${year}-${String(month).padStart(2, "0")}-${String(day).padStart(2, "0")}`,
+    start: _startOfDate(year, month, day, timeZone),
+    end: _startOfDate(
+      next.getUTCFullYear(),
+      next.getUTCMonth() + 1,
+      next.getUTCDate(),
+      timeZone
+    ),
+  };
+}
+
+/**
+ * Get the bounds of today, computed once per local day and timezone.
+ */
+export function getTodayBounds(timeZone, now = Date.now()) {
+  const cached = _todayBounds.get(timeZone);
+  if (cached && now >= cached.start && now < cached.end) {
+    return cached;
+  }
+  const bounds = getDayBounds(now, timeZone);
+  _todayBounds.set(timeZone, bounds);
+  return bounds;
+}
+
+/**
+ * Check whether an epoch ms timestamp falls within day bounds.
+ */
+export function isWithinDay(epoch, bounds) {
+  return epoch >= bounds.start && epoch < bounds.end;
+}
+
+// ============== SERVICES AND NOTIFICATIONS ==============
+
+// How long the cards keep a confirmed optimistic change while waiting for
+// the pushed state to reflect it, before dropping it anyway
+export const OPTIMISTIC_TIMEOUT_MS = 30000;
+
+/**
+ * Call a Choremander service.
+ * With returnResponse, resolves to the service's response data instead.
+ */
+export async function callChoremanderService(hass, service, data, returnResponse = false) {
+  if (!returnResponse) {
+    return hass.callService(DOMAIN, service, data);
+  }
+  const result = await hass.callService(DOMAIN, service, data, undefined, true, true);
+  return result?.response;
+}
+
+/**
+ * Show a persistent notification, optionally dismissing it after a delay.
+ */
+export function showNotification(hass, title, message, notificationId, dismissAfterMs = 0) {
+  if (!hass?.callService) {
+    return;
+  }
+  hass.callService("persistent_notification", "create", {
+    title,
+    message,
+    notification_id: notificationId,
+  });
+  if (dismissAfterMs > 0) {
+    setTimeout(() => {
+      hass.callService("persistent_notification", "dismiss", {
+        notification_id: notificationId,
+      });
+    }, dismissAfterMs);
+  }
+}
+
+// ============== SOUNDS ==============
+// Most sounds are synthesized via the Web Audio API. Fart sounds are CC0
+// audio files from BigSoundBank.com and GfxSounds.com. Either way each sound
+// becomes an AudioBuffer the first time it is needed and is reused after.
+
+// Where frontend.py serves the www folder; an absolute URL so sound files
+// resolve the same from the raw sources and from the bundles in www/dist
+const SOUND_BASE_URL = "/choremander/";
+
+// Audio context shared by every card (lazy initialized)
+let _audioContext = null;
+
+/**
+ * Get or create the AudioContext (lazy initialization)
+ * Must be called after user interaction due to browser autoplay policies
+ */
+export function getAudioContext() {
+  if (!_audioContext) {
+    _audioContext = new (window.AudioContext || window.webkitAudioContext)();
+  }
+  // Resume if suspended (required after user interaction)
+  if (_audioContext.state === "suspended") {
+    _audioContext.resume();
+  }
+  return _audioContext;
+}
+
+/**
+ * Coin collect sound - classic video game coin pickup
+ * Two quick ascending tones
+ */
+function playCoinSound(ctx, startTime) {
+  const masterGain = ctx.createGain();
+  masterGain.connect(ctx.destination);
+  masterGain.gain.value = 0.3;
+
+  // First tone (E6)
+  const osc1 = ctx.createOscillator();
+  const gain1 = ctx.createGain();
+  osc1.connect(gain1);
+  gain1.connect(masterGain);
+  osc1.frequency.value = 1318.5; // E6
+  osc1.type = 'square';
+  gain1.gain.setValueAtTime(0.5, startTime);
+  gain1.gain.exponentialRampToValueAtTime(0.01, startTime + 0.1);
+  osc1.start(startTime);
+  osc1.stop(startTime + 0.1);
+
+  // Second tone (B6) - higher
+  const osc2 = ctx.createOscillator();
+  const gain2 = ctx.createGain();
+  osc2.connect(gain2);
+  gain2.connect(masterGain);
+  osc2.frequency.value = 1975.5; // B6
+  osc2.type = 'square';
+  gain2.gain.setValueAtTime(0.5, startTime + 0.08);
+  gain2.gain.exponentialRampToValueAtTime(0.01, startTime + 0.25);
+  osc2.start(startTime + 0.08);
+  osc2.stop(startTime + 0.25);
+}
+
+/**
+ * Level up sound - triumphant ascending arpeggio
+ */
+function playLevelUpSound(ctx, startTime) {
+  const masterGain = ctx.createGain();
+  masterGain.connect(ctx.destination);
+  masterGain.gain.value = 0.25;
+
+  // C major arpeggio going up: C5, E5, G5, C6
+  const notes = [523.25, 659.25, 783.99, 1046.5];
+  const duration = 0.12;
+
+  notes.forEach((freq, i) => {
+    const osc = ctx.createOscillator();
+    const gain = ctx.createGain();
+    osc.connect(gain);
+    gain.connect(masterGain);
+    osc.frequency.value = freq;
+    osc.type = 'square';
+
+    const noteStart = startTime + i * duration;
+    gain.gain.setValueAtTime(0.6, noteStart);
+    gain.gain.exponentialRampToValueAtTime(0.01, noteStart + duration + 0.1);
+    osc.start(noteStart);
+    osc.stop(noteStart + duration + 0.15);
+  });
+
+  // Final sustained chord
+  const chordNotes = [523.25, 659.25, 783.99]; // C major chord
+  const chordStart = startTime + notes.length * duration;
+  chordNotes.forEach((freq) => {
+    const osc = ctx.createOscillator();
+    const gain = ctx.createGain();
+    osc.connect(gain);
+    gain.connect(masterGain);
+    osc.frequency.value = freq;
+    osc.type = 'triangle';
+    gain.gain.setValueAtTime(0.3, chordStart);
+    gain.gain.exponentialRampToValueAtTime(0.01, chordStart + 0.5);
+    osc.start(chordStart);
+    osc.stop(chordStart + 0.55);
+  });
+}
+
+/**
+ * Fanfare sound - celebratory trumpet-like fanfare
+ */
+function playFanfareSound(ctx, startTime) {
+  const masterGain = ctx.createGain();
+  masterGain.connect(ctx.destination);
+  masterGain.gain.value = 0.2;
+
+  // Fanfare pattern: G4, G4, G4, E4, G4, C5 (classic celebration pattern)
+  const pattern = [
+    { freq: 392.00, duration: 0.1, delay: 0 },      // G4
+    { freq: 392.00, duration: 0.1, delay: 0.12 },   // G4
+    { freq: 392.00, duration: 0.15, delay: 0.24 },  // G4
+    { freq: 329.63, duration: 0.15, delay: 0.42 },  // E4
+    { freq: 392.00, duration: 0.15, delay: 0.6 },   // G4
+    { freq: 523.25, duration: 0.4, delay: 0.78 },   // C5 (long final note)
+  ];
+
+  pattern.forEach(({ freq, duration, delay }) => {
+    const osc = ctx.createOscillator();
+    const gain = ctx.createGain();
+
+    osc.connect(gain);
+    gain.connect(masterGain);
+
+    osc.frequency.value = freq;
+    osc.type = 'sawtooth';
+
+    const noteStart = startTime + delay;
+    gain.gain.setValueAtTime(0.5, noteStart);
+    gain.gain.setValueAtTime(0.5, noteStart + duration * 0.8);
+    gain.gain.exponentialRampToValueAtTime(0.01, noteStart + duration);
+
+    osc.start(noteStart);
+    osc.stop(noteStart + duration + 0.05);
+  });
+}
+
+/**
+ * Chime sound - simple pleasant bell chime
+ */
+function playChimeSound(ctx, startTime) {
+  const masterGain = ctx.createGain();
+  masterGain.connect(ctx.destination);
+  masterGain.gain.value = 0.3;
+
+  // Bell-like sound using multiple harmonics
+  const fundamental = 880; // A5
+  const harmonics = [1, 2, 3, 4.2]; // Slight inharmonicity for bell-like quality
+
+  harmonics.forEach((harmonic, i) => {
+    const osc = ctx.createOscillator();
+    const gain = ctx.createGain();
+
+    osc.connect(gain);
+    gain.connect(masterGain);
+
+    osc.frequency.value = fundamental * harmonic;
+    osc.type = 'sine';
+
+    // Higher harmonics decay faster
+    const amplitude = 0.5 / (i + 1);
+    const decayTime = 0.8 / (i + 1);
+
+    gain.gain.setValueAtTime(amplitude, startTime);
+    gain.gain.exponentialRampToValueAtTime(0.001, startTime + decayTime);
+
+    osc.start(startTime);
+    osc.stop(startTime + decayTime + 0.1);
+  });
+}
+
+/**
+ * Power up sound - ascending sweep with sparkle
+ */
+function playPowerUpSound(ctx, startTime) {
+  const masterGain = ctx.createGain();
+  masterGain.connect(ctx.destination);
+  masterGain.gain.value = 0.25;
+
+  // Ascending sweep
+  const osc1 = ctx.createOscillator();
+  const gain1 = ctx.createGain();
+  osc1.connect(gain1);
+  gain1.connect(masterGain);
+  osc1.type = 'sawtooth';
+  osc1.frequency.setValueAtTime(200, startTime);
+  osc1.frequency.exponentialRampToValueAtTime(1200, startTime + 0.3);
+  gain1.gain.setValueAtTime(0.4, startTime);
+  gain1.gain.exponentialRampToValueAtTime(0.01, startTime + 0.35);
+  osc1.start(startTime);
+  osc1.stop(startTime + 0.4);
+
+  // Sparkle notes at the end
+  const sparkleNotes = [1318.5, 1567.98, 1975.5]; // E6, G6, B6
+  sparkleNotes.forEach((freq, i) => {
+    const osc = ctx.createOscillator();
+    const gain = ctx.createGain();
+    osc.connect(gain);
+    gain.connect(masterGain);
+    osc.frequency.value = freq;
+    osc.type = 'sine';
+
+    const noteStart = startTime + 0.25 + i * 0.05;
+    gain.gain.setValueAtTime(0.3, noteStart);
+    gain.gain.exponentialRampToValueAtTime(0.01, noteStart + 0.2);
+    osc.start(noteStart);
+    osc.stop(noteStart + 0.25);
+  });
+}
+
+/**
+ * Undo sound - sad descending "womp womp" style
+ * Two descending tones that sound disappointed/sad
+ */
+function playUndoSound(ctx, startTime) {
+  const masterGain = ctx.createGain();
+  masterGain.connect(ctx.destination);
+  masterGain.gain.value = 0.25;
+
+  // First "womp" - descending tone
+  const osc1 = ctx.createOscillator();
+  const gain1 = ctx.createGain();
+  osc1.connect(gain1);
+  gain1.connect(masterGain);
+  osc1.type = 'triangle';
+  osc1.frequency.setValueAtTime(311.13, startTime);  // Eb4
+  osc1.frequency.exponentialRampToValueAtTime(233.08, startTime + 0.25);  // Bb3
+  gain1.gain.setValueAtTime(0.6, startTime);
+  gain1.gain.exponentialRampToValueAtTime(0.3, startTime + 0.2);
+  gain1.gain.exponentialRampToValueAtTime(0.01, startTime + 0.3);
+  osc1.start(startTime);
+  osc1.stop(startTime + 0.35);
+
+  // Second "womp" - even lower descending tone (the sad part)
+  const osc2 = ctx.createOscillator();
+  const gain2 = ctx.createGain();
+  osc2.connect(gain2);
+  gain2.connect(masterGain);
+  osc2.type = 'triangle';
+  osc2.frequency.setValueAtTime(233.08, startTime + 0.3);  // Bb3
+  osc2.frequency.exponentialRampToValueAtTime(155.56, startTime + 0.7);  // Eb3
+  gain2.gain.setValueAtTime(0.5, startTime + 0.3);
+  gain2.gain.exponentialRampToValueAtTime(0.25, startTime + 0.55);
+  gain2.gain.exponentialRampToValueAtTime(0.01, startTime + 0.75);
+  osc2.start(startTime + 0.3);
+  osc2.stop(startTime + 0.8);
+
+  // Optional: add a subtle low vibrato for extra sadness
+  const osc3 = ctx.createOscillator();
+  const gain3 = ctx.createGain();
+  osc3.connect(gain3);
+  gain3.connect(masterGain);
+  osc3.type = 'sine';
+  osc3.frequency.setValueAtTime(116.54, startTime + 0.5);  // Bb2 (sub bass)
+  gain3.gain.setValueAtTime(0.15, startTime + 0.5);
+  gain3.gain.exponentialRampToValueAtTime(0.01, startTime + 0.8);
+  osc3.start(startTime + 0.5);
+  osc3.stop(startTime + 0.85);
+}
+
+const SYNTHESIZED_SOUNDS = {
+  coin: { play: playCoinSound, duration: 0.3 },
+  levelup: { play: playLevelUpSound, duration: 1.05 },
+  fanfare: { play: playFanfareSound, duration: 1.25 },
+  chime: { play: playChimeSound, duration: 0.95 },
+  powerup: { play: playPowerUpSound, duration: 0.65 },
+  undo: { play: playUndoSound, duration: 0.9 },
+};
+
+const FART_SOUND_COUNT = 10;
+
+// Every sound name accepted by playSound, matching COMPLETION_SOUND_OPTIONS
+export const SOUND_NAMES = [
+  "none",
+  ...Object.keys(SYNTHESIZED_SOUNDS),
+  ...Array.from({ length: FART_SOUND_COUNT }, (_, i) => `fart${i + 1}`),
+  "fart_random",
+];
+
+// Sound name -> promise of its decoded AudioBuffer, shared by every card.
+// Each sound is fetched or synthesized once per page and replayed from memory.
+const _soundBuffers = new Map();
+
+/**
+ * Render a synthesized sound into an AudioBuffer once, instead of building
+ * its oscillator graph on every play
+ */
+function renderSynthesizedSound({ play, duration }) {
+  const { sampleRate } = getAudioContext();
+  const offline = new (window.OfflineAudioContext || window.webkitOfflineAudioContext)(
+    1,
+    Math.ceil(duration * sampleRate),
+    sampleRate
+  );
+  play(offline, 0);
+  return offline.startRendering();
+}
+
+/**
+ * Fetch and decode an audio file from the www folder
+ * Used for fart sounds (real audio files, not synthesized)
+ * @param {string} filename - The audio file name (e.g., 'fart1.mp3')
+ */
+async function decodeAudioFile(filename) {
+  const response = await fetch(`${SOUND_BASE_URL}${filename}`);
+  if (!response.ok) {
+    throw new Error(`${filename}: HTTP ${response.status}`);
+  }
+  const data = await response.arrayBuffer();
+  // Callback form, since older Safari has no promise-based decodeAudioData
+  return new Promise((resolve, reject) => {
+    getAudioContext().decodeAudioData(data, resolve, reject);
+  });
+}
+
+/**
+ * Get the decoded buffer for a sound, loading it on first use
+ */
+function getSoundBuffer(soundName) {
+  let buffer = _soundBuffers.get(soundName);
+  if (!buffer) {
+    const synthesized = SYNTHESIZED_SOUNDS[soundName];
+    buffer = synthesized
+      ? renderSynthesizedSound(synthesized)
+      : decodeAudioFile(`${soundName}.mp3`);
+    // Forget failures so a later play can retry
+    buffer.catch(() => _soundBuffers.delete(soundName));
+    _soundBuffers.set(soundName, buffer);
+  }
+  return buffer;
+}
+
+function resolveSoundName(soundName) {
+  if (soundName === "fart_random") {
+    // Pick a random fart sound (1-10)
+    return `fart${Math.floor(Math.random() * FART_SOUND_COUNT) + 1}`;
+  }
+  if (!SOUND_NAMES.includes(soundName)) {
+    console.warn(`[Choremander] Unknown sound: ${soundName}, playing coin`);
+    return "coin";
+  }
+  return soundName;
+}
+
+/**
+ * Load and decode sounds ahead of their first play
+ * Call from a user gesture, since that is when the AudioContext may start.
+ * "fart_random" is skipped; each fart is loaded the first time it is picked.
+ * @param {string[]} soundNames - Sounds to load; unknown names are ignored
+ */
+export function preloadSounds(soundNames) {
+  for (const soundName of new Set(soundNames)) {
+    if (soundName !== "none" && soundName !== "fart_random" && SOUND_NAMES.includes(soundName)) {
+      getSoundBuffer(soundName).catch((e) => {
+        console.warn("[Choremander] Error loading sound:", e);
+      });
+    }
+  }
+}
+
+/**
+ * Play a completion sound by name
+ * @param {string} soundName - One of SOUND_NAMES; "none" plays nothing
+ */
+export function playSound(soundName) {
+  if (!soundName || soundName === "none") {
+    return;
+  }
+
+  try {
+    const ctx = getAudioContext();
+    getSoundBuffer(resolveSoundName(soundName))
+      .then((buffer) => {
+        const source = ctx.createBufferSource();
+        source.buffer = buffer;
+        source.connect(ctx.destination);
+        source.start();
+      })
+      .catch((e) => {
+        console.warn("[Choremander] Error playing sound:", e);
+      });
+  } catch (e) {
+    console.warn("[Choremander] Error playing sound:", e);
+  }
+}
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Compare the columnar completion history with a list of dicts.
+
+Builds the same synthetic history both ways and reports the memory each
+holds, the size of the stored payload and the time taken by the filters the
+coordinator runs. Needs no Home Assistant install: the history module only
+depends on models.py.
+
+Usage: python dev/benchmark_history.py [rows]
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+import random
+import sys
+import timeit
+import tracemalloc
+import types
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "choremander"
+
+# Import the history module without running the integration's __init__
+package = types.ModuleType("choremander")
+package.__path__ = [str(PACKAGE_DIR)]
+sys.modules["choremander"] = package
+
+from choremander.history import CompletionHistory  # noqa: E402
+from choremander.models import ChoreCompletion  # noqa: E402
+
+
+def build_completions(count: int) -> list[ChoreCompletion]:
+    """Build a year of completions for 4 children and 30 chores."""
+    rng = random.Random(0)
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    children = [f"child-{index}" for index in range(4)]
+    chores = [f"chore-{index}" for index in range(30)]
+    completions = []
+    for index in range(count):
+        completed_at = now + timedelta(seconds=index * 365 * 86400 // count)
+        approved = rng.random() > 0.05
+        completions.append(
+            ChoreCompletion(
+                chore_id=rng.choice(chores),
+                child_id=rng.choice(children),
+                completed_at=completed_at,
+                approved=approved,
+                approved_at=completed_at if approved else None,
+                points_awarded=rng.randint(1, 20) if approved else 0,
+            )
+        )
+    return completions
+
+
+def measure(build):
+    """Return (result, bytes allocated) for building a structure."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    dicts = [completion.to_dict() for completion in build_completions(count)]
+    raw = json.dumps(dicts)
+
+    rows, dict_bytes = measure(lambda: json.loads(raw))
+    history, history_bytes = measure(lambda: CompletionHistory.from_dicts(rows))
+    columns = json.dumps(history.to_columns())
+
+    start = history.completion_at(count // 2).completed_at
+    end = start + timedelta(days=1)
+    start_iso, end_iso = start.isoformat(), end.isoformat()
+
+    timings = {
+        "by_child": (
+            lambda: [row for row in rows if row["child_id"] == "child-1"],
+            lambda: history.by_child("child-1"),
+        ),
+        "pending": (
+            lambda: [row for row in rows if not row["approved"]],
+            lambda: history.pending(),
+        ),
+        "child pending": (
+            lambda: [
+                row for row in rows if row["child_id"] == "child-1" and not row["approved"]
+            ],
+            lambda: history.pending(history.by_child("child-1")),
+        ),
+        "one day": (
+            lambda: [row for row in rows if start_iso <= row["completed_at"] < end_iso],
+            lambda: history.by_date_range(start, end),
+        ),
+    }
+
+    print(f"{count} completions")
+    print(f"{'':16}{'dicts':>14}{'columnar':>14}{'ratio':>8}")
+    print(
+        f"{'memory':16}{dict_bytes / 1024:>11.0f} KB{history_bytes / 1024:>11.0f} KB"
+        f"{dict_bytes / history_bytes:>7.1f}x"
+    )
+    print(
+        f"{'stored JSON':16}{len(raw) / 1024:>11.0f} KB{len(columns) / 1024:>11.0f} KB"
+        f"{len(raw) / len(columns):>7.1f}x"
+    )
+    for name, (baseline, columnar) in timings.items():
+        runs = 20
+        base = min(timeit.repeat(baseline, number=runs, repeat=3)) / runs
+        fast = min(timeit.repeat(columnar, number=runs, repeat=3)) / runs
+        print(f"{name:16}{base * 1000:>11.2f} ms{fast * 1000:>11.2f} ms{base / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env node
+/**
+ * Build the Choremander cards for release.
+ *
+ * Bundles and minifies each card and the config flow sound preview into
+ * custom_components/choremander/www/dist, with the shared runtime split into
+ * its own chunk. File names carry a content hash so they can be cached
+ * forever, and every file gets precompressed .gz and .br siblings that the
+ * Home Assistant web server sends to clients that accept them.
+ *
+ * dist/manifest.json maps each source file name to its hashed bundle and is
+ * read by frontend.py. Without it the raw sources in www/ are served.
+ *
+ * Usage: npm install && npm run build
+ */
+
+import { build } from "esbuild";
+import { mkdir, readdir, readFile, rm, writeFile } from "node:fs/promises";
+import { basename, dirname, join, relative } from "node:path";
+import { fileURLToPath } from "node:url";
+import { promisify } from "node:util";
+import { brotliCompress, constants, gzip } from "node:zlib";
+
+const ROOT = join(dirname(fileURLToPath(import.meta.url)), "..");
+const WWW = join(ROOT, "custom_components", "choremander", "www");
+const DIST = join(WWW, "dist");
+
+// Keep in sync with CARDS and GLOBAL_MODULES in frontend.py
+const ENTRY_POINTS = [
+  "choremander-child-card.js",
+  "choremander-rewards-card.js",
+  "choremander-approvals-card.js",
+  "choremander-points-card.js",
+  "choremander-reorder-card.js",
+  "choremander-config-sounds.js",
+];
+
+const gzipAsync = promisify(gzip);
+const brotliAsync = promisify(brotliCompress);
+
+async function compress(file) {
+  const data = await readFile(file);
+  const [gz, br] = await Promise.all([
+    gzipAsync(data, { level: 9 }),
+    brotliAsync(data, {
+      params: {
+        [constants.BROTLI_PARAM_MODE]: constants.BROTLI_MODE_TEXT,
+        [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+        [constants.BROTLI_PARAM_SIZE_HINT]: data.length,
+      },
+    }),
+  ]);
+  await Promise.all([writeFile(`${file}.gz`, gz), writeFile(`${file}.br`, br)]);
+  return { raw: data.length, gz: gz.length, br: br.length };
+}
+
+async function main() {
+  await rm(DIST, { recursive: true, force: true });
+  await mkdir(DIST, { recursive: true });
+
+  const result = await build({
+    entryPoints: ENTRY_POINTS.map((entry) => join(WWW, entry)),
+    outdir: DIST,
+    bundle: true,
+    splitting: true,
+    format: "esm",
+    target: "es2020",
+    minify: true,
+    legalComments: "none",
+    entryNames: "[name]-[hash]",
+    chunkNames: "[name]-[hash]",
+    metafile: true,
+  });
+
+  const manifest = {};
+  for (const [output, meta] of Object.entries(result.metafile.outputs)) {
+    if (meta.entryPoint) {
+      manifest[basename(meta.entryPoint)] = basename(output);
+    }
+  }
+  await writeFile(
+    join(DIST, "manifest.json"),
+    `${JSON.stringify(manifest, null, 2)}\n`
+  );
+
+  const files = (await readdir(DIST)).filter((file) => file.endsWith(".js"));
+  for (const file of files.sort()) {
+    const sizes = await compress(join(DIST, file));
+    console.log(
+      `${relative(ROOT, join(DIST, file))}: ${sizes.raw} B, ` +
+        `gzip ${sizes.gz} B, brotli ${sizes.br} B`
+    );
+  }
+}
+
+main().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
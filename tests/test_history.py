@@ -0,0 +1,109 @@
+"""Tests for the columnar completion history."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.choremander.history import CompletionHistory
+from custom_components.choremander.models import ChoreCompletion
+
+NOW = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _completion(
+    completion_id: str,
+    days_ago: int,
+    child_id: str = "alice",
+    chore_id: str = "dishes",
+    approved: bool = True,
+) -> ChoreCompletion:
+    """Build a completion finished some days before NOW."""
+    completed_at = NOW - timedelta(days=days_ago)
+    return ChoreCompletion(
+        chore_id=chore_id,
+        child_id=child_id,
+        completed_at=completed_at,
+        approved=approved,
+        approved_at=completed_at if approved else None,
+        points_awarded=5 if approved else 0,
+        id=completion_id,
+    )
+
+
+def _ids(history: CompletionHistory, rows: list[int]) -> list[str]:
+    """Return the completion IDs of some rows."""
+    return [completion.id for completion in history.completions(rows)]
+
+
+def test_sort_after_importing_older_rows() -> None:
+    """Importing older history re-sorts the rows into one contiguous range."""
+    history = CompletionHistory()
+    history.append(_completion("recent", 1))
+    history.append(_completion("today", 0))
+    for completion in (_completion("old", 30), _completion("older", 60)):
+        history.append(completion)
+
+    history.sort()
+
+    assert history.by_date_range() == [0, 1, 2, 3]
+    assert _ids(history, history.by_date_range()) == ["older", "old", "recent", "today"]
+    rows = history.by_date_range(NOW - timedelta(days=45), NOW - timedelta(hours=12))
+    assert rows == [1, 2]
+    assert _ids(history, rows) == ["old", "recent"]
+    assert history.get("old").completed_at == NOW - timedelta(days=30)
+
+
+def test_from_dicts_sorts_out_of_order_rows() -> None:
+    """Rows saved out of order come back in time order."""
+    items = [_completion("today", 0).to_dict(), _completion("old", 30).to_dict()]
+
+    history = CompletionHistory.from_dicts(items)
+
+    assert _ids(history, history.by_date_range()) == ["old", "today"]
+    assert history.by_date_range(end=NOW - timedelta(days=1)) == [0]
+
+
+def test_columns_round_trip() -> None:
+    """The stored columnar payload restores every row and filter."""
+    history = CompletionHistory()
+    history.append(_completion("a", 3))
+    history.append(_completion("b", 2, child_id="bob", approved=False))
+    history.append(_completion("c", 1, chore_id="laundry"))
+
+    restored = CompletionHistory.from_columns(history.to_columns())
+
+    assert restored.completions() == history.completions()
+    assert _ids(restored, restored.by_child("bob")) == ["b"]
+    assert _ids(restored, restored.by_chore("laundry")) == ["c"]
+    assert _ids(restored, restored.pending()) == ["b"]
+    assert CompletionHistory.from_columns({}).completions() == []
+
+
+def test_filters_chain() -> None:
+    """Filters accept the rows returned by another filter."""
+    history = CompletionHistory()
+    history.append(_completion("a", 3))
+    history.append(_completion("b", 2, approved=False))
+    history.append(_completion("c", 1, child_id="bob", approved=False))
+    history.append(_completion("d", 0, chore_id="laundry", approved=False))
+
+    rows = history.by_child("alice")
+    assert _ids(history, history.pending(rows)) == ["b", "d"]
+    assert _ids(history, history.by_chore("dishes", history.pending(rows))) == ["b"]
+    assert _ids(history, history.by_date_range(NOW - timedelta(days=2), rows=rows)) == [
+        "b",
+        "d",
+    ]
+    assert history.by_child("nobody") == []
+
+
+def test_filters_past_byte_columns() -> None:
+    """Filters keep working once a column holds more than 256 distinct IDs."""
+    history = CompletionHistory()
+    for index in range(300):
+        history.append(_completion(f"row-{index}", 300 - index, chore_id=f"chore-{index}"))
+
+    assert _ids(history, history.by_chore("chore-299")) == ["row-299"]
+    assert _ids(history, history.by_chore("chore-5")) == ["row-5"]
+
+    restored = CompletionHistory.from_columns(history.to_columns())
+    assert _ids(restored, restored.by_chore("chore-299")) == ["row-299"]